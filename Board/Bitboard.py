@@ -0,0 +1,84 @@
+import Miscellaneous.Constants
+from Miscellaneous.Constants import TeamEnum, PieceEnums
+
+
+# Bitboard representation of board occupancy.
+# Every team/piece type pair is held as one 64 bit integer where bit (y * MAXIMUM_X_SQUARES + x) is set when that
+# piece occupies the square, team occupancy is kept alongside so that full board scans reduce to integer operations.
+class Bitboard:
+
+    Teams = (TeamEnum.White, TeamEnum.Black)
+    PieceTypes = (PieceEnums.Pawn, PieceEnums.Rook, PieceEnums.Knight, PieceEnums.Bishop, PieceEnums.Queen,
+                  PieceEnums.King)
+
+    def __init__(self):
+        self.__pieceBoards = {}
+        self.__teamOccupancy = {}
+        self.Clear()
+
+    def Clear(self):
+        for team in Bitboard.Teams:
+            self.__teamOccupancy[team] = 0
+            for pieceType in Bitboard.PieceTypes:
+                self.__pieceBoards[(team, pieceType)] = 0
+
+    def AddPiece(self, team, pieceType, square):
+        key = (team, pieceType)
+        if key not in self.__pieceBoards:
+            # NoTeam/NoPiece are not tracked, empty squares are simply unset bits
+            return
+
+        bit = 1 << square
+        self.__pieceBoards[key] |= bit
+        self.__teamOccupancy[team] |= bit
+
+    def RemovePiece(self, team, pieceType, square):
+        key = (team, pieceType)
+        if key not in self.__pieceBoards:
+            return
+
+        mask = ~(1 << square)
+        self.__pieceBoards[key] &= mask
+        self.__teamOccupancy[team] &= mask
+
+    def GetPieceBoard(self, team, pieceType):
+        return self.__pieceBoards.get((team, pieceType), 0)
+
+    def GetTeamOccupancy(self, team):
+        return self.__teamOccupancy.get(team, 0)
+
+    def GetOccupancy(self):
+        return self.__teamOccupancy[TeamEnum.White] | self.__teamOccupancy[TeamEnum.Black]
+
+    def IsOccupied(self, square):
+        return (self.GetOccupancy() >> square) & 1 == 1
+
+    @staticmethod
+    def GetSquareIndex(xCoord, yCoord):
+        return yCoord * Miscellaneous.Constants.MAXIMUM_X_SQUARES + xCoord
+
+    @staticmethod
+    def GetSquareCoordinates(square):
+        # Returns (x, y)
+        yCoord, xCoord = divmod(square, Miscellaneous.Constants.MAXIMUM_X_SQUARES)
+        return xCoord, yCoord
+
+    # Yields the square index of every set bit, lowest square first (i.e. the same a1, b1 .. h8 order as a row major
+    # scan of the board)
+    @staticmethod
+    def IterateSquares(bitboard):
+        while bitboard:
+            lowestBit = bitboard & -bitboard
+            yield lowestBit.bit_length() - 1
+            bitboard ^= lowestBit
+
+    # Square index of the lowest set bit, None if no bits are set
+    @staticmethod
+    def GetLowestSquare(bitboard):
+        if bitboard == 0:
+            return None
+        return (bitboard & -bitboard).bit_length() - 1
+
+    @staticmethod
+    def PopCount(bitboard):
+        return bin(bitboard).count("1")
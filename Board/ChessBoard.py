@@ -1,8 +1,12 @@
 import logging
+import re
 import Utilities.CoordinateConverters
+import Utilities.MoveHelpers
+import Utilities.AttackTables
+import Board.Zobrist
 import Miscellaneous.Constants
 from Pieces.IBasePiece import IBasePiece
-from Pieces.NoPiece import NoPiece
+from Pieces.NoPiece import EMPTY_SQUARE
 from Pieces.Pawn import Pawn
 from Pieces.Rook import Rook
 from Pieces.Knight import Knight
@@ -11,6 +15,9 @@ from Pieces.Queen import Queen
 from Pieces.King import King
 from Miscellaneous.Constants import TeamEnum, PieceEnums
 from Board.Movement import Movement
+from Board.Bitboard import Bitboard
+from Board.UndoRecord import UndoRecord
+from Board.LegalMoveCache import LegalMoveCache
 from Miscellaneous.BoardPoints import BoardPoints
 from Utilities.BoardHelpers import BoardHelpers
 
@@ -20,17 +27,65 @@ logger = logging.getLogger(__name__)
 
 class ChessBoard:
 
+    # Only rooks on these squares can still be castled with
+    CastlingRookSquaresMask = (1 << Bitboard.GetSquareIndex(0, 0)) | \
+        (1 << Bitboard.GetSquareIndex(Miscellaneous.Constants.MAXIMUM_X_SQUARES - 1, 0)) | \
+        (1 << Bitboard.GetSquareIndex(0, Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1)) | \
+        (1 << Bitboard.GetSquareIndex(Miscellaneous.Constants.MAXIMUM_X_SQUARES - 1,
+                                      Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1))
+
+    # Castling rights lost when a piece moves from or to each corner square, i.e. the corner Rook moves or is captured
+    CastlingRightsLostBySquare = {
+        Bitboard.GetSquareIndex(0, 0): Board.Zobrist.WHITE_QUEEN_SIDE_CASTLE,
+        Bitboard.GetSquareIndex(Miscellaneous.Constants.MAXIMUM_X_SQUARES - 1, 0): Board.Zobrist.WHITE_KING_SIDE_CASTLE,
+        Bitboard.GetSquareIndex(0, Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1): Board.Zobrist.BLACK_QUEEN_SIDE_CASTLE,
+        Bitboard.GetSquareIndex(Miscellaneous.Constants.MAXIMUM_X_SQUARES - 1,
+                                Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1): Board.Zobrist.BLACK_KING_SIDE_CASTLE}
+
+    # Castling rights per team as (king side, queen side)
+    TeamCastlingRights = {TeamEnum.White: (Board.Zobrist.WHITE_KING_SIDE_CASTLE, Board.Zobrist.WHITE_QUEEN_SIDE_CASTLE),
+                          TeamEnum.Black: (Board.Zobrist.BLACK_KING_SIDE_CASTLE, Board.Zobrist.BLACK_QUEEN_SIDE_CASTLE)}
+
+    # Castling bits in the order they appear in a FEN castling field
+    FenCastlingCharacters = ((Board.Zobrist.WHITE_KING_SIDE_CASTLE, "K"), (Board.Zobrist.WHITE_QUEEN_SIDE_CASTLE, "Q"),
+                             (Board.Zobrist.BLACK_KING_SIDE_CASTLE, "k"), (Board.Zobrist.BLACK_QUEEN_SIDE_CASTLE, "q"))
+
+    FenPieces = {'p': Pawn, 'r': Rook, 'n': Knight, 'b': Bishop, 'q': Queen, 'k': King}
+
+    # Kings can only castle from their starting file
+    KingStartingXCoord = 4
+
     def __init__(self, history):
         logger.debug("Entered constructor")
 
         self.__history = history
         self.__teamsTurn = TeamEnum.White
 
-        # Initialise chess board 2D structure
-        self.__board = [None] * Miscellaneous.Constants.MAXIMUM_X_SQUARES
-        for xIndex in range(Miscellaneous.Constants.MAXIMUM_X_SQUARES):
-            # for each y line
-            self.__board[xIndex] = [None] * Miscellaneous.Constants.MAXIMUM_Y_SQUARES
+        # Zobrist key of the pieces and side to move, kept up to date on every square/turn change. Castling rights and
+        # en passant are folded in by GetPositionKey
+        self.__zobristKey = 0
+
+        # Initialise chess board structures, pieces are held per square (indexed as y * MAXIMUM_X_SQUARES + x) and
+        # mirrored in bitboards so that scans over a team or piece type don't need to visit every square
+        self.__board = [EMPTY_SQUARE] * (Miscellaneous.Constants.MAXIMUM_X_SQUARES * Miscellaneous.Constants.MAXIMUM_Y_SQUARES)
+        self.__bitboard = Bitboard()
+
+        # One UndoRecord per MakeMove that has not yet been unmade
+        self.__undoStack = []
+
+        # Castling rights as Zobrist castling bits. Worked out from the pieces whenever the board is set up and then
+        # updated as kings and rooks move or rooks are captured
+        self.__castlingRights = 0
+
+        # Square a pawn passed over on the last move when it moved two squares (the square it can be captured
+        # en passant onto), None otherwise
+        self.__enPassantSquare = None
+
+        # Last FEN generated and the (position key, move count) it was generated for
+        self.__fenCache = None
+
+        # Legal moves and check status per position, keyed by position key so board mutations invalidate implicitly
+        self.__legalMoveCache = LegalMoveCache()
 
         # Set board to initial positions
         self.ResetToDefault()
@@ -40,33 +95,109 @@ class ChessBoard:
 
         if not Utilities.CoordinateConverters.IsPointInRange(pieceCoords):
             logger.error("Not in range, pieceCoords: " + pieceCoords.ToString())
+            return
 
-        self.__board[pieceCoords.GetX()][pieceCoords.GetY()] = piece
+        if piece.GetPieceEnum() == PieceEnums.NoPiece:
+            # Any empty piece is stored as the shared empty square
+            piece = EMPTY_SQUARE
+
+        self.__PlacePieceAtSquare(pieceCoords.GetIndex(), piece)
+        self.__UpdateCastlingRights()
+
+    def ClearSquare(self, coords: BoardPoints):
+        if not Utilities.CoordinateConverters.IsPointInRange(coords):
+            logger.error("Not in range, coords: " + coords.ToString())
+            return
+
+        self.__PlacePieceAtSquare(coords.GetIndex(), EMPTY_SQUARE)
+        self.__UpdateCastlingRights()
+
+    def __PlacePieceAtSquare(self, square, piece: IBasePiece):
+        # Keep the bitboards in step with the square being overwritten
+        previousPiece = self.__board[square]
+        self.__bitboard.RemovePiece(previousPiece.GetTeam(), previousPiece.GetPieceEnum(), square)
+        self.__bitboard.AddPiece(piece.GetTeam(), piece.GetPieceEnum(), square)
+
+        self.__zobristKey ^= Board.Zobrist.GetPieceKey(previousPiece.GetTeam(), previousPiece.GetPieceEnum(), square) ^ \
+            Board.Zobrist.GetPieceKey(piece.GetTeam(), piece.GetPieceEnum(), square)
+
+        self.__board[square] = piece
 
     def GetPieceAtCoordinate(self, pieceCoords:BoardPoints):
         if not Utilities.CoordinateConverters.IsPointInRange(pieceCoords):
             logger.error("Not in range, pieceCoords: " + pieceCoords.ToString())
             return None
 
-        return self.__board[pieceCoords.GetX()][pieceCoords.GetY()]
+        return self.__board[pieceCoords.GetIndex()]
+
+    # Square is the bitboard index, y * MAXIMUM_X_SQUARES + x
+    def GetPieceAtSquare(self, square):
+        return self.__board[square]
+
+    def GetBitboard(self):
+        return self.__bitboard
+
+    # region Legal move cache
+
+    def GetLegalMoveCache(self):
+        return self.__legalMoveCache
+
+    # Legal (fromCoord, toCoord) pairs as a frozenset and whether the team is in check. Served from the cache when the
+    # position has been seen before, so repeated queries against an unchanged board don't regenerate moves
+    def GetCachedLegalMoves(self, team):
+        cacheKey = (self.GetPositionKey(), team)
+        cachedLegalMoves = self.__legalMoveCache.Get(cacheKey)
+        if cachedLegalMoves is None:
+            cachedLegalMoves = (frozenset(Utilities.MoveHelpers.MoveHelpers.GetLegalMovePairsForTeam(self, team)),
+                                BoardHelpers.IsInCheck(self, team))
+            self.__legalMoveCache.Put(cacheKey, cachedLegalMoves)
+        return cachedLegalMoves
+
+    # Whether the piece at fromCoord can legally move to toCoord, worked out for that move alone
+    def IsLegalMove(self, fromCoord: BoardPoints, toCoord: BoardPoints):
+        return Utilities.MoveHelpers.MoveHelpers.IsLegalMove(self, fromCoord, toCoord)
+
+    # endregion
+
+    # region Piece lookups
+
+    # The bitboards double as the per team, per piece type location index so these don't need to scan the board
+
+    # Returns None when the team has no King
+    def GetKingSquare(self, team):
+        return Bitboard.GetLowestSquare(self.__bitboard.GetPieceBoard(team, PieceEnums.King))
+
+    # Returns None when the team has no King
+    def GetKing(self, team):
+        kingSquare = self.GetKingSquare(team)
+        if kingSquare is None:
+            return None
+        return self.__board[kingSquare]
+
+    def GetPieces(self, team, pieceType):
+        return [self.__board[square] for square in
+                Bitboard.IterateSquares(self.__bitboard.GetPieceBoard(team, pieceType))]
+
+    # endregion
 
     def PerformMoveProcessing(self, pieceBeingMoved, fromCoord: BoardPoints, toCoord: BoardPoints):
 
         logger.debug("Entered method")
 
-        move = Movement(pieceBeingMoved.GetTeam(),
-                        pieceBeingMoved.GetPieceEnum(),
-                        self.GetPieceAtCoordinate(toCoord).GetPieceEnum(),
-                        fromCoord,
-                        toCoord,
-                        self.GetLastHistoricalMove())
+        move = Movement.FromEnPassantSquare(pieceBeingMoved.GetTeam(),
+                                            pieceBeingMoved.GetPieceEnum(),
+                                            self.GetPieceAtCoordinate(toCoord).GetPieceEnum(),
+                                            fromCoord,
+                                            toCoord,
+                                            self.GetEnPassantCaptureSquare(pieceBeingMoved.GetTeam()))
 
         # Update history
         self.AppendToHistory(move)
 
         # Update board
-        self.UpdatePieceOnBoard(pieceBeingMoved)
-        self.UpdatePieceOnBoard(NoPiece(fromCoord))
+        self.__RemoveCastlingRightsForMove(pieceBeingMoved, fromCoord.GetIndex(), toCoord.GetIndex())
+        self.__PlacePieceAtSquare(toCoord.GetIndex(), pieceBeingMoved)
+        self.__PlacePieceAtSquare(fromCoord.GetIndex(), EMPTY_SQUARE)
 
         # change team
         logger.error(TeamEnum(self.GetTeamsTurn()).name + " just finished their turn")
@@ -79,10 +210,9 @@ class ChessBoard:
             self.PerformPawnPromotionCheck(pieceBeingMoved)
             if move.IsEnPassantMove():
                 # Piece at new x coordinate and old y coordinate should now be empty as its captured
-                self.UpdatePieceOnBoard(NoPiece(BoardPoints(toCoord.GetX(), fromCoord.GetY())))
-            return
+                self.__PlacePieceAtSquare(BoardPoints(toCoord.GetX(), fromCoord.GetY()).GetIndex(), EMPTY_SQUARE)
 
-        if move.IsCastleMove():
+        elif move.IsCastleMove():
             # It's a castle move so we need to move the corresponding rook as well.
             commonYCoord = fromCoord.GetY()
             isCastleToTheLeft = True if fromCoord.GetX() - toCoord.GetX() > 0 else False
@@ -99,12 +229,151 @@ class ChessBoard:
                                           self.GetPieceAtCoordinate(newRookCoords).GetPieceEnum(),
                                           oldRookCoords,
                                           newRookCoords,
-                                          self.GetLastHistoricalMove()))
+                                          None))
 
             rookBeingMoved.ForceMove(newRookCoords)
-            self.UpdatePieceOnBoard(rookBeingMoved)
-            self.UpdatePieceOnBoard(NoPiece(oldRookCoords))
-            return
+            self.__PlacePieceAtSquare(newRookCoords.GetIndex(), rookBeingMoved)
+            self.__PlacePieceAtSquare(oldRookCoords.GetIndex(), EMPTY_SQUARE)
+
+        # Count the new position towards repetition draws
+        self.__history.AppendPosition(self.GetPositionKey(), move.IsIrreversibleMove())
+
+    # region Make/unmake
+
+    # Applies a move generated by the pieces to the board, including en passant captures, the rook move of a castle and
+    # promotion to a Queen. No validation is performed. Each call pushes an UndoRecord so that UnmakeMove can take the
+    # move back, this is the cheap path used when probing moves (e.g. legality checks)
+    def MakeMove(self, fromCoord: BoardPoints, toCoord: BoardPoints):
+        fromSquare = fromCoord.GetIndex()
+        toSquare = toCoord.GetIndex()
+
+        pieceBeingMoved = self.__board[fromSquare]
+        if pieceBeingMoved.GetTeam() == TeamEnum.NoTeam:
+            logger.error("No piece to move, fromCoord: " + fromCoord.ToString())
+            return False
+
+        pieceAtToCoord = self.__board[toSquare]
+        record = UndoRecord(pieceBeingMoved, fromSquare, toSquare, pieceAtToCoord, self.GetTeamsTurn(),
+                            self.__castlingRights, self.__GetCastlingFlags(), self.__enPassantSquare)
+
+        move = Movement.FromEnPassantSquare(pieceBeingMoved.GetTeam(),
+                                            pieceBeingMoved.GetPieceEnum(),
+                                            pieceAtToCoord.GetPieceEnum(),
+                                            fromCoord,
+                                            toCoord,
+                                            self.GetEnPassantCaptureSquare(pieceBeingMoved.GetTeam()))
+        self.AppendToHistory(move)
+        record.MovementsAppended = 1
+
+        self.__RemoveCastlingRightsForMove(pieceBeingMoved, fromSquare, toSquare)
+        pieceBeingMoved.SetCoordinates(toCoord)
+        self.__PlacePieceAtSquare(toSquare, pieceBeingMoved)
+        self.__PlacePieceAtSquare(fromSquare, EMPTY_SQUARE)
+
+        if move.IsEnPassantMove():
+            # Captured pawn is at the new x coordinate and the old y coordinate
+            enPassantCoord = BoardPoints(toCoord.GetX(), fromCoord.GetY())
+            record.EnPassantSquare = enPassantCoord.GetIndex()
+            record.EnPassantPiece = self.__board[record.EnPassantSquare]
+            self.__PlacePieceAtSquare(record.EnPassantSquare, EMPTY_SQUARE)
+
+        elif pieceBeingMoved.GetPieceEnum() == PieceEnums.Pawn and \
+                (toCoord.GetY() == 0 or toCoord.GetY() == Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1):
+            self.__PlacePieceAtSquare(toSquare, Queen(pieceBeingMoved.GetTeam(), toCoord))
+
+        elif move.IsCastleMove():
+            commonYCoord = fromCoord.GetY()
+            isCastleToTheLeft = fromCoord.GetX() - toCoord.GetX() > 0
+            oldRookCoords = BoardPoints(0 if isCastleToTheLeft else Miscellaneous.Constants.MAXIMUM_X_SQUARES - 1,
+                                        commonYCoord)
+            newRookCoords = BoardPoints(toCoord.GetX() + 1 if isCastleToTheLeft else toCoord.GetX() - 1, commonYCoord)
+
+            oldRookSquare = oldRookCoords.GetIndex()
+            newRookSquare = newRookCoords.GetIndex()
+            rookBeingMoved = self.__board[oldRookSquare]
+            if rookBeingMoved.GetPieceEnum() != PieceEnums.Rook:
+                logger.error("Castle move without a rook at: " + oldRookCoords.ToString())
+            else:
+                record.CastleRook = rookBeingMoved
+                record.CastleRookCoordinates = rookBeingMoved.GetCoordinates()
+                record.CastleRookFromSquare = oldRookSquare
+                record.CastleRookToSquare = newRookSquare
+                record.CastleRookToPiece = self.__board[newRookSquare]
+
+                self.AppendToHistory(Movement(rookBeingMoved.GetTeam(),
+                                              rookBeingMoved.GetPieceEnum(),
+                                              record.CastleRookToPiece.GetPieceEnum(),
+                                              oldRookCoords,
+                                              newRookCoords,
+                                              None))
+                record.MovementsAppended = 2
+
+                rookBeingMoved.SetCoordinates(newRookCoords)
+                self.__PlacePieceAtSquare(newRookSquare, rookBeingMoved)
+                self.__PlacePieceAtSquare(oldRookSquare, EMPTY_SQUARE)
+
+        self.SetTeamsTurn(BoardHelpers.GetOpposingTeam(self.GetTeamsTurn()))
+        self.__history.AppendPosition(self.GetPositionKey(), move.IsIrreversibleMove())
+        self.__undoStack.append(record)
+        return True
+
+    # Takes back the last MakeMove
+    def UnmakeMove(self):
+        if len(self.__undoStack) == 0:
+            logger.error("No move to unmake")
+            return False
+
+        record = self.__undoStack.pop()
+
+        if record.CastleRook is not None:
+            record.CastleRook.RevertLastCoordinates(record.CastleRookCoordinates)
+            self.__PlacePieceAtSquare(record.CastleRookFromSquare, record.CastleRook)
+            self.__PlacePieceAtSquare(record.CastleRookToSquare, record.CastleRookToPiece)
+
+        if record.EnPassantSquare is not None:
+            self.__PlacePieceAtSquare(record.EnPassantSquare, record.EnPassantPiece)
+
+        record.MovedPiece.RevertLastCoordinates(record.MovedPieceCoordinates)
+        self.__PlacePieceAtSquare(record.FromSquare, record.MovedPiece)
+        self.__PlacePieceAtSquare(record.ToSquare, record.ToPiece)
+
+        for _ in range(record.MovementsAppended):
+            self.__history.RemoveLastMovement()
+        self.__history.RemoveLastPosition()
+
+        self.__castlingRights = record.CastlingRights
+        self.__enPassantSquare = record.EnPassantTarget
+        self.__RestoreCastlingFlags(record.CastlingFlags)
+        self.SetTeamsTurn(record.TeamsTurn)
+        return True
+
+    # Castling flags on the kings and rooks are cleared as a side effect of move generation, so they are snapshotted
+    # around a move to stop a probed move from permanently removing castling rights. Once the board has no castling
+    # rights left the flags are never consulted again, so there is nothing to snapshot
+    def __GetCastlingFlags(self):
+        castlingFlags = []
+        if self.__castlingRights == 0:
+            return castlingFlags
+        for team in Bitboard.Teams:
+            for square in Bitboard.IterateSquares(self.__bitboard.GetPieceBoard(team, PieceEnums.King)):
+                king = self.__board[square]
+                castlingFlags.append((king, (king.CanCastleQueenSideInTheFuture, king.CanCastleKingSideInTheFuture)))
+
+            rooks = self.__bitboard.GetPieceBoard(team, PieceEnums.Rook) & ChessBoard.CastlingRookSquaresMask
+            for square in Bitboard.IterateSquares(rooks):
+                rook = self.__board[square]
+                castlingFlags.append((rook, rook.CanCastleInTheFuture()))
+        return castlingFlags
+
+    @staticmethod
+    def __RestoreCastlingFlags(castlingFlags):
+        for piece, flags in castlingFlags:
+            if piece.GetPieceEnum() == PieceEnums.King:
+                piece.CanCastleQueenSideInTheFuture, piece.CanCastleKingSideInTheFuture = flags
+            else:
+                piece.SetCanCastleInTheFuture(flags)
+
+    # endregion
 
     def PerformPawnPromotionCheck(self, pieceBeingMoved):
         isPromotion = False
@@ -121,6 +390,12 @@ class ChessBoard:
     def AppendToHistory(self, movement):
         self.__history.AppendMovement(movement)
 
+        # Only the move straight after a two step pawn move can capture en passant
+        if movement.IsTwoStepPawnMove():
+            self.__enPassantSquare = (movement.GetFromCoord().GetIndex() + movement.GetToCoord().GetIndex()) // 2
+        else:
+            self.__enPassantSquare = None
+
     def GetLastHistoricalMove(self):
         return self.__history.GetLastMove()
 
@@ -130,6 +405,10 @@ class ChessBoard:
     def GetHistory(self):
         return self.__history
 
+    # Number of times the current position has occurred
+    def GetRepetitionCount(self):
+        return self.__history.GetRepetitionCount()
+
     # endregion
 
     def ResetToDefault(self):
@@ -141,14 +420,11 @@ class ChessBoard:
 
         # clear history
         self.__history.Clear()
+        self.__undoStack.clear()
+        self.__enPassantSquare = None
 
         # Set empty pieces first
-
-        yIndexNoPieces = [2, 3, 4, 5]
-
-        for yIndex in yIndexNoPieces:
-            for xIndex in range(Miscellaneous.Constants.MAXIMUM_X_SQUARES):
-                self.UpdatePieceOnBoard(NoPiece(BoardPoints(xIndex, yIndex)))
+        self.RemoveAllPieces()
 
         for xIndex in range(Miscellaneous.Constants.MAXIMUM_X_SQUARES):
             self.UpdatePieceOnBoard(Pawn(TeamEnum.White, BoardPoints(xIndex, Miscellaneous.Constants.WHITE_PAWNS_Y_ARRAY_COORDINATE)))
@@ -182,94 +458,296 @@ class ChessBoard:
         self.UpdatePieceOnBoard(Queen(TeamEnum.Black, BoardPoints(3, 7)))
         self.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(4, 7)))
 
+        # The starting position counts towards repetitions
+        self.__history.AppendPosition(self.GetPositionKey(), True)
+
         logger.debug("End ResetToDefault")
 
     def RemoveAllPieces(self):
-        for yCoord in reversed(range(Miscellaneous.Constants.MAXIMUM_Y_SQUARES)):
-            # cycle over y coordinates
-            for xCoord in range(Miscellaneous.Constants.MAXIMUM_X_SQUARES):
-                self.UpdatePieceOnBoard(NoPiece(BoardPoints(xCoord, yCoord)))
+        self.__undoStack.clear()
+        self.__board[:] = [EMPTY_SQUARE] * len(self.__board)
+        self.__bitboard.Clear()
+        self.__zobristKey = Board.Zobrist.BLACK_TO_MOVE if self.GetTeamsTurn() == TeamEnum.Black else 0
+        self.__castlingRights = 0
+
+    # region FEN loading
+
+    # Sets the board up from a FEN string: piece placement, side to move, castling rights, en passant square and the
+    # clocks. Every field is validated before the board is touched, when the FEN is not valid False is returned and
+    # the board is left as it was. Castling rights are applied to the sticky King/Rook flags and the en passant square is
+    # set on the board, no history is needed for it. The clocks are optional and default to 0.
+    def LoadFen(self, fen: str):
+        fields = fen.split()
+        if len(fields) < 4 or len(fields) > 6:
+            logger.error("Expected 4 to 6 FEN fields, fen: " + fen)
+            return False
+
+        placement = ChessBoard.__ParseFenPlacement(fields[0])
+        if placement is None:
+            logger.error("Invalid FEN piece placement: " + fields[0])
+            return False
+
+        if fields[1] not in ("w", "b"):
+            logger.error("Invalid FEN side to move: " + fields[1])
+            return False
+        teamsTurn = TeamEnum.White if fields[1] == "w" else TeamEnum.Black
+
+        castlingRights = ChessBoard.__ParseFenCastling(fields[2], placement)
+        if castlingRights is None:
+            logger.error("Invalid FEN castling rights: " + fields[2])
+            return False
+
+        enPassantSquare = ChessBoard.__ParseFenEnPassant(fields[3], placement, teamsTurn)
+        if enPassantSquare is False:
+            logger.error("Invalid FEN en passant square: " + fields[3])
+            return False
+
+        # ASCII digits only, isdigit also accepts e.g. superscripts which int can't parse
+        clocks = fields[4:]
+        if not all(re.fullmatch(r"[0-9]+", clock) for clock in clocks):
+            logger.error("Invalid FEN clocks: " + " ".join(clocks))
+            return False
+        halfMoveClock = int(clocks[0]) if len(clocks) > 0 else 0
+        fullMoveCount = int(clocks[1]) if len(clocks) > 1 else 1
+
+        # The game is drawn once the half move clock reaches the limit, so it can never be past it
+        if halfMoveClock > Miscellaneous.Constants.DRAW_CONDITION_TOTAL_MOVES:
+            logger.error("FEN half move clock out of range: " + str(halfMoveClock))
+            return False
+
+        if fullMoveCount == 0:
+            logger.error("FEN full move number starts at 1, fen: " + fen)
+            return False
+
+        # The side that has just moved can't have left its King in check
+        if ChessBoard.__IsInCheckWithPlacement(placement, BoardHelpers.GetOpposingTeam(teamsTurn)):
+            logger.error("Side not to move is in check, fen: " + fen)
+            return False
+
+        # Valid, set the board up
+        self.__history.Clear()
+        self.SetTeamsTurn(teamsTurn)
+        self.RemoveAllPieces()
+        self.__PlaceFenPieces(placement)
+
+        for castlingRight, castleChar in ChessBoard.FenCastlingCharacters:
+            team = TeamEnum.White if castleChar.isupper() else TeamEnum.Black
+            isKingSide = castleChar.lower() == "k"
+            king = self.GetKing(team)
+            if isKingSide:
+                king.CanCastleKingSideInTheFuture = bool(castlingRights & castlingRight)
+            else:
+                king.CanCastleQueenSideInTheFuture = bool(castlingRights & castlingRight)
+
+            rook = self.__board[ChessBoard.GetCastlingRookSquare(team, isKingSide)]
+            if rook.GetPieceEnum() == PieceEnums.Rook and rook.GetTeam() == team:
+                rook.SetCanCastleInTheFuture(bool(castlingRights & castlingRight))
+        self.__UpdateCastlingRights()
+
+        self.__enPassantSquare = enPassantSquare
+
+        # The history counts half turns from 0, black to move is half way through a turn
+        self.__history.SetNumberofTurns(fullMoveCount - 1 + (0.5 if teamsTurn == TeamEnum.Black else 0))
+        self.__history.SetHalfMoveClock(halfMoveClock)
+        self.__history.AppendPosition(self.GetPositionKey(), True)
+        return True
+
+    def __PlaceFenPieces(self, placement):
+        for square, fenCharacter in enumerate(placement):
+            if fenCharacter is None:
+                continue
+            team = TeamEnum.White if fenCharacter.isupper() else TeamEnum.Black
+            self.__PlacePieceAtSquare(square, ChessBoard.FenPieces[fenCharacter.lower()](team,
+                                                                                        BoardPoints.FromIndex(square)))
+
+    # Looks for attackers of the King straight from the parsed placement (one pass to build the occupancy and the
+    # attacking piece masks), so nothing is placed on this board until the FEN is known to be valid
+    @staticmethod
+    def __IsInCheckWithPlacement(placement, team):
+        kingSquare = placement.index("K" if team == TeamEnum.White else "k")
+        isAttackerWhite = team == TeamEnum.Black
+
+        occupancy = 0
+        attackers = dict.fromkeys(ChessBoard.FenPieces, 0)
+        for square, fenCharacter in enumerate(placement):
+            if fenCharacter is None:
+                continue
+            occupancy |= 1 << square
+            if fenCharacter.isupper() == isAttackerWhite:
+                attackers[fenCharacter.lower()] |= 1 << square
+
+        if Utilities.AttackTables.KNIGHT_ATTACKS[kingSquare] & attackers["n"] or \
+                Utilities.AttackTables.KING_ATTACKS[kingSquare] & attackers["k"] or \
+                Utilities.AttackTables.PAWN_ATTACKS[team][kingSquare] & attackers["p"]:
+            return True
+
+        return BoardHelpers.IsAttackedAlongRays(Utilities.AttackTables.ROOK_RAYS[kingSquare], occupancy,
+                                                attackers["r"] | attackers["q"]) or \
+            BoardHelpers.IsAttackedAlongRays(Utilities.AttackTables.BISHOP_RAYS[kingSquare], occupancy,
+                                             attackers["b"] | attackers["q"])
+
+    # Returns the FEN character for every square (None when empty), indexed as y * MAXIMUM_X_SQUARES + x, or None if
+    # the placement is not valid
+    @staticmethod
+    def __ParseFenPlacement(placementField):
+        ranks = placementField.split("/")
+        if len(ranks) != Miscellaneous.Constants.MAXIMUM_Y_SQUARES:
+            return None
 
-    def GetFenRepresentation(self):
+        placement = [None] * (Miscellaneous.Constants.MAXIMUM_X_SQUARES * Miscellaneous.Constants.MAXIMUM_Y_SQUARES)
+        for rankIndex, rank in enumerate(ranks):
+            yCoord = Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1 - rankIndex
+            xCoord = 0
+            previousWasDigit = False
+            for character in rank:
+                if "0" <= character <= "9":
+                    # Consecutive digits (e.g. "44") are not allowed
+                    if previousWasDigit or not 1 <= int(character) <= Miscellaneous.Constants.MAXIMUM_X_SQUARES:
+                        return None
+                    xCoord += int(character)
+                    previousWasDigit = True
+                    continue
+
+                if character.lower() not in ChessBoard.FenPieces or xCoord >= Miscellaneous.Constants.MAXIMUM_X_SQUARES:
+                    return None
+
+                # Pawns can never be on the first or last rank
+                if character.lower() == "p" and (yCoord == 0 or yCoord == Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1):
+                    return None
+
+                placement[Bitboard.GetSquareIndex(xCoord, yCoord)] = character
+                xCoord += 1
+                previousWasDigit = False
+
+            if xCoord != Miscellaneous.Constants.MAXIMUM_X_SQUARES:
+                return None
+
+        # Exactly one King each
+        if placement.count("K") != 1 or placement.count("k") != 1:
+            return None
 
-        fenRepresentation = ""
-        for yCoord in reversed(range(Miscellaneous.Constants.MAXIMUM_Y_SQUARES)):
-            if yCoord != Miscellaneous.Constants.MAXIMUM_Y_SQUARES-1:
-                fenRepresentation += "/"
+        return placement
+
+    # Returns the castling rights as Zobrist castling bits, or None if the field is not valid. Every right needs the
+    # King and that side's Rook on their starting squares.
+    @staticmethod
+    def __ParseFenCastling(castlingField, placement):
+        if castlingField == "-":
+            return 0
+
+        castlingRights = 0
+        for character in castlingField:
+            castlingRight = next((right for right, castleChar in ChessBoard.FenCastlingCharacters
+                                  if castleChar == character), None)
+            if castlingRight is None or castlingRights & castlingRight:
+                return None
+
+            team = TeamEnum.White if character.isupper() else TeamEnum.Black
+            kingSquare = Bitboard.GetSquareIndex(ChessBoard.KingStartingXCoord, ChessBoard.__GetHomeYCoord(team))
+            rookSquare = ChessBoard.GetCastlingRookSquare(team, character.lower() == "k")
+            kingCharacter = "K" if team == TeamEnum.White else "k"
+            rookCharacter = "R" if team == TeamEnum.White else "r"
+            if placement[kingSquare] != kingCharacter or placement[rookSquare] != rookCharacter:
+                return None
+
+            castlingRights |= castlingRight
+
+        return castlingRights
+
+    # Returns the en passant square, None when there is no en passant square or False if the field is not valid
+    @staticmethod
+    def __ParseFenEnPassant(enPassantField, placement, teamsTurn):
+        if enPassantField == "-":
+            return None
 
-            countOfEmptySpaces = 0
-            for xCoord in range(Miscellaneous.Constants.MAXIMUM_X_SQUARES):
-                piece = self.GetPieceAtCoordinate(BoardPoints(xCoord, yCoord))
-                if piece.GetPieceEnum() == PieceEnums.NoPiece:
-                    countOfEmptySpaces += 1
-                    if xCoord == Miscellaneous.Constants.MAXIMUM_X_SQUARES-1:
-                        fenRepresentation += str(countOfEmptySpaces)
-                else:
-                    if countOfEmptySpaces > 0:
-                        fenRepresentation += str(countOfEmptySpaces)
-                        countOfEmptySpaces = 0
-                    fenRepresentation += piece.GetFenRepresentation()
+        if len(enPassantField) != Miscellaneous.Constants.STRING_CHARACTERS_IN_COORDINATE:
+            return False
 
-        fenRepresentation += " "
+        xCoord = Miscellaneous.Constants.ALPHABETICAL_BOARD_ORDINATES.find(enPassantField[0].upper())
+        yCoord = Miscellaneous.Constants.NUMERICAL_BOARD_ORDINATES.find(enPassantField[1])
 
-        teamStr = "w" if self.GetTeamsTurn() == TeamEnum.White else "b"
-        fenRepresentation += teamStr
+        # Target square is behind a pawn of the team that just moved, on the 6th rank with white to move
+        direction = -1 if teamsTurn == TeamEnum.White else 1
+        expectedYCoord = Miscellaneous.Constants.BLACK_PAWNS_Y_ARRAY_COORDINATE - 1 if teamsTurn == TeamEnum.White \
+            else Miscellaneous.Constants.WHITE_PAWNS_Y_ARRAY_COORDINATE + 1
+        if xCoord < 0 or yCoord != expectedYCoord:
+            return False
 
-        fenRepresentation += " "
-        whiteKingArray = BoardHelpers.GetPieceByPieceType(self, PieceEnums.King, TeamEnum.White)
-        if whiteKingArray is None or len(whiteKingArray) == 0:
-            return ""
-        whiteKing = whiteKingArray[0]
+        pawnCharacter = "p" if teamsTurn == TeamEnum.White else "P"
+        if placement[Bitboard.GetSquareIndex(xCoord, yCoord)] is not None or \
+                placement[Bitboard.GetSquareIndex(xCoord, yCoord - direction)] is not None or \
+                placement[Bitboard.GetSquareIndex(xCoord, yCoord + direction)] != pawnCharacter:
+            return False
 
-        blackKingArray = BoardHelpers.GetPieceByPieceType(self, PieceEnums.King, TeamEnum.Black)
-        if blackKingArray is None or len(blackKingArray) == 0:
+        return Bitboard.GetSquareIndex(xCoord, yCoord)
+
+    # endregion
+
+    # FEN of the position, memoised against the position key, en passant file and clocks so repeated requests for an
+    # unchanged board (e.g. printing the board and then sending it to the engine) don't rebuild the string
+    def GetFenRepresentation(self):
+        fenKey = (self.GetPositionKey(), self.__GetEnPassantFile(), self.__history.GetHalfMoveClock(),
+                  self.__history.GetNumberofTurns())
+        if self.__fenCache is not None and self.__fenCache[0] == fenKey:
+            return self.__fenCache[1]
+
+        fenRepresentation = self.__BuildFenRepresentation()
+        self.__fenCache = (fenKey, fenRepresentation)
+        return fenRepresentation
+
+    def __BuildFenRepresentation(self):
+        if self.GetKingSquare(TeamEnum.White) is None or self.GetKingSquare(TeamEnum.Black) is None:
             return ""
-        blackKing = blackKingArray[0]
 
+        # Piece placement, walking the board array a rank at a time from the 8th rank down
+        ranks = []
+        for yCoord in reversed(range(Miscellaneous.Constants.MAXIMUM_Y_SQUARES)):
+            rankStart = yCoord * Miscellaneous.Constants.MAXIMUM_X_SQUARES
+            rank = ""
+            countOfEmptySpaces = 0
+            for piece in self.__board[rankStart:rankStart + Miscellaneous.Constants.MAXIMUM_X_SQUARES]:
+                if piece is EMPTY_SQUARE:
+                    countOfEmptySpaces += 1
+                    continue
+                if countOfEmptySpaces > 0:
+                    rank += str(countOfEmptySpaces)
+                    countOfEmptySpaces = 0
+                rank += piece.GetFenRepresentation()
+            if countOfEmptySpaces > 0:
+                rank += str(countOfEmptySpaces)
+            ranks.append(rank)
+
+        teamStr = "w" if self.GetTeamsTurn() == TeamEnum.White else "b"
+
+        castlingRights = self.GetCastlingRights()
         castleStr = ""
-        if whiteKing.CanPotentiallyKingSideCastleInTheFuture(self):
-            castleStr += "K"
-        if whiteKing.CanPotentiallyQueenSideCastleInTheFuture(self):
-            castleStr += "Q"
-        if blackKing.CanPotentiallyKingSideCastleInTheFuture(self):
-            castleStr += "k"
-        if blackKing.CanPotentiallyQueenSideCastleInTheFuture(self):
-            castleStr += "q"
+        for castlingRight, castleChar in ChessBoard.FenCastlingCharacters:
+            if castlingRights & castlingRight:
+                castleStr += castleChar
 
         if not castleStr:
             castleStr = "-"
 
-        fenRepresentation += castleStr
-        fenRepresentation += " "
-
-        # check if move is two step
-        enPassantStr = ""
-        lastMove = self.GetLastHistoricalMove()
-        if lastMove is not None and lastMove.IsTwoStepPawnMove():
-            yDisplacement = lastMove.GetYMovement()
-            if yDisplacement > 0:
-                directionBehindDoubleStep = -1
-            else:
-                directionBehindDoubleStep = 1
-            point = BoardPoints(lastMove.GetToCoord().GetX(), lastMove.GetToCoord().GetY()+ directionBehindDoubleStep)
+        # the en passant square is the one a pawn moving two squares passed over
+        enPassantStr = "-"
+        if self.__enPassantSquare is not None:
+            point = BoardPoints.FromIndex(self.__enPassantSquare)
             enPassantStr = (str(point.GetXBoard()) + str(point.GetYBoard())).lower()
 
-        if not enPassantStr:
-            enPassantStr = "-"
+        # half move clock (moves since last pawn move or capture)
+        halfMoveClockStr = str(self.__history.GetHalfMoveClock())
 
-        fenRepresentation += enPassantStr
-        fenRepresentation += " "
+        # full move number, counted from 1 where the history counts turns from 0
+        fullMoveStr = str(self.GetHistory().GetNumberofTurns() + 1)
 
-        # half move clock (moves since last pawn move or capture, just set this to 0.
-        fenRepresentation += "0"
-        fenRepresentation += " "
-
-        # number of moves each player has made.
-        fenRepresentation += str(self.GetHistory().GetNumberofTurns())
-        return fenRepresentation
+        return " ".join(("/".join(ranks), teamStr, castleStr, enPassantStr, halfMoveClockStr, fullMoveStr))
 
     def PrintBoard(self):
 
+        # Building the board strings costs more than the move that led here, skip it when nothing would be logged
+        if not logger.isEnabledFor(logging.ERROR):
+            return
+
         # Top reference coordinates
         boardReferenceAlphabeticalDigits = "\t\t"
         for index in range(len(Miscellaneous.Constants.ALPHABETICAL_BOARD_ORDINATES)):
@@ -300,4 +778,126 @@ class ChessBoard:
         return self.__teamsTurn
 
     def SetTeamsTurn(self, teamsTurn):
+        if (self.__teamsTurn == TeamEnum.Black) != (teamsTurn == TeamEnum.Black):
+            self.__zobristKey ^= Board.Zobrist.BLACK_TO_MOVE
         self.__teamsTurn = teamsTurn
+
+    # region Position key
+
+    # 64 bit Zobrist key identifying the position (pieces, side to move, castling rights and en passant file). The en
+    # passant file is only included when a pawn is beside the pawn that moved two squares, otherwise the position is the
+    # same as one with the same placement and no en passant square (which matters for repetitions)
+    def GetPositionKey(self):
+        positionKey = self.__zobristKey ^ Board.Zobrist.CASTLING_KEYS[self.GetCastlingRights()]
+
+        enPassantFile = self.__GetEnPassantFile()
+        if enPassantFile is not None and self.__IsEnPassantCapturePossible(enPassantFile):
+            positionKey ^= Board.Zobrist.EN_PASSANT_KEYS[enPassantFile]
+
+        return positionKey
+
+    # File of the pawn that just moved two squares, None when the last move wasn't a two step pawn move
+    def __GetEnPassantFile(self):
+        if self.__enPassantSquare is None:
+            return None
+        return self.__enPassantSquare % Miscellaneous.Constants.MAXIMUM_X_SQUARES
+
+    def __IsEnPassantCapturePossible(self, enPassantFile):
+        enPassantSquare = self.GetEnPassantCaptureSquare(self.GetTeamsTurn())
+        if enPassantSquare is None:
+            return False
+
+        # The pawn that moved two squares is one rank beyond the square it passed over
+        pawnSquare = enPassantSquare - Miscellaneous.Constants.MAXIMUM_X_SQUARES if self.GetTeamsTurn() == TeamEnum.White \
+            else enPassantSquare + Miscellaneous.Constants.MAXIMUM_X_SQUARES
+        adjacentSquares = 0
+        if enPassantFile > 0:
+            adjacentSquares |= 1 << (pawnSquare - 1)
+        if enPassantFile < Miscellaneous.Constants.MAXIMUM_X_SQUARES - 1:
+            adjacentSquares |= 1 << (pawnSquare + 1)
+        return bool(adjacentSquares & self.__bitboard.GetPieceBoard(self.GetTeamsTurn(), PieceEnums.Pawn))
+
+    # endregion
+
+    # region En passant
+
+    def GetEnPassantSquare(self):
+        return self.__enPassantSquare
+
+    # The en passant square if a pawn of the team passed in could capture onto it, i.e. it is on the 6th rank for white
+    # and the 3rd rank for black, None otherwise
+    def GetEnPassantCaptureSquare(self, team):
+        if self.__enPassantSquare is None:
+            return None
+
+        captureYCoord = Miscellaneous.Constants.BLACK_PAWNS_Y_ARRAY_COORDINATE - 1 if team == TeamEnum.White \
+            else Miscellaneous.Constants.WHITE_PAWNS_Y_ARRAY_COORDINATE + 1
+        if self.__enPassantSquare // Miscellaneous.Constants.MAXIMUM_X_SQUARES != captureYCoord:
+            return None
+        return self.__enPassantSquare
+
+    # endregion
+
+    # region Castling rights
+
+    # Castling rights as Zobrist castling bits
+    def GetCastlingRights(self):
+        return self.__castlingRights
+
+    def HasCastlingRight(self, team, isKingSide):
+        teamCastlingRights = ChessBoard.TeamCastlingRights.get(team)
+        if teamCastlingRights is None:
+            return False
+        return bool(self.__castlingRights & teamCastlingRights[0 if isKingSide else 1])
+
+    # The Rook on the corner square a team castles with on that side, None if there isn't one
+    def GetCastlingRook(self, team, isKingSide):
+        rook = self.__board[ChessBoard.GetCastlingRookSquare(team, isKingSide)]
+        if rook.GetPieceEnum() != PieceEnums.Rook or rook.GetTeam() != team:
+            return None
+        return rook
+
+    @staticmethod
+    def GetCastlingRookSquare(team, isKingSide):
+        xCoord = Miscellaneous.Constants.MAXIMUM_X_SQUARES - 1 if isKingSide else 0
+        return Bitboard.GetSquareIndex(xCoord, ChessBoard.__GetHomeYCoord(team))
+
+    @staticmethod
+    def __GetHomeYCoord(team):
+        return 0 if team == TeamEnum.White else Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1
+
+    # Moving the King loses both of that team's rights, moving a Rook from its corner or capturing it there loses the
+    # right for that side
+    def __RemoveCastlingRightsForMove(self, pieceBeingMoved, fromSquare, toSquare):
+        if self.__castlingRights == 0:
+            return
+
+        if pieceBeingMoved.GetPieceEnum() == PieceEnums.King:
+            kingSideRight, queenSideRight = ChessBoard.TeamCastlingRights[pieceBeingMoved.GetTeam()]
+            self.__castlingRights &= ~(kingSideRight | queenSideRight)
+
+        self.__castlingRights &= ~(ChessBoard.CastlingRightsLostBySquare.get(fromSquare, 0) |
+                                   ChessBoard.CastlingRightsLostBySquare.get(toSquare, 0))
+
+    # Works the rights out from scratch, used when pieces are placed directly rather than moved. A right remains while
+    # the King and that side's corner Rook have not moved and their castling flags allow it
+    def __UpdateCastlingRights(self):
+        castlingRights = 0
+        for team, (kingSideRight, queenSideRight) in ChessBoard.TeamCastlingRights.items():
+            king = self.GetKing(team)
+            if king is None or king.HasMoved():
+                continue
+
+            if king.CanCastleKingSideInTheFuture and self.__IsUnmovedRook(team, True):
+                castlingRights |= kingSideRight
+
+            if king.CanCastleQueenSideInTheFuture and self.__IsUnmovedRook(team, False):
+                castlingRights |= queenSideRight
+
+        self.__castlingRights = castlingRights
+
+    def __IsUnmovedRook(self, team, isKingSide):
+        rook = self.GetCastlingRook(team, isKingSide)
+        return rook is not None and rook.CanCastleInTheFuture() and not rook.HasMoved()
+
+    # endregion
@@ -1,35 +1,77 @@
 import logging
 import math
+import struct
+import sys
+from array import array
 from Board.Movement import Movement
+from Miscellaneous.Constants import TeamEnum, PieceEnums
 
 
 logger = logging.getLogger(__name__)
 
 
+# Moves are held packed (see Movement) in flat arrays, the 16 bit move alongside the team and piece that moved and the
+# piece at the destination, so a long game costs a few bytes a move rather than an object per move. Movement views are
+# built when asked for.
 class History:
 
+    # Moved piece byte, team in the high nibble and piece in the low nibble
+    TeamShift = 4
+    PieceMask = 0xF
+
+    Teams = {team.value: team for team in TeamEnum}
+    Pieces = {piece.value: piece for piece in PieceEnums}
+
+    # Header of ToBytes, the number of moves
+    ByteHeader = struct.Struct("<I")
+
     def __init__(self):
-        self.__historicalMoves = []
+        self.__packedMoves = array('H')
+        self.__movedPieces = array('B')
+        self.__capturedPieces = array('B')
         self.__turns = 0
 
-    def __eq__(self, other):
-        firstHistMoves = self.GetHistoricalMoves()
-        otherHistMoves = other.GetHistoricalMoves()
-        if len(firstHistMoves) != len(otherHistMoves):
-            return False
+        # View of the last move, it is read far more often than the others
+        self.__lastMove = None
 
-        for index in range(len(firstHistMoves)):
-            if firstHistMoves[index] != otherHistMoves[index]:
-                return False
+        # Moves since the last pawn move or capture, with the value before every appended move so it can be restored
+        self.__halfMoveClock = 0
+        self.__previousHalfMoveClocks = array('H')
 
-        return True
+        # Key of the position after every move (and the starting position), with whether the move into it was
+        # irreversible. Occurrences are only counted back to the last irreversible move (a pawn move or capture) as no
+        # earlier position can recur, the counts of earlier windows are stacked so taking a move back restores them
+        self.__positionKeys = array('Q')
+        self.__irreversiblePositions = array('B')
+        self.__positionCounts = {}
+        self.__previousPositionCounts = []
+
+    def __eq__(self, other):
+        return self.__packedMoves == other.__packedMoves and \
+            self.__movedPieces == other.__movedPieces and \
+            self.__capturedPieces == other.__capturedPieces
+
+    def __len__(self):
+        return len(self.__packedMoves)
 
     def Clear(self):
-        self.__historicalMoves.clear()
+        del self.__packedMoves[:]
+        del self.__movedPieces[:]
+        del self.__capturedPieces[:]
         self.__turns = 0
+        self.__lastMove = None
+        self.__halfMoveClock = 0
+        del self.__previousHalfMoveClocks[:]
+        del self.__positionKeys[:]
+        del self.__irreversiblePositions[:]
+        self.__positionCounts = {}
+        self.__previousPositionCounts.clear()
 
     def AppendMovement(self, move: Movement):
-        self.__historicalMoves.append(move)
+        self.__packedMoves.append(move.GetPackedMove())
+        self.__movedPieces.append((move.GetTeamMoved().value << History.TeamShift) | move.GetPieceEnumFrom().value)
+        self.__capturedPieces.append(move.GetPieceEnumTo().value)
+        self.__lastMove = move
 
         # There are two moves for a castle, the first is a king move (can only be done in a castle),
         # The second is the rook move (not classified as a castle move per se). Since it's the same team we only increase
@@ -37,13 +79,75 @@ class History:
         if not move.IsCastleMove():
             self.__turns += 0.5
 
+        # The King and Rook moves of a castle are a single move so only the Rook move is counted
+        self.__previousHalfMoveClocks.append(self.__halfMoveClock)
+        if move.IsIrreversibleMove():
+            self.__halfMoveClock = 0
+        elif not move.IsCastleMove():
+            self.__halfMoveClock += 1
+
+    # Inverse of AppendMovement
+    def RemoveLastMovement(self):
+        if len(self.__packedMoves) == 0:
+            return None
+
+        move = self.__lastMove
+        self.__packedMoves.pop()
+        self.__movedPieces.pop()
+        self.__capturedPieces.pop()
+        self.__lastMove = self.__GetMovement(len(self.__packedMoves) - 1) if len(self.__packedMoves) != 0 else None
+
+        if not move.IsCastleMove():
+            self.__turns -= 0.5
+        self.__halfMoveClock = self.__previousHalfMoveClocks.pop()
+        return move
+
+    def __GetMovement(self, index):
+        movedPiece = self.__movedPieces[index]
+        return Movement.FromPackedMove(self.__packedMoves[index],
+                                       History.Teams[movedPiece >> History.TeamShift],
+                                       History.Pieces[movedPiece & History.PieceMask],
+                                       History.Pieces[self.__capturedPieces[index]])
+
+    # Movement views of every move, built on each call
     def GetHistoricalMoves(self):
-        return self.__historicalMoves
+        return [self.__GetMovement(index) for index in range(len(self.__packedMoves))]
 
     def GetLastMove(self):
-        if len(self.__historicalMoves) != 0:
-            return self.__historicalMoves[-1]
-        return None
+        return self.__lastMove
+
+    # The packed 16 bit moves, see Movement
+    def GetPackedMoves(self):
+        return self.__packedMoves
+
+    # Moves as little endian bytes for archiving, the move count followed by the packed moves, the moved pieces and the
+    # captured pieces
+    def ToBytes(self):
+        packedMoves = array('H', self.__packedMoves)
+        if sys.byteorder != "little":
+            packedMoves.byteswap()
+        return History.ByteHeader.pack(len(packedMoves)) + packedMoves.tobytes() + self.__movedPieces.tobytes() + \
+            self.__capturedPieces.tobytes()
+
+    # Inverse of ToBytes, the moves are replayed so turns and the half move clock are rebuilt. Positions aren't recorded
+    # as there is no board to key them from
+    @staticmethod
+    def FromBytes(data):
+        moveCount, = History.ByteHeader.unpack_from(data)
+        offset = History.ByteHeader.size
+
+        archived = History()
+        archived.__packedMoves.frombytes(data[offset:offset + 2 * moveCount])
+        if sys.byteorder != "little":
+            archived.__packedMoves.byteswap()
+        offset += 2 * moveCount
+        archived.__movedPieces.frombytes(data[offset:offset + moveCount])
+        archived.__capturedPieces.frombytes(data[offset + moveCount:offset + 2 * moveCount])
+
+        history = History()
+        for index in range(moveCount):
+            history.AppendMovement(archived.__GetMovement(index))
+        return history
 
     def PrintHistory(self):
         for historicalMove in self.GetHistoricalMoves():
@@ -51,3 +155,53 @@ class History:
 
     def GetNumberofTurns(self):
         return math.floor(self.__turns)
+
+    # Turns are counted in halves, one per move, e.g. when setting up a position part way through a game
+    def SetNumberofTurns(self, turns):
+        self.__turns = turns
+
+    def GetHalfMoveClock(self):
+        return self.__halfMoveClock
+
+    # e.g. when setting up a position part way through a game
+    def SetHalfMoveClock(self, halfMoveClock):
+        self.__halfMoveClock = halfMoveClock
+
+    # region Repetition
+
+    # Returns how many times the position has now occurred
+    def AppendPosition(self, positionKey, isIrreversible):
+        if isIrreversible:
+            self.__previousPositionCounts.append(self.__positionCounts)
+            self.__positionCounts = {}
+
+        self.__positionKeys.append(positionKey)
+        self.__irreversiblePositions.append(isIrreversible)
+        repetitionCount = self.__positionCounts.get(positionKey, 0) + 1
+        self.__positionCounts[positionKey] = repetitionCount
+        return repetitionCount
+
+    # Inverse of AppendPosition
+    def RemoveLastPosition(self):
+        if len(self.__positionKeys) == 0:
+            return None
+
+        positionKey = self.__positionKeys.pop()
+        isIrreversible = self.__irreversiblePositions.pop()
+        repetitionCount = self.__positionCounts[positionKey] - 1
+        if repetitionCount == 0:
+            del self.__positionCounts[positionKey]
+        else:
+            self.__positionCounts[positionKey] = repetitionCount
+
+        if isIrreversible:
+            self.__positionCounts = self.__previousPositionCounts.pop()
+        return positionKey
+
+    # Number of times the current (last appended) position has occurred
+    def GetRepetitionCount(self):
+        if len(self.__positionKeys) == 0:
+            return 0
+        return self.__positionCounts[self.__positionKeys[-1]]
+
+    # endregion
@@ -0,0 +1,50 @@
+from collections import OrderedDict
+
+
+# Bounded least recently used cache of per position move generation results, keyed by (position key, team).
+# The position key changes with every board mutation so entries never need invalidating, a mutated board simply looks
+# up a different key. Hit/miss counts are kept so the size can be tuned.
+class LegalMoveCache:
+
+    DefaultMaximumSize = 1024
+
+    def __init__(self, maximumSize=DefaultMaximumSize):
+        self.__maximumSize = maximumSize
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+    # Returns None when the key is not cached
+    def Get(self, key):
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.__misses += 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.__hits += 1
+        return entry
+
+    def Put(self, key, entry):
+        self.__entries[key] = entry
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__maximumSize:
+            # Evict the least recently used entry
+            self.__entries.popitem(last=False)
+
+    def Clear(self):
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+    def GetMaximumSize(self):
+        return self.__maximumSize
+
+    def GetHits(self):
+        return self.__hits
+
+    def GetMisses(self):
+        return self.__misses
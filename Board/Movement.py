@@ -1,52 +1,118 @@
+import Miscellaneous.Constants
+import Utilities.AttackTables
 from Miscellaneous.BoardPoints import BoardPoints
 from Miscellaneous.Constants import PieceEnums
 from Utilities.MoveHelpers import MoveHelpers
 
 
+# A move packed into 16 bits: from square (bits 0-5), to square (bits 6-11) and a 4 bit flag (bits 12-15). Squares are
+# bitboard indices. The flag is 0 for a quiet move, 1 two step pawn move, 2 king side castle, 3 queen side castle,
+# 4 capture, 5 en passant capture, 8-11 promotion to a knight/bishop/rook/queen and 12-15 the same promotions with a
+# capture. The team and pieces are held alongside, History stores all three in flat arrays and hands out Movement views.
 class Movement:
 
+    QuietFlag = 0
+    TwoStepPawnFlag = 1
+    KingSideCastleFlag = 2
+    QueenSideCastleFlag = 3
+    CaptureFlag = 4
+    EnPassantFlag = 5
+    PromotionFlag = 8
+
+    # Pawns are always promoted to a Queen
+    QueenPromotionFlag = PromotionFlag | 3
+
+    __slots__ = ("__packedMove", "__teamMoved", "__pieceEnumFromCoord", "__pieceEnumToCoord")
+
     def __init__(self, teamMoving, pieceAtFromCoord, pieceAtToCoord, fromCoord: BoardPoints, toCoord: BoardPoints, lastMove):
+        isEnPassantMove = lastMove is not None and \
+            MoveHelpers.IsEnPassantMove(pieceAtFromCoord, fromCoord, toCoord, lastMove)
+
+        self.__packedMove = Movement.PackMove(fromCoord.GetIndex(), toCoord.GetIndex(),
+                                              Movement.__GetMoveFlag(pieceAtFromCoord, pieceAtToCoord, fromCoord,
+                                                                     toCoord, isEnPassantMove))
+        self.__teamMoved = teamMoving
         self.__pieceEnumFromCoord = pieceAtFromCoord
         self.__pieceEnumToCoord = pieceAtToCoord
-        self.__teamMoved = teamMoving
-        self.__fromCoord = fromCoord
-        self.__toCoord = toCoord
 
-        self.__isCaptureMove = True if self.__pieceEnumToCoord != PieceEnums.NoPiece else False
-        self.__isEnPassantMove = True if lastMove is not None and MoveHelpers.IsEnPassantMove(pieceAtFromCoord, fromCoord, toCoord, lastMove) else False
-        if self.__isEnPassantMove:
-            self.__isCaptureMove = True
-
-        self.__isCastleMove = MoveHelpers.IsCastleMove(pieceAtFromCoord, fromCoord, toCoord)
-        self.__isTwoStepPawnMove = MoveHelpers.IsTwoStepPawnMove(pieceAtFromCoord, fromCoord, toCoord)
+    # Builds the move with en passant worked out from the square a pawn can capture en passant onto (see
+    # ChessBoard.GetEnPassantCaptureSquare) rather than from the last move
+    @staticmethod
+    def FromEnPassantSquare(teamMoving, pieceAtFromCoord, pieceAtToCoord, fromCoord: BoardPoints, toCoord: BoardPoints,
+                            enPassantSquare):
+        isEnPassantMove = pieceAtFromCoord == PieceEnums.Pawn and fromCoord.GetX() != toCoord.GetX() and \
+            toCoord.GetIndex() == enPassantSquare
+
+        packedMove = Movement.PackMove(fromCoord.GetIndex(), toCoord.GetIndex(),
+                                       Movement.__GetMoveFlag(pieceAtFromCoord, pieceAtToCoord, fromCoord, toCoord,
+                                                              isEnPassantMove))
+        return Movement.FromPackedMove(packedMove, teamMoving, pieceAtFromCoord, pieceAtToCoord)
+
+    @staticmethod
+    def __GetMoveFlag(pieceAtFromCoord, pieceAtToCoord, fromCoord: BoardPoints, toCoord: BoardPoints, isEnPassantMove):
+        if MoveHelpers.IsCastleMove(pieceAtFromCoord, fromCoord, toCoord):
+            return Movement.KingSideCastleFlag if toCoord.GetX() > fromCoord.GetX() else Movement.QueenSideCastleFlag
+        if isEnPassantMove:
+            return Movement.EnPassantFlag
+        if MoveHelpers.IsTwoStepPawnMove(pieceAtFromCoord, fromCoord, toCoord):
+            return Movement.TwoStepPawnFlag
+
+        flag = Movement.CaptureFlag if pieceAtToCoord != PieceEnums.NoPiece else Movement.QuietFlag
+        if pieceAtFromCoord == PieceEnums.Pawn and \
+                (toCoord.GetY() == 0 or toCoord.GetY() == Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1):
+            flag |= Movement.QueenPromotionFlag
+        return flag
+
+    # Builds the view of an already packed move
+    @staticmethod
+    def FromPackedMove(packedMove, teamMoving, pieceAtFromCoord, pieceAtToCoord):
+        move = Movement.__new__(Movement)
+        move.__packedMove = packedMove
+        move.__teamMoved = teamMoving
+        move.__pieceEnumFromCoord = pieceAtFromCoord
+        move.__pieceEnumToCoord = pieceAtToCoord
+        return move
+
+    @staticmethod
+    def PackMove(fromSquare, toSquare, flag):
+        return fromSquare | (toSquare << 6) | (flag << 12)
 
     def __eq__(self, other):
-        return self.__pieceEnumFromCoord == other.__pieceEnumFromCoord and \
-               self.__pieceEnumToCoord == other.__pieceEnumToCoord and \
-               self.__fromCoord == other.__fromCoord and \
-               self.__toCoord == other.__toCoord and \
+        return self.__packedMove == other.__packedMove and \
                self.__teamMoved == other.__teamMoved and \
-               self.__isCaptureMove == other.__isCaptureMove and \
-               self.__isCastleMove == other.__isCastleMove and \
-               self.__isEnPassantMove == other.__isEnPassantMove and \
-               self.__isTwoStepPawnMove == other.__isTwoStepPawnMove
+               self.__pieceEnumFromCoord == other.__pieceEnumFromCoord and \
+               self.__pieceEnumToCoord == other.__pieceEnumToCoord
 
     def ToString(self):
         return str(self.GetTeamMoved()) + " " + PieceEnums(self.GetPieceEnumFrom()).name + " at [" + \
                self.GetFromCoord().ToString() + "] moved to [" + self.GetToCoord().ToString() + "] (" + \
                PieceEnums(self.GetPieceEnumTo()).name + ")" + ", IsCaptureMove: " + str(self.IsCaptureMove())
 
+    def GetPackedMove(self):
+        return self.__packedMove
+
+    def GetFlag(self):
+        return self.__packedMove >> 12
+
     def IsTwoStepPawnMove(self):
-        return self.__isTwoStepPawnMove
+        return self.GetFlag() == Movement.TwoStepPawnFlag
 
     def IsCaptureMove(self):
-        return self.__isCaptureMove
+        return bool(self.GetFlag() & Movement.CaptureFlag)
 
     def IsEnPassantMove(self):
-        return self.__isEnPassantMove
+        return self.GetFlag() == Movement.EnPassantFlag
 
     def IsCastleMove(self):
-        return self.__isCastleMove
+        flag = self.GetFlag()
+        return flag == Movement.KingSideCastleFlag or flag == Movement.QueenSideCastleFlag
+
+    def IsPromotionMove(self):
+        return bool(self.GetFlag() & Movement.PromotionFlag)
+
+    # Pawn moves and captures can't be taken back over the board, no position before one can occur again
+    def IsIrreversibleMove(self):
+        return self.IsCaptureMove() or self.__pieceEnumFromCoord == PieceEnums.Pawn
 
     def GetPieceEnumFrom(self):
         return self.__pieceEnumFromCoord
@@ -55,13 +121,13 @@ class Movement:
         return self.__pieceEnumToCoord
 
     def GetFromCoord(self):
-        return self.__fromCoord
+        return Utilities.AttackTables.SQUARE_POINTS[self.__packedMove & 0x3F]
 
     def GetTeamMoved(self):
         return self.__teamMoved
 
     def GetToCoord(self):
-        return self.__toCoord
+        return Utilities.AttackTables.SQUARE_POINTS[(self.__packedMove >> 6) & 0x3F]
 
     def GetYMovement(self):
         return self.GetToCoord().GetY() - self.GetFromCoord().GetY()
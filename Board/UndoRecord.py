@@ -0,0 +1,36 @@
+# Everything ChessBoard.UnmakeMove needs to put the board back exactly as it was before the matching MakeMove.
+# Squares are bitboard indices, the pieces held are the original objects that were displaced so restoring them is a
+# handful of assignments rather than a board rebuild.
+class UndoRecord:
+
+    __slots__ = ("MovedPiece", "MovedPieceCoordinates", "FromSquare", "ToSquare", "ToPiece",
+                 "EnPassantSquare", "EnPassantPiece",
+                 "CastleRook", "CastleRookCoordinates", "CastleRookFromSquare", "CastleRookToSquare", "CastleRookToPiece",
+                 "TeamsTurn", "CastlingRights", "CastlingFlags", "EnPassantTarget", "MovementsAppended")
+
+    def __init__(self, movedPiece, fromSquare, toSquare, toPiece, teamsTurn, castlingRights, castlingFlags,
+                 enPassantTarget):
+        self.MovedPiece = movedPiece
+        self.MovedPieceCoordinates = movedPiece.GetCoordinates()
+        self.FromSquare = fromSquare
+        self.ToSquare = toSquare
+        self.ToPiece = toPiece
+
+        # Only set for en passant captures, where the captured pawn is not on the destination square
+        self.EnPassantSquare = None
+        self.EnPassantPiece = None
+
+        # Only set for castle moves
+        self.CastleRook = None
+        self.CastleRookCoordinates = None
+        self.CastleRookFromSquare = None
+        self.CastleRookToSquare = None
+        self.CastleRookToPiece = None
+
+        self.TeamsTurn = teamsTurn
+        self.CastlingRights = castlingRights
+
+        # Board's en passant square before the move, not to be confused with the square of a pawn captured en passant
+        self.EnPassantTarget = enPassantTarget
+        self.CastlingFlags = castlingFlags
+        self.MovementsAppended = 0
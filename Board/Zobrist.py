@@ -0,0 +1,40 @@
+import random
+import Miscellaneous.Constants
+from Miscellaneous.Constants import TeamEnum, PieceEnums
+
+
+# Random 64 bit keys for Zobrist hashing. A position's key is the XOR of the key of every piece on its square, the side
+# to move, the castling rights and the en passant file, so a move only has to XOR the keys of what it changed.
+# A fixed seed keeps keys (and so position keys) identical between runs and processes.
+
+SQUARE_COUNT = Miscellaneous.Constants.MAXIMUM_X_SQUARES * Miscellaneous.Constants.MAXIMUM_Y_SQUARES
+
+# Castling rights bits, as indexes into CASTLING_KEYS
+WHITE_KING_SIDE_CASTLE = 1
+WHITE_QUEEN_SIDE_CASTLE = 2
+BLACK_KING_SIDE_CASTLE = 4
+BLACK_QUEEN_SIDE_CASTLE = 8
+
+_random = random.Random(20190316)
+
+# Indexed [(team, pieceType)][square]
+PIECE_KEYS = {(team, pieceType): tuple(_random.getrandbits(64) for _ in range(SQUARE_COUNT))
+              for team in (TeamEnum.White, TeamEnum.Black)
+              for pieceType in (PieceEnums.Pawn, PieceEnums.Rook, PieceEnums.Knight, PieceEnums.Bishop,
+                                PieceEnums.Queen, PieceEnums.King)}
+
+BLACK_TO_MOVE = _random.getrandbits(64)
+
+# Indexed by the 4 bit castling rights, 0 (no rights) hashes to nothing
+CASTLING_KEYS = (0,) + tuple(_random.getrandbits(64) for _ in range(15))
+
+# Indexed by the x coordinate of the pawn that has just moved two squares
+EN_PASSANT_KEYS = tuple(_random.getrandbits(64) for _ in range(Miscellaneous.Constants.MAXIMUM_X_SQUARES))
+
+
+def GetPieceKey(team, pieceType, square):
+    pieceKeys = PIECE_KEYS.get((team, pieceType))
+    if pieceKeys is None:
+        # Empty squares don't contribute to the key
+        return 0
+    return pieceKeys[square]
@@ -1,7 +1,7 @@
 import logging
 import Utilities.CoordinateConverters
 import Utilities.MoveHelpers
-from Utilities.BoardHelpers import BoardHelpers
+from Utilities.PositionStatus import PositionStatus
 from Pieces.IBasePiece import IBasePiece
 from Miscellaneous.Constants import TeamEnum
 from Miscellaneous.BoardPoints import BoardPoints
@@ -25,12 +25,16 @@ class Game:
         self.__isDraw = False
         self.__isInCheck = False
 
+        # Status of the position after the last successful move, None before the first move
+        self.__positionStatus = None
+
     def ResetGame(self):
         self.GetBoard().ResetToDefault()
         self.SetHasGameEnded(False)
         self.SetIsInCheckmate(False)
         self.SetIsDraw(False)
         self.SetIsInCheck(False)
+        self.SetPositionStatus(None)
 
     # region Board interfaces
 
@@ -52,6 +56,15 @@ class Game:
     def GetFenRepresentation(self):
         return self.GetBoard().GetFenRepresentation()
 
+    # Resumes a game from a FEN, the game play flags are worked out for the loaded position
+    def LoadFen(self, fen: str):
+        if not self.GetBoard().LoadFen(fen):
+            return False
+
+        self.SetHasGameEnded(False)
+        self.UpdatePositionStatus()
+        return True
+
     def GetBoard(self):
         return self.__board
 
@@ -120,17 +133,30 @@ class Game:
 
         self.GetBoard().PerformMoveProcessing(pieceBeingMoved, fromCoords, toCoords)
 
-        isInCheckMate = BoardHelpers.IsInCheckMate(self.GetBoard(), self.GetTeamsTurn())
-        self.SetIsInCheckmate(isInCheckMate)
-        if not isInCheckMate:
-            isDraw = BoardHelpers.IsDraw(self.GetBoard(), self.GetTeamsTurn())
-            self.SetIsDraw(isDraw)
-            if not isDraw:
-                self.SetIsInCheck(BoardHelpers.IsInCheck(self.GetBoard(), self.GetTeamsTurn()))
+        self.UpdatePositionStatus()
 
         self.PrintProperties()
         return Result(hasMoved, MoveEnum.Success)
 
+    # The player to move claims a draw, only allowed once the position has occurred three times
+    def ClaimDraw(self):
+        positionStatus = self.GetPositionStatus()
+        if self.GetHasGameEnded() or positionStatus is None or not positionStatus.CanClaimDrawByRepetition:
+            logger.error("Draw can't be claimed")
+            return False
+
+        self.SetIsDraw(True)
+        self.SetIsInCheck(False)
+        return True
+
+    # Checkmate, draw and check are all answered from a single evaluation of the position
+    def UpdatePositionStatus(self):
+        positionStatus = PositionStatus.ForTeam(self.GetBoard(), self.GetTeamsTurn())
+        self.SetPositionStatus(positionStatus)
+        self.SetIsInCheckmate(positionStatus.IsCheckmate)
+        self.SetIsDraw(positionStatus.IsDraw())
+        self.SetIsInCheck(positionStatus.IsInCheck())
+
     def PrintProperties(self):
         logger.info("Printing board")
         self.GetBoard().PrintBoard()
@@ -171,4 +197,10 @@ class Game:
     def GetIsInCheck(self):
         return self.__isInCheck
 
+    def SetPositionStatus(self, positionStatus):
+        self.__positionStatus = positionStatus
+
+    def GetPositionStatus(self):
+        return self.__positionStatus
+
     # endregion
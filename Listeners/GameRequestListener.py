@@ -93,19 +93,34 @@ class GameRequestListener:
                 logger.error("Invalid move by AI, this should only happen due to timing effects when reset is hit")
             return
 
-        # Post move processing
+        # Post move processing, the game evaluated the new position once when moving
         # TODO send these out to the UI queue
-        if self.__game.GetIsInCheckmate():
+        positionStatus = self.__game.GetPositionStatus()
+        if positionStatus.IsCheckmate:
             logger.error("Game is in checkmate!")
             return
 
-        if self.__game.GetIsDraw():
-            logger.error("Game has ended in a draw!")
+        if positionStatus.IsDraw():
+            if positionStatus.IsStalemate:
+                logger.error("Game has ended in a draw by stalemate!")
+            elif positionStatus.IsDrawByInsufficientMaterial:
+                logger.error("Game has ended in a draw by insufficient material!")
+            elif positionStatus.IsDrawByRepetition:
+                logger.error("Game has ended in a draw by fivefold repetition!")
+            else:
+                logger.error("Game has ended in a draw by the 75 move rule!")
             return
 
-        if self.__game.GetIsInCheck():
+        if positionStatus.IsInCheck():
             logger.error("Player is in check!")
 
+        # The engine only sees the FEN so it can't know the position has repeated, rather than let engines shuffle
+        # pieces until fivefold repetition, an engine vs engine game is drawn as soon as a draw can be claimed
+        if self.__gameType == GameType.AIvsAI and positionStatus.CanClaimDrawByRepetition:
+            self.__game.ClaimDraw()
+            logger.error("Game has ended in a draw by threefold repetition!")
+            return
+
         # Setup the relevant move response (if applicable)
         gameType = self.__gameType
         if not Utilities.GameHelpers.GameHelpers.IsValidGameType(gameType):
@@ -0,0 +1,87 @@
+import argparse
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Utilities.Perft import Perft
+
+
+# Move generation benchmark, run from the repository root, e.g.
+#   python -m Main.perft --depth 4
+#   python -m Main.perft --position kiwipete --depth 2 --divide
+#   python -m Main.perft --fen "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1" --depth 3
+#   python -m Main.perft --suite --depth 3
+
+
+def ParseArguments():
+    positionNames = [position[0] for position in Perft.StandardPositions]
+
+    parser = argparse.ArgumentParser(description="Perft node counts and move generation throughput")
+    parser.add_argument("--position", choices=positionNames, default="start", help="Standard position to search")
+    parser.add_argument("--fen", help="Search this FEN instead of a standard position")
+    parser.add_argument("--depth", type=int, default=3, help="Search depth in plies")
+    parser.add_argument("--divide", action="store_true", help="Print the node count below every root move")
+    parser.add_argument("--suite", action="store_true",
+                        help="Check every standard position against its expected counts up to --depth")
+    return parser.parse_args()
+
+
+def FormatMove(fromCoord, toCoord):
+    return (fromCoord.GetXBoard() + fromCoord.GetYBoard() + toCoord.GetXBoard() + toCoord.GetYBoard()).lower()
+
+
+def PrintRun(nodes, seconds):
+    nodesPerSecond = nodes / seconds if seconds > 0 else float("inf")
+    print("Nodes: " + str(nodes) + ", time: " + "{:.3f}".format(seconds) + "s, nodes/s: " +
+          "{:.0f}".format(nodesPerSecond))
+
+
+def RunSuite(board, maximumDepth):
+    allPassed = True
+    for name, fen, expectedCounts in Perft.StandardPositions:
+        board.LoadFen(fen)
+        for depth, expectedNodes in enumerate(expectedCounts[:maximumDepth], start=1):
+            nodes, seconds = Perft.Run(board, depth)
+            passed = nodes == expectedNodes
+            allPassed = allPassed and passed
+            print(("PASS" if passed else "FAIL") + " " + name + " depth " + str(depth) + ": " + str(nodes) +
+                  " (expected " + str(expectedNodes) + "), " + "{:.3f}".format(seconds) + "s")
+    return allPassed
+
+
+def Main():
+    arguments = ParseArguments()
+    board = ChessBoard(History())
+
+    if arguments.suite:
+        return 0 if RunSuite(board, arguments.depth) else 1
+
+    expectedCounts = ()
+    if arguments.fen:
+        fen = arguments.fen
+    else:
+        _, fen, expectedCounts = Perft.GetStandardPosition(arguments.position)
+    if not board.LoadFen(fen):
+        print("Invalid FEN: " + fen)
+        return 1
+
+    print("Position: " + fen + ", depth: " + str(arguments.depth))
+
+    if arguments.divide:
+        totalNodes = 0
+        for fromCoord, toCoord, nodes in Perft.Divide(board, arguments.depth):
+            print(FormatMove(fromCoord, toCoord) + ": " + str(nodes))
+            totalNodes += nodes
+        print("Total: " + str(totalNodes))
+        return 0
+
+    nodes, seconds = Perft.Run(board, arguments.depth)
+    PrintRun(nodes, seconds)
+
+    if 0 < arguments.depth <= len(expectedCounts):
+        expectedNodes = expectedCounts[arguments.depth - 1]
+        print(("PASS" if nodes == expectedNodes else "FAIL") + ", expected: " + str(expectedNodes))
+        return 0 if nodes == expectedNodes else 1
+    return 0
+
+
+if __name__ == '__main__':
+    exit(Main())
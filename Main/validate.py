@@ -0,0 +1,59 @@
+import argparse
+import logging
+import sys
+import time
+from Utilities.GameValidator import GameValidator
+
+
+# Bulk legality check of recorded games, one game per line as UCI moves separated by spaces. Run from the repository
+# root, e.g.
+#   python -m Main.validate games.txt
+#   python -m Main.validate games.txt --processes 4 --illegal-only
+#   cat games.txt | python -m Main.validate
+
+
+def ParseArguments():
+    parser = argparse.ArgumentParser(description="Replays recorded games through Game.Move and reports illegal moves")
+    parser.add_argument("games", nargs="?", help="File of games, one per line (reads standard input if omitted)")
+    parser.add_argument("--processes", type=int, help="Worker processes, defaults to one per CPU")
+    parser.add_argument("--chunk-size", type=int, default=GameValidator.DefaultChunkSize,
+                        help="Games handed to a worker at a time")
+    parser.add_argument("--illegal-only", action="store_true", help="Only print the games with an illegal move")
+    return parser.parse_args()
+
+
+# Reads the games a line at a time as the validator asks for them, blank lines are skipped
+def ReadGames(gamesFile):
+    for line in gamesFile:
+        if line.strip():
+            yield line
+
+
+def Main():
+    arguments = ParseArguments()
+    logging.getLogger().setLevel(logging.CRITICAL)
+
+    gamesFile = open(arguments.games) if arguments.games else sys.stdin
+    gameCount = 0
+    illegalCount = 0
+    startTime = time.perf_counter()
+    try:
+        for result in GameValidator.Validate(ReadGames(gamesFile), arguments.processes, arguments.chunk_size):
+            gameCount += 1
+            if not result.IsLegal():
+                illegalCount += 1
+            if not arguments.illegal_only or not result.IsLegal():
+                print(result.ToString())
+    finally:
+        if gamesFile is not sys.stdin:
+            gamesFile.close()
+
+    seconds = time.perf_counter() - startTime
+    gamesPerSecond = gameCount / seconds if seconds > 0 else float("inf")
+    print("Games: " + str(gameCount) + ", illegal: " + str(illegalCount) + ", time: " + "{:.3f}".format(seconds) +
+          "s, games/s: " + "{:.1f}".format(gamesPerSecond))
+    return 0 if illegalCount == 0 else 1
+
+
+if __name__ == '__main__':
+    exit(Main())
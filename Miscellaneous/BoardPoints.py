@@ -3,25 +3,45 @@ import Miscellaneous.Constants
 from Miscellaneous.Points import Points
 
 
-# General points, this covers direction vectors as well as chess board and array coordinates
+# Points on the chess board. There is exactly one instance per square (plus BOARD_POINTS_UNDEFINED for anything off
+# the board), BoardPoints(x, y) hands back the interned instance rather than building a new one. Instances are
+# immutable, so equality and hashing are by identity (the object defaults) and they can be used as dict/set keys.
 class BoardPoints(Points):
 
+    __slots__ = ("__xBoard", "__yBoard", "__index")
+
+    # Interned instances indexed by square (y * MAXIMUM_X_SQUARES + x), filled in on first use
+    __squares = [None] * (Miscellaneous.Constants.MAXIMUM_X_SQUARES * Miscellaneous.Constants.MAXIMUM_Y_SQUARES)
+    __undefined = None
+
+    def __new__(cls, x, y):
+        if 0 <= x < Miscellaneous.Constants.MAXIMUM_X_SQUARES and 0 <= y < Miscellaneous.Constants.MAXIMUM_Y_SQUARES:
+            index = y * Miscellaneous.Constants.MAXIMUM_X_SQUARES + x
+            point = BoardPoints.__squares[index]
+            if point is None:
+                point = Points.__new__(cls)
+                Points.__init__(point, x, y)
+                point.__xBoard = Miscellaneous.Constants.ALPHABETICAL_BOARD_ORDINATES[x]
+                point.__yBoard = Miscellaneous.Constants.NUMERICAL_BOARD_ORDINATES[y]
+                point.__index = index
+                BoardPoints.__squares[index] = point
+            return point
+
+        if BoardPoints.__undefined is None:
+            point = Points.__new__(cls)
+            Points.__init__(point, -sys.maxsize, -sys.maxsize)
+            point.__xBoard = point.__yBoard = -sys.maxsize
+            point.__index = None
+            BoardPoints.__undefined = point
+        return BoardPoints.__undefined
+
     def __init__(self, x, y):
-        if 0 <= x < len(Miscellaneous.Constants.ALPHABETICAL_BOARD_ORDINATES) and 0 <= y < len(
-                Miscellaneous.Constants.NUMERICAL_BOARD_ORDINATES):
-            Points.__init__(self, x, y)
-            self.__xBoard = Miscellaneous.Constants.ALPHABETICAL_BOARD_ORDINATES[x]
-            self.__yBoard = Miscellaneous.Constants.NUMERICAL_BOARD_ORDINATES[y]
-            return
-
-        Points.__init__(self, -sys.maxsize, -sys.maxsize)
-        self.__xBoard = self.__yBoard = -sys.maxsize
-
-    def __eq__(self, other):
-        return self.GetX() == other.GetX() and \
-               self.GetY() == other.GetY() and \
-               self.GetXBoard() == other.GetXBoard() and \
-               self.GetYBoard() == other.GetYBoard()
+        # Everything is set up once in __new__
+        pass
+
+    # Copies and unpickled instances resolve back to the interned instance
+    def __reduce__(self):
+        return BoardPoints, (self.GetX(), self.GetY())
 
     def __lt__(self, other):
         if self.GetX() == other.GetX():
@@ -39,5 +59,14 @@ class BoardPoints(Points):
     def GetYBoard(self):
         return self.__yBoard
 
+    # Square index (y * MAXIMUM_X_SQUARES + x), the same indexing as the bitboards. None when off the board
+    def GetIndex(self):
+        return self.__index
+
+    @staticmethod
+    def FromIndex(square):
+        return BoardPoints(square % Miscellaneous.Constants.MAXIMUM_X_SQUARES,
+                           square // Miscellaneous.Constants.MAXIMUM_X_SQUARES)
+
 
 BOARD_POINTS_UNDEFINED = BoardPoints(-sys.maxsize, -sys.maxsize)
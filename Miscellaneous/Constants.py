@@ -14,6 +14,8 @@ BLACK_PAWNS_Y_ARRAY_COORDINATE = 6
 
 # Gameplay constants
 DRAW_CONDITION_TOTAL_MOVES = 150
+DRAW_CONDITION_REPETITIONS = 5
+CLAIMABLE_DRAW_REPETITIONS = 3
 
 # Castling related constants
 KING_CASTLE_SQUARE_MOVES = 2
@@ -1,7 +1,6 @@
-import sys
 import Miscellaneous.Constants
+import Utilities.AttackTables
 from Miscellaneous.Constants import PieceEnums, TeamEnum
-from Miscellaneous.Points import Points
 from Utilities.MoveHelpers import MoveHelpers
 from Pieces.IBasePiece import IBasePiece
 import logging
@@ -14,7 +13,6 @@ class Bishop(IBasePiece):
     BlackPieceString = u'\u265D'
     WhitePieceFenString = 'B'
     BlackPieceFenString = 'b'
-    MoveIterations = sys.maxsize
 
     def __init__(self, team, coords):
         IBasePiece.__init__( self, team, coords)
@@ -40,10 +38,6 @@ class Bishop(IBasePiece):
     def GetPieceEnum(self):
         return PieceEnums.Bishop
 
-    def GetValidMoves(self, board, enforceKingUnderAttackCheck):
-        validMoves = []
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, 1), Bishop.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, -1), Bishop.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, 1), Bishop.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, -1), Bishop.MoveIterations, enforceKingUnderAttackCheck))
-        return validMoves
+    def IterateValidMoves(self, board, enforceKingUnderAttackCheck, legalityMasks=None):
+        return MoveHelpers.IterateValidMovesFromRayTable(self, board, Utilities.AttackTables.BISHOP_RAYS,
+                                                         enforceKingUnderAttackCheck, legalityMasks)
@@ -8,7 +8,9 @@ class IBasePiece(ABC):
     def __init__(self, team, coordinates: BoardPoints):
         self.__team = team
         self.__coordinates = coordinates
-        self.__history = [coordinates]
+
+        # Number of times the piece has been moved, the trajectory itself is in the game History
+        self.__moveCount = 0
 
     @abstractmethod
     def GetPieceStr(self):
@@ -22,21 +24,25 @@ class IBasePiece(ABC):
     def GetFenRepresentation(self):
         pass
 
+    # Yields the piece's moves lazily so callers looking for a particular move, or any move, can stop early
     @abstractmethod
-    def GetValidMoves(self, board, enforceKingUnderAttackCheck):
+    def IterateValidMoves(self, board, enforceKingUnderAttackCheck, legalityMasks=None):
         pass
 
+    def GetValidMoves(self, board, enforceKingUnderAttackCheck, legalityMasks=None):
+        return list(self.IterateValidMoves(board, enforceKingUnderAttackCheck, legalityMasks))
+
     def CanMove(self, board, toMovePoint: BoardPoints):
 
         if toMovePoint == Miscellaneous.BoardPoints.BOARD_POINTS_UNDEFINED:
             return False
 
-        enforceKingUnderAttackCheck = True
-        validMoves = self.GetValidMoves(board, enforceKingUnderAttackCheck)
-        if len(validMoves) == 0:
-            return False
+        if board.GetPieceAtCoordinate(self.GetCoordinates()) is self:
+            # Piece is on the board so only this one move needs checking
+            return board.IsLegalMove(self.GetCoordinates(), toMovePoint)
 
-        canMove = any(move == toMovePoint for move in validMoves)
+        enforceKingUnderAttackCheck = True
+        canMove = any(move == toMovePoint for move in self.IterateValidMoves(board, enforceKingUnderAttackCheck))
         return canMove
 
     def Move(self, board, toMovePoint: BoardPoints):
@@ -52,7 +58,7 @@ class IBasePiece(ABC):
         self.SetCoordinates(toMovePoint)
         return True
 
-    # Force move with no CanMove check and no addition to history
+    # Force move with no CanMove check and without counting as a move
     def ForceMoveNoHistory(self, toMovePoint: BoardPoints):
         self.__coordinates = toMovePoint
         return True
@@ -62,10 +68,19 @@ class IBasePiece(ABC):
 
     def SetCoordinates(self, newCoords):
         self.__coordinates = newCoords
-        self.__history.append(newCoords)
+        self.__moveCount += 1
+
+    # Inverse of SetCoordinates, used when a move is taken back
+    def RevertLastCoordinates(self, previousCoords):
+        self.__coordinates = previousCoords
+        if self.__moveCount > 0:
+            self.__moveCount -= 1
 
     def GetCoordinates(self):
         return self.__coordinates
 
-    def GetHistory(self):
-        return self.__history
+    def GetMoveCount(self):
+        return self.__moveCount
+
+    def HasMoved(self):
+        return self.__moveCount > 0
@@ -1,8 +1,7 @@
 import Miscellaneous.Constants
+import Utilities.AttackTables
 from Miscellaneous.Constants import PieceEnums, TeamEnum
 from Miscellaneous.BoardPoints import BoardPoints
-from Miscellaneous.Points import Points
-from Utilities.BoardHelpers import BoardHelpers
 from Utilities.MoveHelpers import MoveHelpers
 from Pieces.IBasePiece import IBasePiece
 import logging
@@ -16,8 +15,6 @@ class King(IBasePiece):
     WhitePieceFenString = 'K'
     BlackPieceFenString = 'k'
 
-    MoveIterations = 1
-
     def __init__(self, team, coords):
         IBasePiece.__init__( self, team, coords)
         self.CanCastleQueenSideInTheFuture = True
@@ -48,21 +45,16 @@ class King(IBasePiece):
 
     # sideToCastle will either be queen or king side
     def CanPotentiallyCastleInTheFutureBaseCheck(self, board, sideToCastle):
-        if len(self.GetHistory()) > 1:
+        if self.HasMoved():
             logger.debug("King has moved, returning False")
             return False
 
-        arrayRooks = BoardHelpers.GetPieceByPieceType(board, PieceEnums.Rook, self.GetTeam())
-        if len(arrayRooks) == 0:
+        # The board tracks whether the King and corner Rook are still unmoved, a bit test rather than a rook search
+        isKingSide = sideToCastle == PieceEnums.King
+        if not board.HasCastlingRight(self.GetTeam(), isKingSide):
             return False
 
-        rookToCastle = None
-        for rook in arrayRooks:
-            if (sideToCastle == PieceEnums.Queen and rook.IsQueenSideRookWithStartingCoordinates()) or \
-                    (sideToCastle == PieceEnums.King and rook.IsKingSideRookWithStartingCoordinates()):
-                rookToCastle = rook
-                break
-
+        rookToCastle = board.GetCastlingRook(self.GetTeam(), isKingSide)
         if rookToCastle is None or not rookToCastle.CanCastleInTheFuture():
             return False
 
@@ -77,6 +69,10 @@ class King(IBasePiece):
         if not self.CanCastleQueenSideInTheFuture:
             return False
 
+        # Rights lost through the board are restored by it when a move is taken back, so the flag is left alone
+        if not board.HasCastlingRight(self.GetTeam(), False):
+            return False
+
         if not self.CanPotentiallyCastleInTheFutureBaseCheck(board, PieceEnums.Queen):
             self.CanCastleQueenSideInTheFuture = False
             return False
@@ -87,15 +83,7 @@ class King(IBasePiece):
         if not self.CanPotentiallyQueenSideCastleInTheFuture(board):
             return False
 
-        arrayRooks = BoardHelpers.GetPieceByPieceType(board, PieceEnums.Rook, self.GetTeam())
-        rookToCastle = None
-        for rook in arrayRooks:
-            # Y coord is verified in the CanCastle method in the rook
-            if rook.IsQueenSideRookWithStartingCoordinates():
-                rookToCastle = rook
-                break
-
-        return rookToCastle.CanCastle(board, enforceKingIsInCheck)
+        return board.GetCastlingRook(self.GetTeam(), False).CanCastle(board, enforceKingIsInCheck)
 
     # endregion
 
@@ -106,6 +94,10 @@ class King(IBasePiece):
         if not self.CanCastleKingSideInTheFuture:
             return False
 
+        # Rights lost through the board are restored by it when a move is taken back, so the flag is left alone
+        if not board.HasCastlingRight(self.GetTeam(), True):
+            return False
+
         if not self.CanPotentiallyCastleInTheFutureBaseCheck(board, PieceEnums.King):
             self.CanCastleKingSideInTheFuture = False
             return False
@@ -116,15 +108,7 @@ class King(IBasePiece):
         if not self.CanPotentiallyKingSideCastleInTheFuture(board):
             return False
 
-        arrayRooks = BoardHelpers.GetPieceByPieceType(board, PieceEnums.Rook, self.GetTeam())
-        rookToCastle = None
-        for rook in arrayRooks:
-            # Y coord is verified in the CanCastle method in the rook
-            if rook.IsKingSideRookWithStartingCoordinates():
-                rookToCastle = rook
-                break
-
-        return rookToCastle.CanCastle(board, enforceKingIsInCheck)
+        return board.GetCastlingRook(self.GetTeam(), True).CanCastle(board, enforceKingIsInCheck)
 
     # endregion
 
@@ -135,36 +119,18 @@ class King(IBasePiece):
         return True
 
     def GetCastleMoves(self, board, enforceKingIsInCheck):
-
-        if not self.CanCastle(board, enforceKingIsInCheck):
-            return []
-
-        arrayRooks = BoardHelpers.GetPieceByPieceType(board, PieceEnums.Rook, self.GetTeam())
         kingXCoordinate = self.GetCoordinates().GetX()
         kingYCoordinate = self.GetCoordinates().GetY()
 
         moves = []
-        for rook in arrayRooks:
-            if rook.CanCastle(board, enforceKingIsInCheck):
-                # Rook can castle
-                rookXCoord = rook.GetCoordinates().GetX()
-                isLeftRook = True if rookXCoord == 0 else False
-                if isLeftRook:
-                    moves.append(BoardPoints(kingXCoordinate - Miscellaneous.Constants.KING_CASTLE_SQUARE_MOVES, kingYCoordinate))
-                else:
-                    moves.append(BoardPoints(kingXCoordinate + Miscellaneous.Constants.KING_CASTLE_SQUARE_MOVES, kingYCoordinate))
+        if self.CanQueenSideCastle(board, enforceKingIsInCheck):
+            moves.append(BoardPoints(kingXCoordinate - Miscellaneous.Constants.KING_CASTLE_SQUARE_MOVES, kingYCoordinate))
+        if self.CanKingSideCastle(board, enforceKingIsInCheck):
+            moves.append(BoardPoints(kingXCoordinate + Miscellaneous.Constants.KING_CASTLE_SQUARE_MOVES, kingYCoordinate))
 
         return moves
 
-    def GetValidMoves(self, board, enforceKingUnderAttackCheck):
-        validMoves = []
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, 1), King.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, 0), King.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, -1), King.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(0, -1), King.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, -1), King.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, 0), King.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, 1), King.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(0, 1), King.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(self.GetCastleMoves(board, enforceKingUnderAttackCheck))
-        return validMoves
+    def IterateValidMoves(self, board, enforceKingUnderAttackCheck, legalityMasks=None):
+        yield from MoveHelpers.IterateValidMovesFromRayTable(self, board, Utilities.AttackTables.KING_RAYS,
+                                                             enforceKingUnderAttackCheck, legalityMasks)
+        yield from self.GetCastleMoves(board, enforceKingUnderAttackCheck)
@@ -1,6 +1,6 @@
 import Miscellaneous.Constants
+import Utilities.AttackTables
 from Miscellaneous.Constants import TeamEnum, PieceEnums
-from Miscellaneous.Points import Points
 from Utilities.MoveHelpers import MoveHelpers
 from Pieces.IBasePiece import IBasePiece
 import logging
@@ -13,7 +13,6 @@ class Knight(IBasePiece):
     BlackPieceString = u'\u265E'
     WhitePieceFenString = 'N'
     BlackPieceFenString = 'n'
-    MoveIterations = 1
 
     def __init__(self, team, coords):
         IBasePiece.__init__(self, team, coords)
@@ -39,14 +38,6 @@ class Knight(IBasePiece):
     def GetPieceEnum(self):
         return PieceEnums.Knight
 
-    def GetValidMoves(self, board, enforceKingUnderAttackCheck):
-        validMoves = []
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(2, 1), Knight.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, 2), Knight.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, 2), Knight.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-2, 1), Knight.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-2, -1), Knight.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, -2), Knight.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, -2), Knight.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(2, -1), Knight.MoveIterations, enforceKingUnderAttackCheck))
-        return validMoves
+    def IterateValidMoves(self, board, enforceKingUnderAttackCheck, legalityMasks=None):
+        return MoveHelpers.IterateValidMovesFromRayTable(self, board, Utilities.AttackTables.KNIGHT_RAYS,
+                                                         enforceKingUnderAttackCheck, legalityMasks)
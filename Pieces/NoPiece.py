@@ -1,3 +1,4 @@
+import Miscellaneous.BoardPoints
 from Miscellaneous.Constants import PieceEnums, TeamEnum
 from Pieces.IBasePiece import IBasePiece
 
@@ -17,5 +18,16 @@ class NoPiece(IBasePiece):
     def GetPieceEnum(self):
         return PieceEnums.NoPiece
 
-    def GetValidMoves(self, board, enforceKingUnderAttackCheck):
-        return []
+    def IterateValidMoves(self, board, enforceKingUnderAttackCheck, legalityMasks=None):
+        return iter(())
+
+    # Empty squares never move, this keeps the shared EMPTY_SQUARE immutable
+    def SetCoordinates(self, newCoords):
+        pass
+
+    def ForceMoveNoHistory(self, toMovePoint):
+        return False
+
+
+# The board holds this one instance for every empty square, it deliberately has no coordinates of its own
+EMPTY_SQUARE = NoPiece(Miscellaneous.BoardPoints.BOARD_POINTS_UNDEFINED)
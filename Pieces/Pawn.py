@@ -1,6 +1,6 @@
 import Miscellaneous.Constants
-from Miscellaneous.Constants import TeamEnum, PieceEnums
-from Miscellaneous.Points import Points
+import Utilities.AttackTables
+from Miscellaneous.Constants import TeamEnum
 from Utilities.MoveHelpers import MoveHelpers
 from Pieces.IBasePiece import IBasePiece
 import logging
@@ -38,22 +38,10 @@ class Pawn(IBasePiece):
     def GetPieceEnum(self):
         return Miscellaneous.Constants.PieceEnums.Pawn
 
-    def GetValidMoves(self, board, enforceKingUnderAttackCheck):
-        isPieceMovingUpwards = (self.GetTeam() == TeamEnum.White)
-        # In case pawns are starting from a non standard position, need additional processing
-        moveIterNonKillMoves = 1
-        if (isPieceMovingUpwards and self.GetCoordinates().GetY() == Miscellaneous.Constants.WHITE_PAWNS_Y_ARRAY_COORDINATE) or \
-                ((not isPieceMovingUpwards) and self.GetCoordinates().GetY() == Miscellaneous.Constants.BLACK_PAWNS_Y_ARRAY_COORDINATE):
-            moveIterNonKillMoves = 2
-
-        moveIterToKillMoves = 1
-        validMoves = []
-        if isPieceMovingUpwards:
-            validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(0, 1), moveIterNonKillMoves, enforceKingUnderAttackCheck))
-            validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, 1), moveIterToKillMoves, enforceKingUnderAttackCheck))
-            validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, 1), moveIterToKillMoves, enforceKingUnderAttackCheck))
-        else:
-            validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(0, -1), moveIterNonKillMoves, enforceKingUnderAttackCheck))
-            validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, -1), moveIterToKillMoves, enforceKingUnderAttackCheck))
-            validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, -1), moveIterToKillMoves, enforceKingUnderAttackCheck))
-        return validMoves
+    def IterateValidMoves(self, board, enforceKingUnderAttackCheck, legalityMasks=None):
+        # Push ray followed by the two capture diagonals, push ray is two squares long from the starting row
+        pawnRays = Utilities.AttackTables.PAWN_RAYS.get(self.GetTeam())
+        if pawnRays is None:
+            return iter(())
+        return MoveHelpers.IterateValidMovesFromRayTable(self, board, pawnRays, enforceKingUnderAttackCheck,
+                                                         legalityMasks)
@@ -1,7 +1,6 @@
-import sys
 import Miscellaneous.Constants
+import Utilities.AttackTables
 from Miscellaneous.Constants import TeamEnum, PieceEnums
-from Miscellaneous.Points import Points
 from Utilities.MoveHelpers import MoveHelpers
 from Pieces.IBasePiece import IBasePiece
 import logging
@@ -14,7 +13,6 @@ class Queen(IBasePiece):
     BlackPieceString = u'\u265B'
     WhitePieceFenString = 'Q'
     BlackPieceFenString = 'q'
-    MoveIterations = sys.maxsize
 
     def __init__(self, team, coords):
         IBasePiece.__init__( self, team, coords)
@@ -40,14 +38,6 @@ class Queen(IBasePiece):
     def GetPieceEnum(self):
         return PieceEnums.Queen
 
-    def GetValidMoves(self, board, enforceKingUnderAttackCheck):
-        validMoves = []
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, 1), Queen.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, 0), Queen.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, -1), Queen.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(0, -1), Queen.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, -1), Queen.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, 0), Queen.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, 1), Queen.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(0, 1), Queen.MoveIterations, enforceKingUnderAttackCheck))
-        return validMoves
+    def IterateValidMoves(self, board, enforceKingUnderAttackCheck, legalityMasks=None):
+        return MoveHelpers.IterateValidMovesFromRayTable(self, board, Utilities.AttackTables.QUEEN_RAYS,
+                                                         enforceKingUnderAttackCheck, legalityMasks)
@@ -1,8 +1,8 @@
-import sys
 import Miscellaneous.Constants
+import Utilities.AttackTables
 from Miscellaneous.Constants import TeamEnum, PieceEnums
 from Miscellaneous.BoardPoints import BoardPoints
-from Miscellaneous.Points import Points
+from Board.Bitboard import Bitboard
 from Utilities.BoardHelpers import BoardHelpers
 from Utilities.MoveHelpers import MoveHelpers
 from Pieces.IBasePiece import IBasePiece
@@ -16,7 +16,6 @@ class Rook(IBasePiece):
     BlackPieceString = u'\u265C'
     WhitePieceFenString = 'R'
     BlackPieceFenString = 'r'
-    MoveIterations = sys.maxsize
 
     def __init__(self, team, coords):
         IBasePiece.__init__(self, team, coords)
@@ -82,28 +81,26 @@ class Rook(IBasePiece):
         if not self.CanCastleInTheFuture():
             return False
 
-        if len(self.GetHistory()) > 1:
+        if self.HasMoved():
             self.SetCanCastleInTheFuture(False)
             logger.debug("Rook has moved, returning False")
             return False
 
         # Check starting x/y coord in case game is started at a certain configuration
-
-        if not self.IsKingSideRookWithStartingCoordinates() and not self.IsQueenSideRookWithStartingCoordinates():
+        isKingSideRook = self.IsKingSideRookWithStartingCoordinates()
+        if not isKingSideRook and not self.IsQueenSideRookWithStartingCoordinates():
             self.SetCanCastleInTheFuture(False)
             return False
 
-        if enforceKingUnderAttackCheck:
-            if BoardHelpers.IsInCheck(board, self.GetTeam()):
-                return False
-
-        arrayKing = BoardHelpers.GetPieceByPieceType(board, PieceEnums.King, self.GetTeam())
-        if len(arrayKing) == 0:
+        # Cleared by the board as soon as the King or this Rook moves
+        if not board.HasCastlingRight(self.GetTeam(), isKingSideRook):
             return False
 
-        king = arrayKing[0]
+        king = board.GetKing(self.GetTeam())
+        if king is None:
+            return False
 
-        if len(king.GetHistory()) > 1:
+        if king.HasMoved():
             self.SetCanCastleInTheFuture(False)
             logger.debug("King has moved, returning False")
             return False
@@ -114,7 +111,6 @@ class Rook(IBasePiece):
 
         isLeftRook = True if xCoordRook == 0 else False
         xRangeToConsider = range(xCoordRook + 1, xCoordKing) if isLeftRook else range(xCoordKing + 1, xCoordRook)
-        kingDirectionVector = Points(-1,0) if isLeftRook else Points(1,0)
 
         # Ensure all spaces are empty
         for xCoord in xRangeToConsider:
@@ -122,11 +118,19 @@ class Rook(IBasePiece):
                 return False
 
         # Need check to see if King is in check as part of any movement
-        kingValidMoves = MoveHelpers.GetValidMoves(king, board, kingDirectionVector,
-                                                   Miscellaneous.Constants.KING_CASTLE_SQUARE_MOVES,
-                                                   enforceKingUnderAttackCheck)
-        if len(kingValidMoves) != Miscellaneous.Constants.KING_CASTLE_SQUARE_MOVES:
-            return False
+        if enforceKingUnderAttackCheck:
+            if BoardHelpers.IsInCheck(board, self.GetTeam()):
+                return False
+
+            kingDirection = -1 if isLeftRook else 1
+            opposingTeam = BoardHelpers.GetOpposingTeam(self.GetTeam())
+            for squareMoves in range(1, Miscellaneous.Constants.KING_CASTLE_SQUARE_MOVES + 1):
+                xCoordKingPassing = xCoordKing + kingDirection * squareMoves
+                if not 0 <= xCoordKingPassing < Miscellaneous.Constants.MAXIMUM_X_SQUARES:
+                    return False
+                kingPassingSquare = Bitboard.GetSquareIndex(xCoordKingPassing, yCoordRook)
+                if BoardHelpers.IsSquareAttacked(board, kingPassingSquare, opposingTeam):
+                    return False
 
         return True
 
@@ -143,11 +147,7 @@ class Rook(IBasePiece):
         else:
             return [BoardPoints(xCoordRook - Miscellaneous.Constants.BISHOP_CASTLE_RIGHT_TO_LEFT_MOVES, yCoordRook)]
 
-    def GetValidMoves(self, board, enforceKingUnderAttackCheck):
-        validMoves = []
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(1, 0), Rook.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(0, 1), Rook.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(-1, 0), Rook.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(MoveHelpers.GetValidMoves(self, board, Points(0, -1), Rook.MoveIterations, enforceKingUnderAttackCheck))
-        validMoves.extend(self.GetCastleMoves(board, enforceKingUnderAttackCheck))
-        return validMoves
+    def IterateValidMoves(self, board, enforceKingUnderAttackCheck, legalityMasks=None):
+        yield from MoveHelpers.IterateValidMovesFromRayTable(self, board, Utilities.AttackTables.ROOK_RAYS,
+                                                             enforceKingUnderAttackCheck, legalityMasks)
+        yield from self.GetCastleMoves(board, enforceKingUnderAttackCheck)
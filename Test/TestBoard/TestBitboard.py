@@ -0,0 +1,87 @@
+import unittest
+from Board.Bitboard import Bitboard
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Pieces.Rook import Rook
+from Pieces.NoPiece import NoPiece
+from Miscellaneous.Constants import TeamEnum, PieceEnums
+from Miscellaneous.BoardPoints import BoardPoints
+
+
+class TestBitboard(unittest.TestCase):
+
+    def setUp(self):
+        history = History()
+        self.chessBoard = ChessBoard(history)
+
+    # region Bitboard tests
+
+    def test_AddPiece_SetsPieceAndTeamOccupancy(self):
+        bitboard = Bitboard()
+        square = Bitboard.GetSquareIndex(3, 4)
+        bitboard.AddPiece(TeamEnum.White, PieceEnums.Knight, square)
+
+        self.assertEqual(1 << square, bitboard.GetPieceBoard(TeamEnum.White, PieceEnums.Knight))
+        self.assertEqual(1 << square, bitboard.GetTeamOccupancy(TeamEnum.White))
+        self.assertEqual(0, bitboard.GetTeamOccupancy(TeamEnum.Black))
+        self.assertTrue(bitboard.IsOccupied(square))
+
+    def test_AddPiece_NoTeam_NotTracked(self):
+        bitboard = Bitboard()
+        bitboard.AddPiece(TeamEnum.NoTeam, PieceEnums.NoPiece, 10)
+
+        self.assertEqual(0, bitboard.GetOccupancy())
+
+    def test_RemovePiece_ClearsBits(self):
+        bitboard = Bitboard()
+        bitboard.AddPiece(TeamEnum.Black, PieceEnums.Queen, 5)
+        bitboard.AddPiece(TeamEnum.Black, PieceEnums.Pawn, 6)
+        bitboard.RemovePiece(TeamEnum.Black, PieceEnums.Queen, 5)
+
+        self.assertEqual(0, bitboard.GetPieceBoard(TeamEnum.Black, PieceEnums.Queen))
+        self.assertEqual(1 << 6, bitboard.GetTeamOccupancy(TeamEnum.Black))
+
+    def test_IterateSquares_ReturnsSquaresInAscendingOrder(self):
+        squares = list(Bitboard.IterateSquares((1 << 63) | (1 << 9) | 1))
+        self.assertEqual([0, 9, 63], squares)
+
+    def test_GetLowestSquare(self):
+        self.assertIsNone(Bitboard.GetLowestSquare(0))
+        self.assertEqual(9, Bitboard.GetLowestSquare((1 << 63) | (1 << 9)))
+
+    def test_PopCount(self):
+        self.assertEqual(0, Bitboard.PopCount(0))
+        self.assertEqual(3, Bitboard.PopCount((1 << 63) | (1 << 9) | 1))
+
+    def test_GetSquareCoordinates_InverseOfGetSquareIndex(self):
+        square = Bitboard.GetSquareIndex(6, 2)
+        self.assertEqual((6, 2), Bitboard.GetSquareCoordinates(square))
+
+    # endregion
+
+    # region ChessBoard facade tests
+
+    def test_ResetToDefault_SixteenPiecesEachTeam(self):
+        bitboard = self.chessBoard.GetBitboard()
+        self.assertEqual(16, Bitboard.PopCount(bitboard.GetTeamOccupancy(TeamEnum.White)))
+        self.assertEqual(16, Bitboard.PopCount(bitboard.GetTeamOccupancy(TeamEnum.Black)))
+        self.assertEqual(0xFFFF, bitboard.GetTeamOccupancy(TeamEnum.White))
+
+    def test_UpdatePieceOnBoard_OverwritingPiece_BitboardsFollow(self):
+        bitboard = self.chessBoard.GetBitboard()
+        square = Bitboard.GetSquareIndex(1, 0)
+
+        # Knight at B1 replaced by a black rook
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.Black, BoardPoints(1, 0)))
+        self.assertEqual(0, (bitboard.GetPieceBoard(TeamEnum.White, PieceEnums.Knight) >> square) & 1)
+        self.assertEqual(1, (bitboard.GetPieceBoard(TeamEnum.Black, PieceEnums.Rook) >> square) & 1)
+
+        # and then cleared
+        self.chessBoard.UpdatePieceOnBoard(NoPiece(BoardPoints(1, 0)))
+        self.assertFalse(bitboard.IsOccupied(square))
+
+    def test_RemoveAllPieces_BitboardsEmpty(self):
+        self.chessBoard.RemoveAllPieces()
+        self.assertEqual(0, self.chessBoard.GetBitboard().GetOccupancy())
+
+    # endregion
@@ -1,13 +1,18 @@
 import unittest
+import Board.Zobrist
+import Miscellaneous.Constants
 from Board.ChessBoard import ChessBoard
+from Board.Bitboard import Bitboard
 from Miscellaneous.Constants import PieceEnums, TeamEnum
 from Pieces.Bishop import Bishop
 from Pieces.Rook import Rook
 from Pieces.Pawn import Pawn
 from Pieces.King import King
+from Pieces.NoPiece import NoPiece, EMPTY_SQUARE
 from Board.History import History
 from Board.Movement import Movement
 from Miscellaneous.BoardPoints import BoardPoints
+from Utilities.BoardHelpers import BoardHelpers
 
 
 class TestChessBoard(unittest.TestCase):
@@ -234,3 +239,420 @@ class TestChessBoard(unittest.TestCase):
         self.assertEqual(0, len(self.chessBoard.GetHistoricalMoves()))
 
     # endregion
+
+    # region MakeMove/UnmakeMove tests
+
+    def test_MakeMove_Capture_UnmakeRestoresCapturedPiece(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(4, 0)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(4, 7)))
+        rook = Rook(TeamEnum.White, BoardPoints(0, 0))
+        capturedBishop = Bishop(TeamEnum.Black, BoardPoints(0, 5))
+        self.chessBoard.UpdatePieceOnBoard(rook)
+        self.chessBoard.UpdatePieceOnBoard(capturedBishop)
+        fenBeforeMove = self.chessBoard.GetFenRepresentation()
+
+        self.assertTrue(self.chessBoard.MakeMove(BoardPoints(0, 0), BoardPoints(0, 5)))
+        self.assertEqual(rook, self.chessBoard.GetPieceAtCoordinate(BoardPoints(0, 5)))
+        self.assertEqual(PieceEnums.NoPiece, self.chessBoard.GetPieceAtCoordinate(BoardPoints(0, 0)).GetPieceEnum())
+        self.assertEqual(TeamEnum.Black, self.chessBoard.GetTeamsTurn())
+        self.assertEqual(1, len(self.chessBoard.GetHistoricalMoves()))
+
+        self.assertTrue(self.chessBoard.UnmakeMove())
+        self.assertEqual(rook, self.chessBoard.GetPieceAtCoordinate(BoardPoints(0, 0)))
+        self.assertEqual(capturedBishop, self.chessBoard.GetPieceAtCoordinate(BoardPoints(0, 5)))
+        self.assertEqual(BoardPoints(0, 0), rook.GetCoordinates())
+        self.assertFalse(rook.HasMoved())
+        self.assertEqual(TeamEnum.White, self.chessBoard.GetTeamsTurn())
+        self.assertEqual(0, len(self.chessBoard.GetHistoricalMoves()))
+        self.assertEqual(fenBeforeMove, self.chessBoard.GetFenRepresentation())
+
+    def test_MakeMove_EnPassant_UnmakeRestoresCapturedPawn(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(4, 0)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(4, 7)))
+        whitePawn = Pawn(TeamEnum.White, BoardPoints(4, 4))
+        blackPawn = Pawn(TeamEnum.Black, BoardPoints(3, 6))
+        self.chessBoard.UpdatePieceOnBoard(whitePawn)
+        self.chessBoard.UpdatePieceOnBoard(blackPawn)
+        self.chessBoard.SetTeamsTurn(TeamEnum.Black)
+
+        self.chessBoard.MakeMove(BoardPoints(3, 6), BoardPoints(3, 4))
+        self.chessBoard.MakeMove(BoardPoints(4, 4), BoardPoints(3, 5))
+        self.assertTrue(self.chessBoard.GetLastHistoricalMove().IsEnPassantMove())
+        self.assertEqual(PieceEnums.NoPiece, self.chessBoard.GetPieceAtCoordinate(BoardPoints(3, 4)).GetPieceEnum())
+
+        self.chessBoard.UnmakeMove()
+        self.assertEqual(blackPawn, self.chessBoard.GetPieceAtCoordinate(BoardPoints(3, 4)))
+        self.assertEqual(whitePawn, self.chessBoard.GetPieceAtCoordinate(BoardPoints(4, 4)))
+        self.assertEqual(PieceEnums.NoPiece, self.chessBoard.GetPieceAtCoordinate(BoardPoints(3, 5)).GetPieceEnum())
+
+    def test_MakeMove_Castle_UnmakeRestoresRookAndCastlingRights(self):
+        self.chessBoard.RemoveAllPieces()
+        king = King(TeamEnum.White, BoardPoints(4, 0))
+        rook = Rook(TeamEnum.White, BoardPoints(7, 0))
+        self.chessBoard.UpdatePieceOnBoard(king)
+        self.chessBoard.UpdatePieceOnBoard(rook)
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(4, 7)))
+
+        self.chessBoard.MakeMove(BoardPoints(4, 0), BoardPoints(6, 0))
+        self.assertEqual(rook, self.chessBoard.GetPieceAtCoordinate(BoardPoints(5, 0)))
+        self.assertEqual(2, len(self.chessBoard.GetHistoricalMoves()))
+
+        # Castling rights are cleared as a side effect of generating moves after the castle
+        self.assertFalse(king.CanPotentiallyKingSideCastleInTheFuture(self.chessBoard))
+
+        self.chessBoard.UnmakeMove()
+        self.assertEqual(king, self.chessBoard.GetPieceAtCoordinate(BoardPoints(4, 0)))
+        self.assertEqual(rook, self.chessBoard.GetPieceAtCoordinate(BoardPoints(7, 0)))
+        self.assertEqual(PieceEnums.NoPiece, self.chessBoard.GetPieceAtCoordinate(BoardPoints(5, 0)).GetPieceEnum())
+        self.assertEqual(0, self.chessBoard.GetHistory().GetNumberofTurns())
+        self.assertTrue(king.CanCastleKingSideInTheFuture)
+        self.assertTrue(king.CanKingSideCastle(self.chessBoard, True))
+
+    def test_MakeMove_Promotion_UnmakeRestoresPawn(self):
+        self.chessBoard.RemoveAllPieces()
+        pawn = Pawn(TeamEnum.White, BoardPoints(0, 6))
+        self.chessBoard.UpdatePieceOnBoard(pawn)
+
+        self.chessBoard.MakeMove(BoardPoints(0, 6), BoardPoints(0, 7))
+        self.assertEqual(PieceEnums.Queen, self.chessBoard.GetPieceAtCoordinate(BoardPoints(0, 7)).GetPieceEnum())
+
+        self.chessBoard.UnmakeMove()
+        self.assertEqual(pawn, self.chessBoard.GetPieceAtCoordinate(BoardPoints(0, 6)))
+        self.assertEqual(PieceEnums.NoPiece, self.chessBoard.GetPieceAtCoordinate(BoardPoints(0, 7)).GetPieceEnum())
+        self.assertEqual(0, self.chessBoard.GetBitboard().GetPieceBoard(TeamEnum.White, PieceEnums.Queen))
+
+    def test_UnmakeMove_NoMoveMade_ReturnsFalse(self):
+        self.assertFalse(self.chessBoard.UnmakeMove())
+
+    # endregion
+
+    # region IsLegalMove tests
+
+    def test_IsLegalMove_StartingPosition_PawnAndKnightMoves(self):
+        self.assertTrue(self.chessBoard.IsLegalMove(BoardPoints(4, 1), BoardPoints(4, 3)))
+        self.assertTrue(self.chessBoard.IsLegalMove(BoardPoints(6, 0), BoardPoints(5, 2)))
+        self.assertFalse(self.chessBoard.IsLegalMove(BoardPoints(4, 1), BoardPoints(4, 4)))
+        self.assertFalse(self.chessBoard.IsLegalMove(BoardPoints(6, 0), BoardPoints(6, 2)))
+
+    def test_IsLegalMove_SliderBlocked_ReturnsFalse(self):
+        # Rook on a1 is blocked by its own pawn
+        self.assertFalse(self.chessBoard.IsLegalMove(BoardPoints(0, 0), BoardPoints(0, 3)))
+
+    def test_IsLegalMove_EmptySquare_ReturnsFalse(self):
+        self.assertFalse(self.chessBoard.IsLegalMove(BoardPoints(4, 4), BoardPoints(4, 5)))
+
+    def test_IsLegalMove_PinnedPiece_OnlyMovesAlongPin(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(4, 0)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(4, 2)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.Black, BoardPoints(4, 6)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(0, 7)))
+
+        self.assertTrue(self.chessBoard.IsLegalMove(BoardPoints(4, 2), BoardPoints(4, 6)))
+        self.assertFalse(self.chessBoard.IsLegalMove(BoardPoints(4, 2), BoardPoints(0, 2)))
+
+    def test_IsLegalMove_KingCastle(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(4, 0)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(7, 0)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(4, 7)))
+
+        self.assertTrue(self.chessBoard.IsLegalMove(BoardPoints(4, 0), BoardPoints(6, 0)))
+        self.assertFalse(self.chessBoard.IsLegalMove(BoardPoints(4, 0), BoardPoints(2, 0)))
+
+    # endregion
+
+    # region Piece lookup tests
+
+    def test_GetKing_DefaultBoard_ReturnsKings(self):
+        whiteKing = self.chessBoard.GetKing(TeamEnum.White)
+        blackKing = self.chessBoard.GetKing(TeamEnum.Black)
+        self.assertEqual(PieceEnums.King, whiteKing.GetPieceEnum())
+        self.assertEqual(BoardPoints(4, 0), whiteKing.GetCoordinates())
+        self.assertEqual(BoardPoints(4, 7), blackKing.GetCoordinates())
+        self.assertEqual(4, self.chessBoard.GetKingSquare(TeamEnum.White))
+
+    def test_GetKing_NoKing_ReturnsNone(self):
+        self.chessBoard.RemoveAllPieces()
+        self.assertIsNone(self.chessBoard.GetKing(TeamEnum.White))
+        self.assertIsNone(self.chessBoard.GetKingSquare(TeamEnum.White))
+
+    def test_GetPieces_FollowsMoves(self):
+        self.assertEqual(2, len(self.chessBoard.GetPieces(TeamEnum.Black, PieceEnums.Rook)))
+
+        self.chessBoard.UpdatePieceOnBoard(Bishop(TeamEnum.White, BoardPoints(0, 7)))
+        blackRooks = self.chessBoard.GetPieces(TeamEnum.Black, PieceEnums.Rook)
+        self.assertEqual(1, len(blackRooks))
+        self.assertEqual(BoardPoints(7, 7), blackRooks[0].GetCoordinates())
+        self.assertEqual(3, len(self.chessBoard.GetPieces(TeamEnum.White, PieceEnums.Bishop)))
+
+    # endregion
+
+    # region Empty square tests
+
+    def test_EmptySquares_ShareSentinel(self):
+        self.assertIs(EMPTY_SQUARE, self.chessBoard.GetPieceAtCoordinate(BoardPoints(0, 3)))
+        self.assertIs(EMPTY_SQUARE, self.chessBoard.GetPieceAtCoordinate(BoardPoints(7, 5)))
+
+        # Any NoPiece placed on the board is stored as the sentinel
+        self.chessBoard.UpdatePieceOnBoard(NoPiece(BoardPoints(0, 0)))
+        self.assertIs(EMPTY_SQUARE, self.chessBoard.GetPieceAtCoordinate(BoardPoints(0, 0)))
+
+    def test_ClearSquare_EmptiesSquareAndBitboards(self):
+        self.chessBoard.ClearSquare(BoardPoints(3, 0))
+        self.assertIs(EMPTY_SQUARE, self.chessBoard.GetPieceAtCoordinate(BoardPoints(3, 0)))
+        self.assertEqual(0, self.chessBoard.GetBitboard().GetPieceBoard(TeamEnum.White, PieceEnums.Queen))
+
+    def test_EmptySquareSentinel_CannotBeMoved(self):
+        EMPTY_SQUARE.ForceMove(BoardPoints(1, 1))
+        EMPTY_SQUARE.ForceMoveNoHistory(BoardPoints(1, 1))
+        self.assertEqual(0, EMPTY_SQUARE.GetMoveCount())
+        self.assertNotEqual(BoardPoints(1, 1), EMPTY_SQUARE.GetCoordinates())
+
+    # endregion
+
+    # region GetPositionKey tests
+
+    def test_GetPositionKey_MakeUnmake_KeyRestored(self):
+        startKey = self.chessBoard.GetPositionKey()
+        self.chessBoard.MakeMove(BoardPoints(4, 1), BoardPoints(4, 3))
+        self.assertNotEqual(startKey, self.chessBoard.GetPositionKey())
+
+        self.chessBoard.UnmakeMove()
+        self.assertEqual(startKey, self.chessBoard.GetPositionKey())
+
+    def test_GetPositionKey_Transposition_SameKey(self):
+        # 1. Nf3 Nf6 2. Nc3 against 1. Nc3 Nf6 2. Nf3
+        self.chessBoard.MakeMove(BoardPoints(6, 0), BoardPoints(5, 2))
+        self.chessBoard.MakeMove(BoardPoints(6, 7), BoardPoints(5, 5))
+        self.chessBoard.MakeMove(BoardPoints(1, 0), BoardPoints(2, 2))
+        firstKey = self.chessBoard.GetPositionKey()
+
+        self.chessBoard.ResetToDefault()
+        self.chessBoard.MakeMove(BoardPoints(1, 0), BoardPoints(2, 2))
+        self.chessBoard.MakeMove(BoardPoints(6, 7), BoardPoints(5, 5))
+        self.chessBoard.MakeMove(BoardPoints(6, 0), BoardPoints(5, 2))
+        self.assertEqual(firstKey, self.chessBoard.GetPositionKey())
+
+    def test_GetPositionKey_SideToMoveChangesKey(self):
+        whiteKey = self.chessBoard.GetPositionKey()
+        self.chessBoard.SetTeamsTurn(TeamEnum.Black)
+        self.assertNotEqual(whiteKey, self.chessBoard.GetPositionKey())
+        self.chessBoard.SetTeamsTurn(TeamEnum.White)
+        self.assertEqual(whiteKey, self.chessBoard.GetPositionKey())
+
+    def test_GetPositionKey_LostCastlingRights_DifferentKey(self):
+        # King side rook out and back again, the same pieces on the same squares but no more king side castling
+        self.chessBoard.ClearSquare(BoardPoints(6, 0))
+        keyBeforeRookMoves = self.chessBoard.GetPositionKey()
+        self.chessBoard.MakeMove(BoardPoints(7, 0), BoardPoints(6, 0))
+        self.chessBoard.SetTeamsTurn(TeamEnum.White)
+        self.chessBoard.MakeMove(BoardPoints(6, 0), BoardPoints(7, 0))
+        self.chessBoard.SetTeamsTurn(TeamEnum.White)
+
+        expectedCastlingRights = Board.Zobrist.WHITE_QUEEN_SIDE_CASTLE | Board.Zobrist.BLACK_KING_SIDE_CASTLE | \
+            Board.Zobrist.BLACK_QUEEN_SIDE_CASTLE
+        self.assertEqual(expectedCastlingRights, self.chessBoard.GetCastlingRights())
+        self.assertNotEqual(keyBeforeRookMoves, self.chessBoard.GetPositionKey())
+
+    def test_GetPositionKey_TwoStepPawnMove_EnPassantFileInKey(self):
+        # Same placement and side to move, only one has an en passant capture on offer (black pawn on d4)
+        self.chessBoard.UpdatePieceOnBoard(Pawn(TeamEnum.Black, BoardPoints(3, 3)))
+        self.chessBoard.MakeMove(BoardPoints(4, 1), BoardPoints(4, 3))
+        keyWithEnPassant = self.chessBoard.GetPositionKey()
+
+        self.chessBoard.UnmakeMove()
+        self.chessBoard.MakeMove(BoardPoints(4, 1), BoardPoints(4, 2))
+        self.chessBoard.SetTeamsTurn(TeamEnum.White)
+        self.chessBoard.MakeMove(BoardPoints(4, 2), BoardPoints(4, 3))
+        self.assertNotEqual(keyWithEnPassant, self.chessBoard.GetPositionKey())
+
+    def test_GetPositionKey_TwoStepPawnMove_NoCapturePossible_EnPassantFileNotInKey(self):
+        self.chessBoard.MakeMove(BoardPoints(4, 1), BoardPoints(4, 3))
+        keyAfterTwoStep = self.chessBoard.GetPositionKey()
+
+        self.chessBoard.UnmakeMove()
+        self.chessBoard.MakeMove(BoardPoints(4, 1), BoardPoints(4, 2))
+        self.chessBoard.SetTeamsTurn(TeamEnum.White)
+        self.chessBoard.MakeMove(BoardPoints(4, 2), BoardPoints(4, 3))
+        self.assertEqual(keyAfterTwoStep, self.chessBoard.GetPositionKey())
+
+    # endregion
+
+    # region En passant square tests
+
+    def test_GetEnPassantSquare_TwoStepPawnMove_SetUntilNextMoveAndRestoredByUnmake(self):
+        self.assertIsNone(self.chessBoard.GetEnPassantSquare())
+
+        self.chessBoard.MakeMove(BoardPoints(4, 1), BoardPoints(4, 3))
+        self.assertEqual(BoardPoints(4, 2).GetIndex(), self.chessBoard.GetEnPassantSquare())
+        self.assertEqual(BoardPoints(4, 2).GetIndex(), self.chessBoard.GetEnPassantCaptureSquare(TeamEnum.Black))
+        self.assertIsNone(self.chessBoard.GetEnPassantCaptureSquare(TeamEnum.White))
+
+        self.chessBoard.MakeMove(BoardPoints(6, 7), BoardPoints(5, 5))
+        self.assertIsNone(self.chessBoard.GetEnPassantSquare())
+
+        self.chessBoard.UnmakeMove()
+        self.assertEqual(BoardPoints(4, 2).GetIndex(), self.chessBoard.GetEnPassantSquare())
+        self.chessBoard.UnmakeMove()
+        self.assertIsNone(self.chessBoard.GetEnPassantSquare())
+
+    def test_GetEnPassantSquare_LoadedFen_PawnCanCaptureEnPassant(self):
+        self.assertTrue(self.chessBoard.LoadFen("4k3/8/8/8/3pP3/8/8/4K3 b - e3 0 1"))
+
+        blackPawn = self.chessBoard.GetPieceAtCoordinate(BoardPoints(3, 3))
+        self.assertIn(BoardPoints(4, 2), blackPawn.GetValidMoves(self.chessBoard, True))
+
+    # endregion
+
+    # region Castling rights tests
+
+    def test_GetCastlingRights_StartingPosition_AllRights(self):
+        self.assertEqual(Board.Zobrist.WHITE_KING_SIDE_CASTLE | Board.Zobrist.WHITE_QUEEN_SIDE_CASTLE |
+                         Board.Zobrist.BLACK_KING_SIDE_CASTLE | Board.Zobrist.BLACK_QUEEN_SIDE_CASTLE,
+                         self.chessBoard.GetCastlingRights())
+
+    def test_GetCastlingRights_KingMoves_TeamLosesBothRights(self):
+        self.chessBoard.ClearSquare(BoardPoints(4, 1))
+        self.chessBoard.MakeMove(BoardPoints(4, 0), BoardPoints(4, 1))
+
+        self.assertFalse(self.chessBoard.HasCastlingRight(TeamEnum.White, True))
+        self.assertFalse(self.chessBoard.HasCastlingRight(TeamEnum.White, False))
+        self.assertTrue(self.chessBoard.HasCastlingRight(TeamEnum.Black, True))
+
+        self.chessBoard.UnmakeMove()
+        self.assertTrue(self.chessBoard.HasCastlingRight(TeamEnum.White, True))
+        self.assertTrue(self.chessBoard.HasCastlingRight(TeamEnum.White, False))
+
+    def test_GetCastlingRights_RookCaptured_SideLost(self):
+        self.chessBoard.UpdatePieceOnBoard(Bishop(TeamEnum.Black, BoardPoints(6, 1)))
+        self.chessBoard.SetTeamsTurn(TeamEnum.Black)
+        self.chessBoard.MakeMove(BoardPoints(6, 1), BoardPoints(7, 0))
+
+        self.assertFalse(self.chessBoard.HasCastlingRight(TeamEnum.White, True))
+        self.assertTrue(self.chessBoard.HasCastlingRight(TeamEnum.White, False))
+
+    def test_GetCastlingRights_PiecesPlacedDirectly_WorkedOutFromPieces(self):
+        self.chessBoard.RemoveAllPieces()
+        self.assertEqual(0, self.chessBoard.GetCastlingRights())
+
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(4, 0)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(0, 0)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(4, 7)))
+
+        self.assertEqual(Board.Zobrist.WHITE_QUEEN_SIDE_CASTLE, self.chessBoard.GetCastlingRights())
+
+    def test_GetCastlingRook_NoRookOnCorner_ReturnsNone(self):
+        self.assertIsInstance(self.chessBoard.GetCastlingRook(TeamEnum.Black, True), Rook)
+        self.chessBoard.ClearSquare(BoardPoints(7, 7))
+        self.assertIsNone(self.chessBoard.GetCastlingRook(TeamEnum.Black, True))
+
+    # endregion
+
+    # region Repetition tests
+
+    def test_GetRepetitionCount_MakeAndUnmakeMove_CountsRestored(self):
+        self.assertEqual(1, self.chessBoard.GetRepetitionCount())
+
+        knightMoves = ((BoardPoints(6, 0), BoardPoints(5, 2)), (BoardPoints(6, 7), BoardPoints(5, 5)),
+                       (BoardPoints(5, 2), BoardPoints(6, 0)), (BoardPoints(5, 5), BoardPoints(6, 7)))
+        for fromCoord, toCoord in knightMoves:
+            self.chessBoard.MakeMove(fromCoord, toCoord)
+        self.assertEqual(2, self.chessBoard.GetRepetitionCount())
+
+        self.chessBoard.UnmakeMove()
+        self.assertEqual(1, self.chessBoard.GetRepetitionCount())
+
+        # Back to the start, a pawn move then starts a new window
+        for _ in range(3):
+            self.chessBoard.UnmakeMove()
+        self.chessBoard.MakeMove(BoardPoints(4, 1), BoardPoints(4, 3))
+        self.chessBoard.UnmakeMove()
+        self.assertEqual(1, self.chessBoard.GetRepetitionCount())
+
+    # endregion
+
+    # region LoadFen tests
+
+    def test_LoadFen_RoundTripsThroughGetFenRepresentation(self):
+        for fen in ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                    "r3k2r/8/8/8/8/8/8/R3K2R b Kq - 0 1",
+                    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 17 12"):
+            with self.subTest(fen=fen):
+                self.assertTrue(self.chessBoard.LoadFen(fen))
+                self.assertEqual(fen, self.chessBoard.GetFenRepresentation())
+
+    def test_LoadFen_BuildsBoardAndBitboards(self):
+        self.assertTrue(self.chessBoard.LoadFen("4k3/8/8/8/8/8/3P4/4K2R b K - 0 5"))
+
+        self.assertEqual(TeamEnum.Black, self.chessBoard.GetTeamsTurn())
+        rook = self.chessBoard.GetPieceAtCoordinate(BoardPoints(7, 0))
+        self.assertEqual(PieceEnums.Rook, rook.GetPieceEnum())
+        self.assertEqual(BoardPoints(7, 0), rook.GetCoordinates())
+        self.assertEqual(4, Bitboard.PopCount(self.chessBoard.GetBitboard().GetOccupancy()))
+        self.assertEqual(0, len(self.chessBoard.GetHistoricalMoves()))
+        self.assertEqual(4, self.chessBoard.GetHistory().GetNumberofTurns())
+
+    def test_LoadFen_EnPassantSquareSetWithoutHistory(self):
+        fen = "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 2"
+        self.assertTrue(self.chessBoard.LoadFen(fen))
+
+        self.assertIsNone(self.chessBoard.GetLastHistoricalMove())
+        self.assertEqual(BoardPoints(5, 5).GetIndex(), self.chessBoard.GetEnPassantSquare())
+        self.assertEqual(fen, self.chessBoard.GetFenRepresentation())
+
+        # Capturing en passant is one of white's moves
+        self.assertTrue(self.chessBoard.MakeMove(BoardPoints(4, 4), BoardPoints(5, 5)))
+        self.assertEqual(EMPTY_SQUARE, self.chessBoard.GetPieceAtCoordinate(BoardPoints(5, 4)))
+
+    def test_LoadFen_ClocksOptional(self):
+        self.assertTrue(self.chessBoard.LoadFen("4k3/8/8/8/8/8/8/4K3 w - -"))
+        self.assertEqual("4k3/8/8/8/8/8/8/4K3 w - - 0 1", self.chessBoard.GetFenRepresentation())
+
+    def test_LoadFen_HalfMoveClockAtDrawLimit_Loads(self):
+        fen = "4k3/8/8/8/8/8/8/4K3 w - - " + str(Miscellaneous.Constants.DRAW_CONDITION_TOTAL_MOVES) + " 90"
+        self.assertTrue(self.chessBoard.LoadFen(fen))
+        self.assertEqual(fen, self.chessBoard.GetFenRepresentation())
+
+    def test_LoadFen_SideToMoveInCheck_Loads(self):
+        self.assertTrue(self.chessBoard.LoadFen("k6R/8/8/8/8/8/8/K7 b - - 0 1"))
+        self.assertTrue(BoardHelpers.IsInCheck(self.chessBoard, TeamEnum.Black))
+
+    def test_LoadFen_CheckBlocked_Loads(self):
+        self.assertTrue(self.chessBoard.LoadFen("k7/1p6/8/8/8/8/8/K6B w - - 0 1"))
+        self.assertTrue(self.chessBoard.LoadFen("k7/p7/8/8/8/8/8/R6K w - - 0 1"))
+
+    def test_LoadFen_InvalidFen_ReturnsFalseAndBoardUnchanged(self):
+        fenBeforeLoad = self.chessBoard.GetFenRepresentation()
+        invalidFens = ("",
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1",      # seven ranks
+                       "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",  # rank too long
+                       "rnbqkbnr/pppppppp/44/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",  # consecutive digits
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNX w KQkq - 0 1",  # unknown piece
+                       "rnbqqbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",  # no black King
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNP w KQkq - 0 1",  # pawn on the first rank
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1",  # side to move
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBN1 w KQkq - 0 1",  # no rook to castle with
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KKkq - 0 1",  # duplicate right
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq e6 0 1",  # no pawn for en passant
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - a 1",  # clock not a number
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - \u00b2 1",  # not an ASCII digit
+                       "rnbqkbnr/pppppppp/\u00b2/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",  # not an ASCII digit
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 70000 1",  # half move clock overflow
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 151 1",  # past the draw limit
+                       "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 0",  # full moves start at 1
+                       "k6R/8/8/8/8/8/8/K7 w - - 0 1",  # side not to move in check
+                       "k7/8/8/8/8/8/8/K6B w - - 0 1",  # side not to move in check along a diagonal
+                       "k7/1P6/8/8/8/8/8/K7 w - - 0 1",  # side not to move in check from a pawn
+                       "k7/8/1N6/8/8/8/8/K7 w - - 0 1",  # side not to move in check from a knight
+                       "k7/8/8/8/8/8/8/8 w - - 0 1",  # no white King
+                       "k7/8/8/8/8/8/8/K6K w - - 0 1")  # two white Kings
+
+        for fen in invalidFens:
+            with self.subTest(fen=fen):
+                self.assertFalse(self.chessBoard.LoadFen(fen))
+                self.assertEqual(fenBeforeLoad, self.chessBoard.GetFenRepresentation())
+
+    # endregion
@@ -3,7 +3,7 @@ from Board.Movement import Movement
 from Board.History import History
 from Pieces.Rook import Rook
 from Pieces.Pawn import Pawn
-from Miscellaneous.Constants import TeamEnum
+from Miscellaneous.Constants import TeamEnum, PieceEnums
 from Miscellaneous.BoardPoints import BoardPoints
 
 
@@ -40,10 +40,131 @@ class TestHistory(unittest.TestCase):
         move2Pawn = Pawn(TeamEnum.White, BoardPoints(3,3))
 
         # Start methods
-        move1 = Movement(move1Rook.GetPieceEnum(), move1Rook.GetPieceEnum(), move1Pawn.GetPieceEnum(), move1Rook.GetCoordinates(), move1Pawn.GetCoordinates(), None)
-        move2 = Movement(move2Rook.GetPieceEnum(), move2Rook.GetPieceEnum(), move2Pawn.GetPieceEnum(), move2Rook.GetCoordinates(), move2Pawn.GetCoordinates(), None)
+        move1 = Movement(move1Rook.GetTeam(), move1Rook.GetPieceEnum(), move1Pawn.GetPieceEnum(), move1Rook.GetCoordinates(), move1Pawn.GetCoordinates(), None)
+        move2 = Movement(move2Rook.GetTeam(), move2Rook.GetPieceEnum(), move2Pawn.GetPieceEnum(), move2Rook.GetCoordinates(), move2Pawn.GetCoordinates(), None)
         hist.AppendMovement(move1)
         hist.AppendMovement(move2)
 
         underlyingStructure = [move1, move2]
         self.assertEqual(underlyingStructure, hist.GetHistoricalMoves())
+
+    def test_RemoveLastMovement_InverseOfAppendMovement(self):
+        hist = History()
+        move1 = Movement(TeamEnum.White, PieceEnums.Pawn, PieceEnums.NoPiece, BoardPoints(0,1), BoardPoints(0,3), None)
+        move2 = Movement(TeamEnum.Black, PieceEnums.Pawn, PieceEnums.NoPiece, BoardPoints(0,6), BoardPoints(0,4), move1)
+        hist.AppendMovement(move1)
+        hist.AppendMovement(move2)
+
+        self.assertEqual(move2, hist.RemoveLastMovement())
+        self.assertEqual(move1, hist.GetLastMove())
+        self.assertEqual(0, hist.GetNumberofTurns())
+
+        hist.RemoveLastMovement()
+        self.assertEqual(None, hist.RemoveLastMovement())
+        self.assertEqual(0, len(hist.GetHistoricalMoves()))
+
+    def test_AppendPosition_CountsOccurrences(self):
+        hist = History()
+
+        self.assertEqual(0, hist.GetRepetitionCount())
+        self.assertEqual(1, hist.AppendPosition(100, True))
+        self.assertEqual(1, hist.AppendPosition(200, False))
+        self.assertEqual(2, hist.AppendPosition(100, False))
+        self.assertEqual(2, hist.GetRepetitionCount())
+
+    def test_AppendPosition_Irreversible_EarlierPositionsNotCounted(self):
+        hist = History()
+        hist.AppendPosition(100, True)
+        hist.AppendPosition(200, False)
+
+        self.assertEqual(1, hist.AppendPosition(100, True))
+
+    def test_RemoveLastPosition_InverseOfAppendPosition(self):
+        hist = History()
+        hist.AppendPosition(100, True)
+        hist.AppendPosition(200, False)
+        hist.AppendPosition(100, True)
+
+        self.assertEqual(100, hist.RemoveLastPosition())
+        self.assertEqual(1, hist.GetRepetitionCount())
+
+        # Earlier window restored, the next occurrence of 100 is its second
+        self.assertEqual(2, hist.AppendPosition(100, False))
+
+        hist.Clear()
+        self.assertEqual(None, hist.RemoveLastPosition())
+        self.assertEqual(0, hist.GetRepetitionCount())
+
+    def test_GetHalfMoveClock_ResetByPawnMovesAndCaptures(self):
+        hist = History()
+        knightMove = Movement(TeamEnum.White, PieceEnums.Knight, PieceEnums.NoPiece, BoardPoints(1,0), BoardPoints(2,2), None)
+        pawnMove = Movement(TeamEnum.Black, PieceEnums.Pawn, PieceEnums.NoPiece, BoardPoints(0,6), BoardPoints(0,5), None)
+        captureMove = Movement(TeamEnum.White, PieceEnums.Knight, PieceEnums.Pawn, BoardPoints(2,2), BoardPoints(3,4), None)
+
+        hist.AppendMovement(knightMove)
+        hist.AppendMovement(knightMove)
+        self.assertEqual(2, hist.GetHalfMoveClock())
+
+        hist.AppendMovement(pawnMove)
+        self.assertEqual(0, hist.GetHalfMoveClock())
+
+        hist.AppendMovement(knightMove)
+        hist.AppendMovement(captureMove)
+        self.assertEqual(0, hist.GetHalfMoveClock())
+
+    def test_GetHalfMoveClock_CastleCountsOnce(self):
+        hist = History()
+        kingMove = Movement(TeamEnum.White, PieceEnums.King, PieceEnums.NoPiece, BoardPoints(4,0), BoardPoints(6,0), None)
+        rookMove = Movement(TeamEnum.White, PieceEnums.Rook, PieceEnums.NoPiece, BoardPoints(7,0), BoardPoints(5,0), kingMove)
+        hist.AppendMovement(kingMove)
+        hist.AppendMovement(rookMove)
+
+        self.assertEqual(1, hist.GetHalfMoveClock())
+
+    def test_RemoveLastMovement_HalfMoveClockRestored(self):
+        hist = History()
+        knightMove = Movement(TeamEnum.White, PieceEnums.Knight, PieceEnums.NoPiece, BoardPoints(1,0), BoardPoints(2,2), None)
+        pawnMove = Movement(TeamEnum.Black, PieceEnums.Pawn, PieceEnums.NoPiece, BoardPoints(0,6), BoardPoints(0,5), None)
+        hist.AppendMovement(knightMove)
+        hist.AppendMovement(knightMove)
+        hist.AppendMovement(pawnMove)
+
+        hist.RemoveLastMovement()
+        self.assertEqual(2, hist.GetHalfMoveClock())
+
+    def test_RemoveLastMovement_LastMoveViewOfPreviousMove(self):
+        hist = History()
+        move1 = Movement(TeamEnum.White, PieceEnums.Knight, PieceEnums.NoPiece, BoardPoints(1,0), BoardPoints(2,2), None)
+        move2 = Movement(TeamEnum.Black, PieceEnums.Knight, PieceEnums.NoPiece, BoardPoints(1,7), BoardPoints(2,5), move1)
+        hist.AppendMovement(move1)
+        hist.AppendMovement(move2)
+        hist.RemoveLastMovement()
+
+        self.assertEqual(move1, hist.GetLastMove())
+        self.assertEqual(TeamEnum.White, hist.GetLastMove().GetTeamMoved())
+        self.assertEqual(1, len(hist))
+
+    def test_ToBytes_FromBytes_RoundTrip(self):
+        hist = History()
+        move1 = Movement(TeamEnum.White, PieceEnums.Pawn, PieceEnums.NoPiece, BoardPoints(4,1), BoardPoints(4,3), None)
+        move2 = Movement(TeamEnum.Black, PieceEnums.Knight, PieceEnums.NoPiece, BoardPoints(6,7), BoardPoints(5,5), move1)
+        move3 = Movement(TeamEnum.White, PieceEnums.Bishop, PieceEnums.Knight, BoardPoints(5,0), BoardPoints(5,5), move2)
+        for move in (move1, move2, move3):
+            hist.AppendMovement(move)
+
+        data = hist.ToBytes()
+        self.assertEqual(4 + 4 * 3, len(data))
+
+        restored = History.FromBytes(data)
+        self.assertEqual(hist, restored)
+        self.assertEqual([move1, move2, move3], restored.GetHistoricalMoves())
+        self.assertEqual(hist.GetNumberofTurns(), restored.GetNumberofTurns())
+        self.assertEqual(0, restored.GetHalfMoveClock())
+
+    def test_Equal_DifferentCapturedPiece_NotEqual(self):
+        hist1 = History()
+        hist2 = History()
+        hist1.AppendMovement(Movement(TeamEnum.White, PieceEnums.Rook, PieceEnums.Pawn, BoardPoints(0,0), BoardPoints(0,5), None))
+        hist2.AppendMovement(Movement(TeamEnum.White, PieceEnums.Rook, PieceEnums.Knight, BoardPoints(0,0), BoardPoints(0,5), None))
+
+        self.assertNotEqual(hist1, hist2)
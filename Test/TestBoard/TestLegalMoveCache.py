@@ -0,0 +1,96 @@
+import unittest
+from Board.LegalMoveCache import LegalMoveCache
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Pieces.NoPiece import NoPiece
+from Miscellaneous.Constants import TeamEnum
+from Miscellaneous.BoardPoints import BoardPoints
+
+
+class TestLegalMoveCache(unittest.TestCase):
+
+    def setUp(self):
+        history = History()
+        self.chessBoard = ChessBoard(history)
+
+    # region LegalMoveCache tests
+
+    def test_Get_MissingKey_ReturnsNoneAndCountsMiss(self):
+        cache = LegalMoveCache()
+        self.assertIsNone(cache.Get("key"))
+        self.assertEqual(0, cache.GetHits())
+        self.assertEqual(1, cache.GetMisses())
+
+    def test_Get_CachedKey_ReturnsEntryAndCountsHit(self):
+        cache = LegalMoveCache()
+        cache.Put("key", "entry")
+        self.assertEqual("entry", cache.Get("key"))
+        self.assertEqual(1, cache.GetHits())
+        self.assertEqual(0, cache.GetMisses())
+
+    def test_Put_OverMaximumSize_EvictsLeastRecentlyUsed(self):
+        cache = LegalMoveCache(2)
+        cache.Put("first", 1)
+        cache.Put("second", 2)
+
+        # Touching the first entry makes the second the least recently used
+        cache.Get("first")
+        cache.Put("third", 3)
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.Get("first"))
+        self.assertIsNone(cache.Get("second"))
+        self.assertEqual(3, cache.Get("third"))
+
+    def test_Clear_RemovesEntriesAndCounters(self):
+        cache = LegalMoveCache()
+        cache.Put("key", "entry")
+        cache.Get("key")
+        cache.Clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.GetHits())
+        self.assertEqual(0, cache.GetMisses())
+
+    # endregion
+
+    # region ChessBoard.GetCachedLegalMoves tests
+
+    def test_GetCachedLegalMoves_StartingPosition(self):
+        legalMoves, isInCheck = self.chessBoard.GetCachedLegalMoves(TeamEnum.White)
+
+        self.assertEqual(20, len(legalMoves))
+        self.assertIn((BoardPoints(4, 1), BoardPoints(4, 3)), legalMoves)
+        self.assertFalse(isInCheck)
+
+    def test_GetCachedLegalMoves_SamePositionTwice_SecondIsHit(self):
+        cache = self.chessBoard.GetLegalMoveCache()
+        firstLegalMoves = self.chessBoard.GetCachedLegalMoves(TeamEnum.White)
+        secondLegalMoves = self.chessBoard.GetCachedLegalMoves(TeamEnum.White)
+
+        self.assertIs(firstLegalMoves, secondLegalMoves)
+        self.assertEqual(1, cache.GetHits())
+        self.assertEqual(1, cache.GetMisses())
+
+    def test_GetCachedLegalMoves_BoardMutated_Regenerated(self):
+        cache = self.chessBoard.GetLegalMoveCache()
+        self.chessBoard.GetCachedLegalMoves(TeamEnum.White)
+
+        # Removing the king's pawn frees the King, Queen and Bishop
+        self.chessBoard.UpdatePieceOnBoard(NoPiece(BoardPoints(4, 1)))
+        legalMoves, _ = self.chessBoard.GetCachedLegalMoves(TeamEnum.White)
+
+        self.assertEqual(2, cache.GetMisses())
+        self.assertIn((BoardPoints(4, 0), BoardPoints(4, 1)), legalMoves)
+
+    def test_GetCachedLegalMoves_MakeAndUnmakeMove_HitsOriginalEntry(self):
+        cache = self.chessBoard.GetLegalMoveCache()
+        self.chessBoard.GetCachedLegalMoves(TeamEnum.White)
+
+        self.chessBoard.MakeMove(BoardPoints(4, 1), BoardPoints(4, 3))
+        self.chessBoard.UnmakeMove()
+        self.chessBoard.GetCachedLegalMoves(TeamEnum.White)
+
+        self.assertEqual(1, cache.GetHits())
+
+    # endregion
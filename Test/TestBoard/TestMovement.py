@@ -69,3 +69,32 @@ class TestMovement(unittest.TestCase):
 
         expectedYMovement = 3
         self.assertEqual(move1.GetYMovement(), expectedYMovement)
+
+    def test_GetPackedMove_FromToAndFlagPacked(self):
+        move = Movement(TeamEnum.White, PieceEnums.Pawn, PieceEnums.NoPiece, BoardPoints(4,1), BoardPoints(4,3), None)
+
+        self.assertEqual(12 | (28 << 6) | (Movement.TwoStepPawnFlag << 12), move.GetPackedMove())
+        self.assertTrue(move.IsTwoStepPawnMove())
+        self.assertEqual(BoardPoints(4,1), move.GetFromCoord())
+        self.assertEqual(BoardPoints(4,3), move.GetToCoord())
+
+    def test_GetFlag_CastleSides(self):
+        kingSide = Movement(TeamEnum.Black, PieceEnums.King, PieceEnums.NoPiece, BoardPoints(4,7), BoardPoints(6,7), None)
+        queenSide = Movement(TeamEnum.Black, PieceEnums.King, PieceEnums.NoPiece, BoardPoints(4,7), BoardPoints(2,7), None)
+
+        self.assertEqual(Movement.KingSideCastleFlag, kingSide.GetFlag())
+        self.assertEqual(Movement.QueenSideCastleFlag, queenSide.GetFlag())
+
+    def test_IsPromotionMove_PawnCapturingOnLastRank_PromotionAndCapture(self):
+        move = Movement(TeamEnum.White, PieceEnums.Pawn, PieceEnums.Rook, BoardPoints(1,6), BoardPoints(0,7), None)
+
+        self.assertTrue(move.IsPromotionMove())
+        self.assertTrue(move.IsCaptureMove())
+        self.assertFalse(move.IsEnPassantMove())
+
+    def test_FromPackedMove_EqualToOriginal(self):
+        move = Movement(TeamEnum.White, PieceEnums.Knight, PieceEnums.Pawn, BoardPoints(2,2), BoardPoints(3,4), None)
+        view = Movement.FromPackedMove(move.GetPackedMove(), TeamEnum.White, PieceEnums.Knight, PieceEnums.Pawn)
+
+        self.assertEqual(move, view)
+        self.assertTrue(view.IsCaptureMove())
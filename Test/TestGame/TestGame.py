@@ -249,6 +249,20 @@ class TestGame(unittest.TestCase):
         self.assertTrue(self.Game.GetIsDraw())
         self.assertTrue(self.Game.GetHasGameEnded())
 
+    def test_Move_ValidMove_PositionStatusForTeamToMove(self):
+
+        self.assertIsNone(self.Game.GetPositionStatus())
+
+        self.Game.Move("E2", "E4")
+
+        positionStatus = self.Game.GetPositionStatus()
+        self.assertEqual(TeamEnum.Black, positionStatus.Team)
+        self.assertEqual(20, positionStatus.LegalMoveCount)
+        self.assertFalse(positionStatus.HasGameEnded())
+
+        self.Game.ResetGame()
+        self.assertIsNone(self.Game.GetPositionStatus())
+
     # endregion
 
     # region GetFenRepresentation Tests
@@ -257,7 +271,7 @@ class TestGame(unittest.TestCase):
 
         self.Game.Move("c2", "c4")
         actualFenRep = self.Game.GetFenRepresentation()
-        expectedFenRep = "rnbqkbnr/pppppppp/8/8/2P5/8/PP1PPPPP/RNBQKBNR b KQkq c3 0 0"
+        expectedFenRep = "rnbqkbnr/pppppppp/8/8/2P5/8/PP1PPPPP/RNBQKBNR b KQkq c3 0 1"
 
         self.assertEqual(expectedFenRep, actualFenRep)
 
@@ -274,9 +288,106 @@ class TestGame(unittest.TestCase):
         self.Game.Move("d2", "e1")
         self.Game.Move("d7", "e8")
         actualFenRep = self.Game.GetFenRepresentation()
-        expectedFenRep = "rnbqkbnr/ppp1pppp/8/3p4/3P4/8/PPP1PPPP/RNBQKBNR w - - 0 3"
+        expectedFenRep = "rnbqkbnr/ppp1pppp/8/3p4/3P4/8/PPP1PPPP/RNBQKBNR w - - 4 4"
         self.assertEqual(expectedFenRep, actualFenRep)
 
+    def test_GetFenRepresentation_RookMoved_OnlyThatSideLosesCastling(self):
+
+        self.Game.Move("h2", "h4")
+        self.Game.Move("a7", "a5")
+        self.Game.Move("h1", "h3")
+        self.Game.Move("a8", "a6")
+        actualFenRep = self.Game.GetFenRepresentation()
+        expectedFenRep = "1nbqkbnr/1ppppppp/r7/p7/7P/7R/PPPPPPP1/RNBQKBN1 w Qk - 2 3"
+        self.assertEqual(expectedFenRep, actualFenRep)
+
+    def test_GetFenRepresentation_UnchangedBoard_ReturnsMemoisedFen(self):
+
+        firstFenRep = self.Game.GetFenRepresentation()
+        self.assertIs(firstFenRep, self.Game.GetFenRepresentation())
+
+        self.Game.Move("e2", "e4")
+        self.assertEqual("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1",
+                         self.Game.GetFenRepresentation())
+
+    def test_GetFenRepresentation_NoKing_EmptyString(self):
+
+        self.Game.GetBoard().UpdatePieceOnBoard(NoPiece(BoardPoints(4, 7)))
+        self.assertEqual("", self.Game.GetFenRepresentation())
+
+    # endregion
+
+    # region Repetition tests
+
+    def ShuffleKnights(self, times):
+        for _ in range(times):
+            self.Game.Move("G1", "F3")
+            self.Game.Move("G8", "F6")
+            self.Game.Move("F3", "G1")
+            self.Game.Move("F6", "G8")
+
+    def test_Move_ThreefoldRepetition_DrawCanBeClaimed(self):
+
+        self.assertFalse(self.Game.ClaimDraw())
+
+        # Starting position for the third time
+        self.ShuffleKnights(2)
+
+        self.assertEqual(3, self.Game.GetBoard().GetRepetitionCount())
+        self.assertFalse(self.Game.GetIsDraw())
+        self.assertTrue(self.Game.GetPositionStatus().CanClaimDrawByRepetition)
+
+        self.assertTrue(self.Game.ClaimDraw())
+        self.assertTrue(self.Game.GetIsDraw())
+        self.assertTrue(self.Game.GetHasGameEnded())
+
+    def test_Move_FivefoldRepetition_IsDrawTrue(self):
+
+        self.ShuffleKnights(3)
+        self.assertFalse(self.Game.GetIsDraw())
+
+        self.ShuffleKnights(1)
+        self.assertEqual(5, self.Game.GetBoard().GetRepetitionCount())
+        self.assertTrue(self.Game.GetIsDraw())
+        self.assertTrue(self.Game.GetPositionStatus().IsDrawByRepetition)
+        self.assertTrue(self.Game.GetHasGameEnded())
+
+    def test_Move_PawnMoveBetweenRepetitions_NotCounted(self):
+
+        self.ShuffleKnights(1)
+        self.Game.Move("E2", "E4")
+        self.Game.Move("E7", "E5")
+        self.ShuffleKnights(1)
+
+        self.assertEqual(2, self.Game.GetBoard().GetRepetitionCount())
+        self.assertFalse(self.Game.GetPositionStatus().CanClaimDrawByRepetition)
+
+    # endregion
+
+    # region LoadFen tests
+
+    def test_LoadFen_CheckmatePosition_GameEnded(self):
+
+        self.assertTrue(self.Game.LoadFen("7k/6Q1/5K2/8/8/8/8/8 b - - 0 30"))
+
+        self.assertTrue(self.Game.GetIsInCheckmate())
+        self.assertTrue(self.Game.GetHasGameEnded())
+        self.assertEqual(MoveEnum.GameEnded, self.Game.Move("H8", "G8").GetStatusCode())
+
+    def test_LoadFen_ThenMove_GameContinues(self):
+
+        self.Game.Move("E2", "E4")
+        self.assertTrue(self.Game.LoadFen("4k3/8/8/8/8/8/8/R3K3 w Q - 0 10"))
+
+        moveResult = self.Game.Move("E1", "C1")
+        self.assertTrue(moveResult.IsSuccessful())
+        self.assertEqual("4k3/8/8/8/8/8/8/2KR4 b - - 1 10", self.Game.GetFenRepresentation())
+
+    def test_LoadFen_InvalidFen_ReturnsFalse(self):
+
+        self.assertFalse(self.Game.LoadFen("not a fen"))
+        self.assertFalse(self.Game.GetHasGameEnded())
+
     # endregion
 
     # region Miscellaneous tests
@@ -1,4 +1,6 @@
 import unittest
+import copy
+import pickle
 import Miscellaneous.BoardPoints
 from Miscellaneous.BoardPoints import BoardPoints
 
@@ -34,3 +36,28 @@ class TestPoints(unittest.TestCase):
         boardPointB = BoardPoints(3,6)
         self.assertLess(boardPointA, boardPointB)
 
+
+    def test_Init_SameSquare_ReturnsInternedInstance(self):
+        self.assertIs(BoardPoints(3, 6), BoardPoints(3, 6))
+        self.assertIs(BoardPoints(-5, 5), BoardPoints(5, -5))
+
+    def test_Hash_UsableAsSetKey(self):
+        squares = {BoardPoints(1, 2), BoardPoints(1, 2), BoardPoints(2, 1)}
+        self.assertEqual(2, len(squares))
+        self.assertIn(BoardPoints(2, 1), squares)
+
+    def test_GetIndex_RoundTripsWithFromIndex(self):
+        boardPoint = BoardPoints(3, 6)
+        self.assertEqual(51, boardPoint.GetIndex())
+        self.assertIs(boardPoint, BoardPoints.FromIndex(51))
+        self.assertIsNone(Miscellaneous.BoardPoints.BOARD_POINTS_UNDEFINED.GetIndex())
+
+    def test_CopyAndPickle_ReturnInternedInstance(self):
+        boardPoint = BoardPoints(7, 0)
+        self.assertIs(boardPoint, copy.copy(boardPoint))
+        self.assertIs(boardPoint, copy.deepcopy(boardPoint))
+        self.assertIs(boardPoint, pickle.loads(pickle.dumps(boardPoint)))
+
+    def test_NewAttribute_RaisesAttributeError(self):
+        with self.assertRaises(AttributeError):
+            BoardPoints(0, 0).someAttribute = 1
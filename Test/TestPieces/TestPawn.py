@@ -18,13 +18,13 @@ class TestPawn(unittest.TestCase):
     # region Tests of IBase methods
     # IBasePiece methods tested only in this class as they require implementations of abstract methods
 
-    def test_IBasePiece_Constructor_HistorySetToInitialCoordinate(self):
+    def test_IBasePiece_Constructor_NotMoved(self):
         pawnCoordinate = BoardPoints(2,2)
         pawn = Pawn(TeamEnum.White, pawnCoordinate)
 
-        expectedHistoryLength = 1
-        self.assertEqual(len(pawn.GetHistory()), expectedHistoryLength)
-        self.assertEqual(pawn.GetHistory()[0], pawnCoordinate)
+        self.assertEqual(0, pawn.GetMoveCount())
+        self.assertFalse(pawn.HasMoved())
+        self.assertEqual(pawnCoordinate, pawn.GetCoordinates())
 
     def test_IBasePiece_CanMove_ToMovePointUndefined_ReturnsFalse(self):
         pawnCoordinate = BoardPoints(2, 1)
@@ -82,9 +82,9 @@ class TestPawn(unittest.TestCase):
         hasMoved = pawn.Move(self.chessBoard, toMoveCoordinate)
 
         self.assertFalse(hasMoved)
-        # Verify History is still unmodified and that coordinate is still unmoved
+        # Verify move count is still unmodified and that coordinate is still unmoved
         self.assertEqual(coordinatePrevMove, pawn.GetCoordinates())
-        self.assertEqual(1, len(pawn.GetHistory()))
+        self.assertEqual(0, pawn.GetMoveCount())
 
     def test_IBasePiece_Move_ValidMove_ReturnsTrue(self):
         pawnCoordinate = BoardPoints(2, 1)
@@ -96,7 +96,7 @@ class TestPawn(unittest.TestCase):
 
         self.assertTrue(hasMoved)
         self.assertEqual(toMoveCoordinate, pawn.GetCoordinates())
-        self.assertEqual(2, len(pawn.GetHistory()))
+        self.assertEqual(1, pawn.GetMoveCount())
 
     def test_IBasePiece_ForceMove_ReturnsTrue(self):
         pawnCoordinate = BoardPoints(2, 1)
@@ -109,7 +109,7 @@ class TestPawn(unittest.TestCase):
 
         self.assertTrue(hasMoved)
         self.assertEqual(toMoveCoordinate, pawn.GetCoordinates())
-        self.assertEqual(2, len(pawn.GetHistory()))
+        self.assertEqual(1, pawn.GetMoveCount())
 
     def test_IBasePiece_ForceMoveNoHistory_ReturnsTrue(self):
         pawnCoordinate = BoardPoints(2, 1)
@@ -122,7 +122,19 @@ class TestPawn(unittest.TestCase):
 
         self.assertTrue(hasMoved)
         self.assertEqual(toMoveCoordinate, pawn.GetCoordinates())
-        self.assertEqual(1, len(pawn.GetHistory()))
+        self.assertEqual(0, pawn.GetMoveCount())
+
+    def test_IBasePiece_RevertLastCoordinates_RestoresCoordinatesAndMoveCount(self):
+        pawnCoordinate = BoardPoints(2, 1)
+        pawn = self.chessBoard.GetPieceAtCoordinate(pawnCoordinate)
+
+        pawn.ForceMove(BoardPoints(2, 3))
+        self.assertTrue(pawn.HasMoved())
+
+        pawn.RevertLastCoordinates(pawnCoordinate)
+
+        self.assertEqual(pawnCoordinate, pawn.GetCoordinates())
+        self.assertFalse(pawn.HasMoved())
 
     # end region
 
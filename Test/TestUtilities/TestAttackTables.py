@@ -0,0 +1,55 @@
+import unittest
+import Utilities.AttackTables
+from Miscellaneous.BoardPoints import BoardPoints
+from Miscellaneous.Constants import TeamEnum
+
+
+class TestAttackTables(unittest.TestCase):
+
+    # region Table construction tests
+
+    def test_SquarePoints_MatchSquareIndexing(self):
+        point = Utilities.AttackTables.SQUARE_POINTS[Utilities.AttackTables.GetSquare(BoardPoints(5, 3))]
+        self.assertEqual(point, BoardPoints(5, 3))
+
+    def test_KnightRays_Corner_TwoMoves(self):
+        rays = Utilities.AttackTables.KNIGHT_RAYS[Utilities.AttackTables.GetSquare(BoardPoints(0, 0))]
+        squares = [square for ray in rays for square in ray]
+        self.assertEqual(sorted(squares), [10, 17])
+
+    def test_KingRays_Centre_EightMoves(self):
+        rays = Utilities.AttackTables.KING_RAYS[Utilities.AttackTables.GetSquare(BoardPoints(4, 4))]
+        self.assertEqual(sum(len(ray) for ray in rays), 8)
+
+    def test_RookRays_Corner_FourteenSquares(self):
+        rays = Utilities.AttackTables.ROOK_RAYS[Utilities.AttackTables.GetSquare(BoardPoints(0, 0))]
+        self.assertEqual(sum(len(ray) for ray in rays), 14)
+
+    def test_BishopRays_RayIsOrderedOutwards(self):
+        rays = Utilities.AttackTables.BISHOP_RAYS[Utilities.AttackTables.GetSquare(BoardPoints(2, 0))]
+        # (1, 1) direction from C1
+        self.assertEqual(rays[0], (11, 20, 29, 38, 47))
+
+    def test_PawnRays_StartingRow_TwoSquarePush(self):
+        whiteRays = Utilities.AttackTables.PAWN_RAYS[TeamEnum.White][Utilities.AttackTables.GetSquare(BoardPoints(4, 1))]
+        blackRays = Utilities.AttackTables.PAWN_RAYS[TeamEnum.Black][Utilities.AttackTables.GetSquare(BoardPoints(4, 6))]
+        self.assertEqual(whiteRays[0], (20, 28))
+        self.assertEqual(blackRays[0], (44, 36))
+
+    def test_PawnRays_EdgeFile_SingleDiagonal(self):
+        rays = Utilities.AttackTables.PAWN_RAYS[TeamEnum.White][Utilities.AttackTables.GetSquare(BoardPoints(0, 3))]
+        self.assertEqual(rays, ((32,), (), (33,)))
+
+    # endregion
+
+    # region GetRay tests
+
+    def test_GetRay_StandardDirection_MatchesTable(self):
+        point = BoardPoints(3, 3)
+        rookRays = Utilities.AttackTables.ROOK_RAYS[Utilities.AttackTables.GetSquare(point)]
+        self.assertEqual(Utilities.AttackTables.GetRay(point, 0, 1), rookRays[1])
+
+    def test_GetRay_NonStandardDirection_BuiltOnDemand(self):
+        self.assertEqual(Utilities.AttackTables.GetRay(BoardPoints(0, 0), 3, 0), (3, 6))
+
+    # endregion
@@ -0,0 +1,94 @@
+import unittest
+from Utilities.BatchAnalysis import BatchAnalysis
+from Utilities.BoardHelpers import BoardHelpers
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Miscellaneous.Constants import TeamEnum, PieceEnums
+
+
+@unittest.skipUnless(BatchAnalysis.IsAvailable(), "NumPy is not installed")
+class TestBatchAnalysis(unittest.TestCase):
+
+    Fens = ["rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1",
+            "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w - - 0 1",
+            "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+            "4k3/8/8/8/8/8/4q3/4K3 w - - 0 1",
+            "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w - - 0 1"]
+
+    def setUp(self):
+        self.boards = []
+        for fen in TestBatchAnalysis.Fens:
+            board = ChessBoard(History())
+            board.LoadFen(fen)
+            self.boards.append(board)
+        self.codes = BatchAnalysis.EncodeBoards(self.boards)
+
+    @staticmethod
+    def GetPseudoLegalMoveCount(board, team):
+        moveCount = 0
+        for square in range(64):
+            piece = board.GetPieceAtSquare(square)
+            if piece.GetTeam() == team:
+                moveCount += len(piece.GetValidMoves(board, False))
+        return moveCount
+
+    def test_PlanesToCodes_RoundTrip(self):
+        planes = BatchAnalysis.CodesToPlanes(self.codes)
+        self.assertEqual((len(self.boards), 12, 8, 8), planes.shape)
+        self.assertTrue((BatchAnalysis.PlanesToCodes(planes) == self.codes).all())
+
+    def test_ToCodes_InvalidShape_RaisesValueError(self):
+        with self.assertRaises(ValueError):
+            BatchAnalysis.ToCodes(self.codes[:, :32])
+
+    def test_ToCodes_CodeOutOfRange_RaisesValueError(self):
+        for code in (-1, 13, 269):
+            with self.subTest(code=code):
+                codes = self.codes.astype(int)
+                codes[0, 20] = code
+                with self.assertRaises(ValueError):
+                    BatchAnalysis.ToCodes(codes)
+
+    def test_GetPieceCounts_StartingPosition(self):
+        pieceCounts = BatchAnalysis.GetPieceCounts(self.codes)
+        whitePawnPlane = BatchAnalysis.Planes.index((TeamEnum.White, PieceEnums.Pawn))
+        blackQueenPlane = BatchAnalysis.Planes.index((TeamEnum.Black, PieceEnums.Queen))
+
+        self.assertEqual(8, pieceCounts[0, whitePawnPlane])
+        self.assertEqual(1, pieceCounts[0, blackQueenPlane])
+        self.assertEqual(32, pieceCounts[0].sum())
+
+    def test_GetAttackMasks_MatchesIsSquareAttacked(self):
+        for team in (TeamEnum.White, TeamEnum.Black):
+            attackMasks = BatchAnalysis.GetAttackMasks(self.codes, team)
+            for index, board in enumerate(self.boards):
+                expected = [BoardHelpers.IsSquareAttacked(board, square, team) for square in range(64)]
+                self.assertEqual(expected, attackMasks[index].tolist())
+
+    def test_GetCheckFlags_MatchesIsInCheck(self):
+        for team in (TeamEnum.White, TeamEnum.Black):
+            checkFlags = BatchAnalysis.GetCheckFlags(self.codes, team)
+            expected = [BoardHelpers.IsInCheck(board, team) for board in self.boards]
+            self.assertEqual(expected, checkFlags.tolist())
+
+        # The last two positions have the white King in check
+        self.assertEqual([False, False, False, True, True],
+                         BatchAnalysis.GetCheckFlags(self.codes, TeamEnum.White).tolist())
+
+    def test_GetMobility_MatchesPseudoLegalPieceMoves(self):
+        for team in (TeamEnum.White, TeamEnum.Black):
+            mobility = BatchAnalysis.GetMobility(self.codes, team)
+            expected = [TestBatchAnalysis.GetPseudoLegalMoveCount(board, team) for board in self.boards]
+            self.assertEqual(expected, mobility.tolist())
+
+        self.assertEqual(20, BatchAnalysis.GetMobility(self.codes, TeamEnum.White)[0])
+
+    def test_Constructor_PlanesInput_MatchesPerFunctionResults(self):
+        analysis = BatchAnalysis(BatchAnalysis.CodesToPlanes(self.codes))
+
+        self.assertTrue((analysis.Codes == self.codes).all())
+        self.assertTrue((analysis.PieceCounts == BatchAnalysis.GetPieceCounts(self.codes)).all())
+        for team in (TeamEnum.White, TeamEnum.Black):
+            self.assertTrue((analysis.AttackMasks[team] == BatchAnalysis.GetAttackMasks(self.codes, team)).all())
+            self.assertTrue((analysis.IsInCheck[team] == BatchAnalysis.GetCheckFlags(self.codes, team)).all())
+            self.assertTrue((analysis.Mobility[team] == BatchAnalysis.GetMobility(self.codes, team)).all())
@@ -138,7 +138,7 @@ class TestBoardHelpers(unittest.TestCase):
                                         BoardPoints(1,1),
                                         BoardPoints(2,2),
                                         None))
-        isDraw = BoardHelpers.IsDrawBySeventyFiveMovesEachRule(history.GetHistoricalMoves())
+        isDraw = BoardHelpers.IsDrawBySeventyFiveMovesEachRule(history)
         self.assertFalse(isDraw)
 
     def test_IsDrawBySeventyFiveMovesEachRule_MoreThanXMoves_CaptureMade_ReturnsFalse(self):
@@ -150,7 +150,7 @@ class TestBoardHelpers(unittest.TestCase):
                                             BoardPoints(1,1),
                                             BoardPoints(2,2),
                                             None))
-        isDraw = BoardHelpers.IsDrawBySeventyFiveMovesEachRule(history.GetHistoricalMoves())
+        isDraw = BoardHelpers.IsDrawBySeventyFiveMovesEachRule(history)
         self.assertFalse(isDraw)
 
     def test_IsDrawBySeventyFiveMovesEachRule_MoreThanXMoves_PawnMoves_ReturnsFalse(self):
@@ -162,7 +162,7 @@ class TestBoardHelpers(unittest.TestCase):
                                             BoardPoints(1,1),
                                             BoardPoints(2,2),
                                             None))
-        isDraw = BoardHelpers.IsDrawBySeventyFiveMovesEachRule(history.GetHistoricalMoves())
+        isDraw = BoardHelpers.IsDrawBySeventyFiveMovesEachRule(history)
         self.assertFalse(isDraw)
 
     def test_IsDrawBySeventyFiveMovesEachRule_MoreThanXMoves_NoCaptureOrPawnMoves_ReturnsTrue(self):
@@ -174,7 +174,7 @@ class TestBoardHelpers(unittest.TestCase):
                                             BoardPoints(1,1),
                                             BoardPoints(2,2),
                                             None))
-        isDraw = BoardHelpers.IsDrawBySeventyFiveMovesEachRule(history.GetHistoricalMoves())
+        isDraw = BoardHelpers.IsDrawBySeventyFiveMovesEachRule(history)
         self.assertTrue(isDraw)
 
     # endregion
@@ -290,6 +290,33 @@ class TestBoardHelpers(unittest.TestCase):
         isInCheck = BoardHelpers.IsInCheck(self.chessBoard, TeamEnum.White)
         self.assertTrue(isInCheck)
 
+    def test_IsInCheck_SliderBlocked_ReturnsFalse(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
+        self.chessBoard.UpdatePieceOnBoard(Pawn(TeamEnum.White, BoardPoints(1, 1)))
+        self.chessBoard.UpdatePieceOnBoard(Bishop(TeamEnum.Black, BoardPoints(2, 2)))
+        isInCheck = BoardHelpers.IsInCheck(self.chessBoard, TeamEnum.White)
+        self.assertFalse(isInCheck)
+
+    # endregion
+
+    # region IsSquareAttacked tests
+
+    def test_IsSquareAttacked_PawnAttacksForwardDiagonalsOnly(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(Pawn(TeamEnum.White, BoardPoints(3, 3)))
+        self.assertTrue(BoardHelpers.IsSquareAttacked(self.chessBoard, 4 * 8 + 2, TeamEnum.White))
+        self.assertTrue(BoardHelpers.IsSquareAttacked(self.chessBoard, 4 * 8 + 4, TeamEnum.White))
+        self.assertFalse(BoardHelpers.IsSquareAttacked(self.chessBoard, 4 * 8 + 3, TeamEnum.White))
+        self.assertFalse(BoardHelpers.IsSquareAttacked(self.chessBoard, 2 * 8 + 2, TeamEnum.White))
+
+    def test_IsSquareAttacked_DefaultBoard(self):
+        # Third rank is covered by white, fourth rank by nobody
+        self.assertTrue(BoardHelpers.IsSquareAttacked(self.chessBoard, 2 * 8 + 0, TeamEnum.White))
+        self.assertFalse(BoardHelpers.IsSquareAttacked(self.chessBoard, 3 * 8 + 0, TeamEnum.White))
+        self.assertFalse(BoardHelpers.IsSquareAttacked(self.chessBoard, 2 * 8 + 0, TeamEnum.Black))
+
     # endregion
 
     # region IsInCheckmate tests
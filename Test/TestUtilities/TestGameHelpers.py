@@ -1,6 +1,6 @@
 import unittest
 from Utilities.GameHelpers import GameHelpers
-from Miscellaneous.Constants import GameType, PlayerEnum
+from Miscellaneous.Constants import GameType, PlayerEnum, TeamEnum
 
 
 class TestGameHelpers(unittest.TestCase):
@@ -24,4 +24,14 @@ class TestGameHelpers(unittest.TestCase):
 
         self.assertFalse(GameHelpers.IsValidGameType(GameType.Unknown))
 
-    # endregion
\ No newline at end of file
+    # endregion
+
+    # region GetPgnResult Tests
+
+    def test_GetPgnResult_TestAllCases(self):
+        self.assertEqual("0-1", GameHelpers.GetPgnResult(True, False, TeamEnum.White))
+        self.assertEqual("1-0", GameHelpers.GetPgnResult(True, False, TeamEnum.Black))
+        self.assertEqual("1/2-1/2", GameHelpers.GetPgnResult(False, True, TeamEnum.White))
+        self.assertEqual("*", GameHelpers.GetPgnResult(False, False, TeamEnum.Black))
+
+    # endregion
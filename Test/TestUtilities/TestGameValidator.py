@@ -0,0 +1,113 @@
+import unittest
+from Utilities.GameValidator import GameValidator
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Game.Game import Game
+from Miscellaneous.Constants import TeamEnum
+from Miscellaneous.MoveMessages import MoveEnum
+
+
+class TestGameValidator(unittest.TestCase):
+
+    FoolsMate = ["f2f3", "e7e5", "g2g4", "d8h4"]
+
+    def setUp(self):
+        history = History()
+        self.Game = Game(ChessBoard(history))
+
+    # region ValidateGame tests
+
+    def test_ValidateGame_FoolsMate_LegalAndCheckmate(self):
+        result = GameValidator.ValidateGame(self.Game, TestGameValidator.FoolsMate, 3)
+
+        self.assertEqual(3, result.GameIndex)
+        self.assertTrue(result.IsLegal())
+        self.assertEqual(4, result.PlyCount)
+        self.assertTrue(result.IsCheckmate)
+        self.assertEqual(TeamEnum.White, result.TeamsTurn)
+        self.assertEqual("0-1", result.GetOutcome())
+        self.assertEqual("rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3", result.FinalFen)
+
+    def test_ValidateGame_IllegalMove_StopsAtFirstIllegalPly(self):
+        result = GameValidator.ValidateGame(self.Game, "e2e4 e7e5 e1e3 d7d5")
+
+        self.assertFalse(result.IsLegal())
+        self.assertEqual(2, result.FirstIllegalPly)
+        self.assertEqual(2, result.PlyCount)
+        self.assertEqual(MoveEnum.InvalidPieceCentricMove, result.StatusCode)
+        self.assertEqual("*", result.GetOutcome())
+        self.assertEqual("rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2", result.FinalFen)
+
+    def test_ValidateGame_MoveAfterCheckmate_Illegal(self):
+        result = GameValidator.ValidateGame(self.Game, TestGameValidator.FoolsMate + ["a2a3"])
+
+        self.assertEqual(4, result.FirstIllegalPly)
+        self.assertEqual(MoveEnum.GameEnded, result.StatusCode)
+        self.assertTrue(result.IsCheckmate)
+
+    def test_ValidateGame_GameReused_ResetBetweenGames(self):
+        GameValidator.ValidateGame(self.Game, TestGameValidator.FoolsMate)
+        result = GameValidator.ValidateGame(self.Game, ["e2e4"])
+
+        self.assertTrue(result.IsLegal())
+        self.assertFalse(result.IsCheckmate)
+        self.assertEqual("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1", result.FinalFen)
+
+    # endregion
+
+    # region PlayUciMove tests
+
+    def test_PlayUciMove_UnderPromotion_Rejected(self):
+        self.Game.LoadFen("8/4P3/8/8/8/8/k7/4K3 w - - 0 1")
+        self.assertEqual(MoveEnum.InvalidPieceCentricMove, GameValidator.PlayUciMove(self.Game, "e7e8n"))
+        self.assertEqual(MoveEnum.Success, GameValidator.PlayUciMove(self.Game, "e7e8q"))
+
+    def test_PlayUciMove_PawnReachesLastRankWithoutPromotion_Rejected(self):
+        self.Game.LoadFen("8/4P3/8/8/8/8/k7/4K3 w - - 0 1")
+        self.assertEqual(MoveEnum.InvalidPieceCentricMove, GameValidator.PlayUciMove(self.Game, "e7e8"))
+        self.assertEqual(MoveEnum.Success, GameValidator.PlayUciMove(self.Game, "e7e8Q"))
+
+    def test_PlayUciMove_PromotionSuffixOnNonPromotingMove_Rejected(self):
+        self.Game.LoadFen("k7/8/8/8/8/8/4P3/R3K3 w - - 0 1")
+        self.assertEqual(MoveEnum.InvalidPieceCentricMove, GameValidator.PlayUciMove(self.Game, "a1a8q"))
+        self.assertEqual(MoveEnum.InvalidPieceCentricMove, GameValidator.PlayUciMove(self.Game, "e2e4q"))
+        self.assertEqual(MoveEnum.Success, GameValidator.PlayUciMove(self.Game, "e2e4"))
+
+    def test_PlayUciMove_Malformed_Rejected(self):
+        self.assertEqual(MoveEnum.CoordOutOfRange, GameValidator.PlayUciMove(self.Game, "e2e"))
+        self.assertEqual(MoveEnum.CoordOutOfRange, GameValidator.PlayUciMove(self.Game, "e2e9"))
+        self.assertEqual(MoveEnum.CoordOutOfRange, GameValidator.PlayUciMove(self.Game, "z2e4"))
+        self.assertEqual(MoveEnum.CoordOutOfRange, GameValidator.PlayUciMove(self.Game, "e2e4qq"))
+
+    # endregion
+
+    # region Validate tests
+
+    def test_Validate_WorkerPool_ResultsInGameOrder(self):
+        games = [TestGameValidator.FoolsMate, "e2e4 e7e5 e1e3", ["d2d4", "d7d5"]] * 3
+
+        results, _ = GameValidator.Run(games, processes=2, chunkSize=2)
+        inProcessResults = list(GameValidator.Validate(games, processes=1))
+
+        self.assertEqual(list(range(len(games))), [result.GameIndex for result in results])
+        self.assertEqual([None, 2, None] * 3, [result.FirstIllegalPly for result in results])
+        self.assertEqual([result.FinalFen for result in inProcessResults], [result.FinalFen for result in results])
+
+    def test_Validate_WorkerPool_ReadAheadBounded(self):
+        gamesRead = 0
+
+        def CountingGames():
+            nonlocal gamesRead
+            for _ in range(2000):
+                gamesRead += 1
+                yield "e2e4 e7e5"
+
+        results = GameValidator.Validate(CountingGames(), processes=2, chunkSize=2)
+        next(results)
+        gamesReadAtFirstResult = gamesRead
+        results.close()
+
+        # The batch being yielded plus the one queued behind it
+        self.assertLessEqual(gamesReadAtFirstResult, 2 * 2 * 2 * GameValidator.ReadAheadChunks)
+
+    # endregion
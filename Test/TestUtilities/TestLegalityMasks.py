@@ -0,0 +1,99 @@
+import unittest
+from Utilities.LegalityMasks import LegalityMasks
+from Utilities.MoveHelpers import MoveHelpers
+from Miscellaneous.BoardPoints import BoardPoints
+from Miscellaneous.Constants import TeamEnum, PieceEnums
+from Board.History import History
+from Board.ChessBoard import ChessBoard
+from Board.Movement import Movement
+from Pieces.King import King
+from Pieces.Rook import Rook
+from Pieces.Bishop import Bishop
+from Pieces.Knight import Knight
+from Pieces.Pawn import Pawn
+
+
+class TestLegalityMasks(unittest.TestCase):
+
+    def setUp(self):
+        history = History()
+        self.chessBoard = ChessBoard(history)
+        self.chessBoard.RemoveAllPieces()
+
+    # region ForTeam tests
+
+    def test_ForTeam_NoKing_ReturnsNone(self):
+        self.assertIsNone(LegalityMasks.ForTeam(self.chessBoard, TeamEnum.White))
+
+    def test_ForTeam_NotInCheck_AllSquaresAllowed(self):
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(4, 0)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(4, 7)))
+
+        legalityMasks = LegalityMasks.ForTeam(self.chessBoard, TeamEnum.White)
+        self.assertEqual(LegalityMasks.AllSquares, legalityMasks.CheckMask)
+        self.assertEqual({}, legalityMasks.PinMasks)
+
+    def test_ForTeam_SliderCheck_MaskIsRayToChecker(self):
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.Black, BoardPoints(0, 3)))
+
+        legalityMasks = LegalityMasks.ForTeam(self.chessBoard, TeamEnum.White)
+        self.assertEqual((1 << 8) | (1 << 16) | (1 << 24), legalityMasks.CheckMask)
+
+    def test_ForTeam_DoubleCheck_NoSquaresAllowed(self):
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.Black, BoardPoints(0, 3)))
+        self.chessBoard.UpdatePieceOnBoard(Knight(TeamEnum.Black, BoardPoints(1, 2)))
+
+        legalityMasks = LegalityMasks.ForTeam(self.chessBoard, TeamEnum.White)
+        self.assertEqual(0, legalityMasks.CheckMask)
+
+    def test_ForTeam_PinnedPiece_PinMaskIsRayToPinner(self):
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
+        self.chessBoard.UpdatePieceOnBoard(Bishop(TeamEnum.White, BoardPoints(1, 1)))
+        self.chessBoard.UpdatePieceOnBoard(Bishop(TeamEnum.Black, BoardPoints(3, 3)))
+
+        legalityMasks = LegalityMasks.ForTeam(self.chessBoard, TeamEnum.White)
+        self.assertEqual({9: (1 << 9) | (1 << 18) | (1 << 27)}, legalityMasks.PinMasks)
+
+    # endregion
+
+    # region Legal move generation tests
+
+    def test_PinnedRook_CanOnlyMoveAlongPin(self):
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 7)))
+        rook = Rook(TeamEnum.White, BoardPoints(0, 2))
+        self.chessBoard.UpdatePieceOnBoard(rook)
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.Black, BoardPoints(0, 5)))
+
+        actualMoves = sorted(rook.GetValidMoves(self.chessBoard, True))
+        expectedMoves = [BoardPoints(0, 1), BoardPoints(0, 3), BoardPoints(0, 4), BoardPoints(0, 5)]
+        self.assertEqual(expectedMoves, actualMoves)
+
+    def test_InCheck_OnlyBlockingCaptureOrKingMoves(self):
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 7)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.Black, BoardPoints(0, 5)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.Black, BoardPoints(1, 6)))
+        knight = Knight(TeamEnum.White, BoardPoints(2, 2))
+        self.chessBoard.UpdatePieceOnBoard(knight)
+
+        # Knight can only block on A2 or A4, the King can't leave the A file or step onto the B file
+        self.assertEqual([BoardPoints(0, 1), BoardPoints(0, 3)], sorted(knight.GetValidMoves(self.chessBoard, True)))
+        self.assertEqual(2, len(MoveHelpers.GetPieceCentricMovesForTeam(self.chessBoard, TeamEnum.White, True)))
+
+    def test_EnPassantExposingKing_NotAllowed(self):
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 4)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 7)))
+        whitePawn = Pawn(TeamEnum.White, BoardPoints(3, 4))
+        self.chessBoard.UpdatePieceOnBoard(whitePawn)
+        self.chessBoard.UpdatePieceOnBoard(Pawn(TeamEnum.Black, BoardPoints(4, 4)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.Black, BoardPoints(7, 4)))
+        self.chessBoard.AppendToHistory(Movement(TeamEnum.Black, PieceEnums.Pawn, PieceEnums.NoPiece,
+                                                 BoardPoints(4, 6), BoardPoints(4, 4), None))
+
+        # Capturing en passant removes both pawns from the rank, leaving the King attacked by the rook
+        self.assertEqual([BoardPoints(3, 5)], whitePawn.GetValidMoves(self.chessBoard, True))
+
+    # endregion
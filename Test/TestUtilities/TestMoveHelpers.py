@@ -1,7 +1,8 @@
 import unittest
 from Utilities.MoveHelpers import MoveHelpers
 from Miscellaneous.BoardPoints import BoardPoints
-from Miscellaneous.Points import Points
+import Utilities.AttackTables
+from Utilities.LegalityMasks import LegalityMasks
 from Miscellaneous.Constants import TeamEnum, PieceEnums
 from Board.History import History
 from Board.Movement import Movement
@@ -104,6 +105,45 @@ class TestMoveHelpers(unittest.TestCase):
 
     # endregion
 
+    # region IteratePieceCentricMovesForTeam tests
+
+    def test_IteratePieceCentricMovesForTeam_MatchesListVersion(self):
+        enforceCheckCondition = True
+        iteratedMoves = list(MoveHelpers.IteratePieceCentricMovesForTeam(self.chessBoard, TeamEnum.White,
+                                                                         enforceCheckCondition))
+        listedMoves = MoveHelpers.GetPieceCentricMovesForTeam(self.chessBoard, TeamEnum.White, enforceCheckCondition)
+
+        self.assertEqual(listedMoves, iteratedMoves)
+        self.assertEqual(20, len(iteratedMoves))
+
+    def test_IteratePieceCentricMovesForTeam_IsLazy(self):
+        enforceCheckCondition = True
+        moves = MoveHelpers.IteratePieceCentricMovesForTeam(self.chessBoard, TeamEnum.White, enforceCheckCondition)
+
+        # Squares are visited from a1 upwards, the a1 Rook has no moves so the first one found is the b1 Knight's
+        self.assertIn(next(moves), [BoardPoints(0, 2), BoardPoints(2, 2)])
+
+    def test_IteratePieceCentricMovesForTeam_NoKing_YieldsNothing(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(1, 0)))
+
+        enforceCheckCondition = True
+        self.assertEqual([], list(MoveHelpers.IteratePieceCentricMovesForTeam(self.chessBoard, TeamEnum.White,
+                                                                              enforceCheckCondition)))
+
+    def test_HasLegalMoveForTeam_StartingPosition_ReturnsTrue(self):
+        self.assertTrue(MoveHelpers.HasLegalMoveForTeam(self.chessBoard, TeamEnum.White))
+
+    def test_HasLegalMoveForTeam_Stalemate_ReturnsFalse(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 7)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(5, 6)))
+        self.chessBoard.UpdatePieceOnBoard(Queen(TeamEnum.White, BoardPoints(6, 5)))
+
+        self.assertFalse(MoveHelpers.HasLegalMoveForTeam(self.chessBoard, TeamEnum.Black))
+
+    # endregion
+
     # region FilterPieceMovesThatPutPlayerInCheck Tests
 
     def test_FilterPieceMovesThatPutPlayerInCheck_FiltersMoves(self):
@@ -190,64 +230,15 @@ class TestMoveHelpers(unittest.TestCase):
 
     # endregion
 
-    # region GetValidMoves tests
+    # region AppendPotentialMovesAlongRay tests
 
-    def test_GetValidMoves_MoveIterationsLessThanZero_ReturnsEmptyList(self):
-        self.chessBoard.RemoveAllPieces()
-        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0,0)))
-        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(1, 0)))
+    def GetPotentialMovesAlongRay(self, piece, xDirection, yDirection, moveIterations):
+        ray = Utilities.AttackTables.GetRay(piece.GetCoordinates(), xDirection, yDirection)
+        potentialMoves = []
+        MoveHelpers.AppendPotentialMovesAlongRay(piece, self.chessBoard, ray[:moveIterations], potentialMoves)
+        return potentialMoves
 
-        rookUnderExamination = Rook(TeamEnum.Black, BoardPoints(5, 0))
-        self.chessBoard.UpdatePieceOnBoard(Pawn(TeamEnum.Black, BoardPoints(5, 3)))
-        self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
-        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
-
-        moveIterations = -1
-        enforceKingUnderAttack = False
-        directionVector = Points(-1,0)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(rookUnderExamination, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
-        expectedValidMoves = []
-        self.assertEqual(actualValidMoves, expectedValidMoves)
-
-    def test_GetValidMoves_PieceBeingMovedHasNoTeam_ReturnsEmptyList(self):
-        self.chessBoard.RemoveAllPieces()
-        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0,0)))
-        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(1, 0)))
-
-        # Change team of rook to no team
-        rookUnderExamination = Rook(TeamEnum.NoTeam, BoardPoints(5, 0))
-        self.chessBoard.UpdatePieceOnBoard(Pawn(TeamEnum.Black, BoardPoints(5, 3)))
-        self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
-        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
-
-        moveIterations = 1
-        enforceKingUnderAttack = False
-        directionVector = Points(-1,0)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(rookUnderExamination, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
-        expectedValidMoves = []
-        self.assertEqual(actualValidMoves, expectedValidMoves)
-
-    def test_GetValidMoves_PieceBeingMovedIsNoPiece_ReturnsEmptyList(self):
-        self.chessBoard.RemoveAllPieces()
-        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0,0)))
-        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(1, 0)))
-
-        rookUnderExamination = NoPiece(BoardPoints(5, 0))
-        self.chessBoard.UpdatePieceOnBoard(Pawn(TeamEnum.Black, BoardPoints(5, 3)))
-        self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
-        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
-
-        moveIterations = 1
-        enforceKingUnderAttack = False
-        directionVector = Points(-1,0)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(rookUnderExamination, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
-        expectedValidMoves = []
-        self.assertEqual(actualValidMoves, expectedValidMoves)
-
-    def test_GetValidMoves_DirectionVectorResultsInPieceBeingOutOfRange_ReturnsValidList(self):
+    def test_AppendPotentialMovesAlongRay_DirectionResultsInPieceBeingOutOfRange_ReturnsValidList(self):
         self.chessBoard.RemoveAllPieces()
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 1)))
         self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(0, 2)))
@@ -257,15 +248,11 @@ class TestMoveHelpers(unittest.TestCase):
         self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
 
-        moveIterations = 10
-        enforceKingUnderAttack = False
-        directionVector = Points(-1,0)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(rookUnderExamination, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
+        actualValidMoves = self.GetPotentialMovesAlongRay(rookUnderExamination, -1, 0, 10)
         expectedValidMoves = [BoardPoints(0,0)]
         self.assertEqual(actualValidMoves, expectedValidMoves)
 
-    def test_GetValidMoves_PieceOfSameTeamIsInPath_ReturnsValidList(self):
+    def test_AppendPotentialMovesAlongRay_PieceOfSameTeamIsInPath_ReturnsValidList(self):
         self.chessBoard.RemoveAllPieces()
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
         self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(1, 0)))
@@ -275,17 +262,13 @@ class TestMoveHelpers(unittest.TestCase):
         self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
 
-        moveIterations = 10
-        enforceKingUnderAttack = False
-        directionVector = Points(-1,0)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(rookUnderExamination, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
+        actualValidMoves = self.GetPotentialMovesAlongRay(rookUnderExamination, -1, 0, 10)
         actualValidMoves.sort()
         expectedValidMoves = [BoardPoints(3,0), BoardPoints(4,0)]
         expectedValidMoves.sort()
         self.assertEqual(actualValidMoves, expectedValidMoves)
 
-    def test_GetValidMoves_NonPawn_AttackStopsAfterHittingOppositeTeamPiece_ReturnsValidList(self):
+    def test_AppendPotentialMovesAlongRay_NonPawn_AttackStopsAfterHittingOppositeTeamPiece_ReturnsValidList(self):
         self.chessBoard.RemoveAllPieces()
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
         self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(3, 0)))
@@ -295,17 +278,13 @@ class TestMoveHelpers(unittest.TestCase):
         self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
 
-        moveIterations = 10
-        enforceKingUnderAttack = False
-        directionVector = Points(-1,0)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(rookUnderExamination, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
+        actualValidMoves = self.GetPotentialMovesAlongRay(rookUnderExamination, -1, 0, 10)
         actualValidMoves.sort()
         expectedValidMoves = [BoardPoints(3,0), BoardPoints(4,0)]
         expectedValidMoves.sort()
         self.assertEqual(actualValidMoves, expectedValidMoves)
 
-    def test_GetValidMoves_NonPawn_EnforceKingInCheckSetToFalse_KingInCheck_ReturnsValidList(self):
+    def test_AppendPotentialMovesAlongRay_NonPawn_KingInCheckNotConsidered_ReturnsValidList(self):
         self.chessBoard.RemoveAllPieces()
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
         self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(3, 0)))
@@ -315,33 +294,11 @@ class TestMoveHelpers(unittest.TestCase):
         self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
 
-        moveIterations = 10
-        enforceKingUnderAttack = False
-        directionVector = Points(0,1)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(rookUnderExamination, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
+        actualValidMoves = self.GetPotentialMovesAlongRay(rookUnderExamination, 0, 1, 10)
         expectedValidMoves = [BoardPoints(5,1), BoardPoints(5,2)]
         self.assertEqual(actualValidMoves, expectedValidMoves)
 
-    def test_GetValidMoves_NonPawn_EnforceKingInCheckSetToTrue_KingInCheck_ReturnsValidList(self):
-        self.chessBoard.RemoveAllPieces()
-        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
-        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(3, 0)))
-
-        rookUnderExamination = Rook(TeamEnum.Black, BoardPoints(5, 0))
-        self.chessBoard.UpdatePieceOnBoard(Pawn(TeamEnum.Black, BoardPoints(5, 3)))
-        self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
-        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
-
-        moveIterations = 10
-        enforceKingUnderAttack = True
-        directionVector = Points(0,1)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(rookUnderExamination, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
-        expectedValidMoves = []
-        self.assertEqual(actualValidMoves, expectedValidMoves)
-
-    def test_GetValidMoves_Pawn_DiagonalMove_OpposingTeamAtToLocation_AddsMoveToList(self):
+    def test_AppendPotentialMovesAlongRay_Pawn_DiagonalMove_OpposingTeamAtToLocation_AddsMoveToList(self):
         self.chessBoard.RemoveAllPieces()
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 1)))
@@ -351,15 +308,11 @@ class TestMoveHelpers(unittest.TestCase):
         self.chessBoard.UpdatePieceOnBoard(whitePawn)
         self.chessBoard.UpdatePieceOnBoard(blackPawn)
 
-        moveIterations = 1
-        enforceKingUnderAttack = False
-        directionVector = Points(1,-1)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(blackPawn, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
+        actualValidMoves = self.GetPotentialMovesAlongRay(blackPawn, 1, -1, 1)
         expectedValidMoves = [BoardPoints(3,3)]
         self.assertEqual(actualValidMoves, expectedValidMoves)
 
-    def test_GetValidMoves_Pawn_DiagonalMove_NoTeamAtToLocation_NoEnPassant_NoAdditionToList(self):
+    def test_AppendPotentialMovesAlongRay_Pawn_DiagonalMove_NoTeamAtToLocation_NoEnPassant_NoAdditionToList(self):
         self.chessBoard.RemoveAllPieces()
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 1)))
@@ -369,15 +322,11 @@ class TestMoveHelpers(unittest.TestCase):
         self.chessBoard.UpdatePieceOnBoard(whitePawn)
         self.chessBoard.UpdatePieceOnBoard(blackPawn)
 
-        moveIterations = 1
-        enforceKingUnderAttack = False
-        directionVector = Points(1,-1)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(blackPawn, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
+        actualValidMoves = self.GetPotentialMovesAlongRay(blackPawn, 1, -1, 1)
         expectedValidMoves = []
         self.assertEqual(actualValidMoves, expectedValidMoves)
 
-    def test_GetValidMoves_Pawn_DiagonalMove_NoTeamAtToLocation_IsEnPassantMove_ReturnsValidList(self):
+    def test_AppendPotentialMovesAlongRay_Pawn_DiagonalMove_NoTeamAtToLocation_IsEnPassantMove_ReturnsValidList(self):
         self.chessBoard.RemoveAllPieces()
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 1)))
@@ -388,18 +337,14 @@ class TestMoveHelpers(unittest.TestCase):
         self.chessBoard.UpdatePieceOnBoard(whitePawn)
         self.chessBoard.UpdatePieceOnBoard(blackPawn)
 
-        moveIterations = 1
-        enforceKingUnderAttack = False
-        directionVector = Points(1,-1)
-
         lastMove = Movement(TeamEnum.White, PieceEnums.Pawn, PieceEnums.NoPiece, BoardPoints(3,1), BoardPoints(3,3), None)
         self.chessBoard.AppendToHistory(lastMove)
 
-        actualValidMoves = MoveHelpers.GetValidMoves(blackPawn, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
+        actualValidMoves = self.GetPotentialMovesAlongRay(blackPawn, 1, -1, 1)
         expectedValidMoves = [BoardPoints(3,2)]
         self.assertEqual(actualValidMoves, expectedValidMoves)
 
-    def test_GetValidMoves_Pawn_StraightMove_NoTeamAtToLocation_ReturnsValidList(self):
+    def test_AppendPotentialMovesAlongRay_Pawn_StraightMove_NoTeamAtToLocation_ReturnsValidList(self):
         self.chessBoard.RemoveAllPieces()
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 1)))
@@ -410,15 +355,11 @@ class TestMoveHelpers(unittest.TestCase):
         self.chessBoard.UpdatePieceOnBoard(whitePawn)
         self.chessBoard.UpdatePieceOnBoard(blackPawn)
 
-        moveIterations = 1
-        enforceKingUnderAttack = False
-        directionVector = Points(0,-1)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(blackPawn, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
+        actualValidMoves = self.GetPotentialMovesAlongRay(blackPawn, 0, -1, 1)
         expectedValidMoves = [BoardPoints(2,2)]
         self.assertEqual(actualValidMoves, expectedValidMoves)
 
-    def test_GetValidMoves_Pawn_StraightMove_TeamAtToLocation_NoAdditionToList(self):
+    def test_AppendPotentialMovesAlongRay_Pawn_StraightMove_TeamAtToLocation_NoAdditionToList(self):
         self.chessBoard.RemoveAllPieces()
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
         self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 1)))
@@ -429,16 +370,87 @@ class TestMoveHelpers(unittest.TestCase):
         self.chessBoard.UpdatePieceOnBoard(whitePawn)
         self.chessBoard.UpdatePieceOnBoard(blackPawn)
 
-        moveIterations = 1
-        enforceKingUnderAttack = False
-        directionVector = Points(0,-1)
-
-        actualValidMoves = MoveHelpers.GetValidMoves(blackPawn, self.chessBoard, directionVector, moveIterations, enforceKingUnderAttack)
+        actualValidMoves = self.GetPotentialMovesAlongRay(blackPawn, 0, -1, 1)
         expectedValidMoves = []
         self.assertEqual(actualValidMoves, expectedValidMoves)
 
     # endregion
 
+    # region IteratePieceMovesByLegalityMasks tests
+
+    def test_IteratePieceMovesByLegalityMasks_PinnedPiece_MovesOffThePinFiltered(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(3, 0)))
+
+        rookUnderExamination = Rook(TeamEnum.Black, BoardPoints(5, 0))
+        self.chessBoard.UpdatePieceOnBoard(Pawn(TeamEnum.Black, BoardPoints(5, 3)))
+        self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
+
+        potentialMoves = [BoardPoints(5,1), BoardPoints(5,2), BoardPoints(4,0), BoardPoints(3,0)]
+        legalityMasks = LegalityMasks.ForTeam(self.chessBoard, TeamEnum.Black)
+        actualValidMoves = list(MoveHelpers.IteratePieceMovesByLegalityMasks(self.chessBoard, rookUnderExamination,
+                                                                             potentialMoves, legalityMasks))
+        expectedValidMoves = [BoardPoints(4,0), BoardPoints(3,0)]
+        self.assertEqual(actualValidMoves, expectedValidMoves)
+
+    def test_IteratePieceMovesByLegalityMasks_NoKing_YieldsNothing(self):
+        self.chessBoard.RemoveAllPieces()
+        rookUnderExamination = Rook(TeamEnum.Black, BoardPoints(5, 0))
+        self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
+
+        legalityMasks = LegalityMasks.ForTeam(self.chessBoard, TeamEnum.Black)
+        actualValidMoves = list(MoveHelpers.IteratePieceMovesByLegalityMasks(self.chessBoard, rookUnderExamination,
+                                                                             [BoardPoints(5,1)], legalityMasks))
+        self.assertEqual(actualValidMoves, [])
+
+    def test_IterateValidMovesFromRayTable_PieceBeingMovedHasNoTeam_YieldsNothing(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0,0)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
+
+        # Change team of rook to no team
+        rookUnderExamination = Rook(TeamEnum.NoTeam, BoardPoints(5, 0))
+        self.chessBoard.UpdatePieceOnBoard(rookUnderExamination)
+
+        actualValidMoves = list(MoveHelpers.IterateValidMovesFromRayTable(rookUnderExamination, self.chessBoard,
+                                                                          Utilities.AttackTables.ROOK_RAYS, True))
+        self.assertEqual(actualValidMoves, [])
+
+    def test_IterateValidMovesFromRayTable_PieceBeingMovedIsNoPiece_YieldsNothing(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0,0)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
+
+        pieceUnderExamination = NoPiece(BoardPoints(5, 0))
+
+        actualValidMoves = list(MoveHelpers.IterateValidMovesFromRayTable(pieceUnderExamination, self.chessBoard,
+                                                                          Utilities.AttackTables.ROOK_RAYS, True))
+        self.assertEqual(actualValidMoves, [])
+
+    # endregion
+
+    # region GetLegalMovePairsForTeam tests
+
+    def test_GetLegalMovePairsForTeam_PinnedRook_OnlyMovesAlongThePin(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(3, 0)))
+
+        rookCoords = BoardPoints(5, 0)
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.Black, rookCoords))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 0)))
+
+        movePairs = MoveHelpers.GetLegalMovePairsForTeam(self.chessBoard, TeamEnum.Black)
+        actualRookMoves = [toCoord for fromCoord, toCoord in movePairs if fromCoord == rookCoords]
+        actualRookMoves.sort()
+        expectedRookMoves = [BoardPoints(3,0), BoardPoints(4,0), BoardPoints(6,0)]
+        expectedRookMoves.sort()
+        self.assertEqual(actualRookMoves, expectedRookMoves)
+
+    # endregion
+
     # region IsCastleMove Tests
 
     def test_IsCastleMove_NotKing_ReturnsFalse(self):
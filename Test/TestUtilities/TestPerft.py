@@ -0,0 +1,51 @@
+import unittest
+from Utilities.Perft import Perft
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Miscellaneous.BoardPoints import BoardPoints
+
+
+class TestPerft(unittest.TestCase):
+
+    # Keep the unit tests quick, deeper searches are run through Main/perft.py
+    MaximumNodes = 25000
+
+    def setUp(self):
+        history = History()
+        self.chessBoard = ChessBoard(history)
+
+    # region CountNodes tests
+
+    def test_CountNodes_StandardPositions_MatchExpectedCounts(self):
+        for name, fen, expectedCounts in Perft.StandardPositions:
+            self.chessBoard.LoadFen(fen)
+            for depth, expectedNodes in enumerate(expectedCounts, start=1):
+                if expectedNodes > TestPerft.MaximumNodes:
+                    break
+                with self.subTest(position=name, depth=depth):
+                    self.assertEqual(expectedNodes, Perft.CountNodes(self.chessBoard, depth))
+
+    def test_CountNodes_BoardRestoredAfterSearch(self):
+        _, fen, _ = Perft.GetStandardPosition("kiwipete")
+        self.chessBoard.LoadFen(fen)
+        fenBeforeSearch = self.chessBoard.GetFenRepresentation()
+
+        Perft.CountNodes(self.chessBoard, 2)
+
+        self.assertEqual(fenBeforeSearch, self.chessBoard.GetFenRepresentation())
+        self.assertEqual(0, len(self.chessBoard.GetHistoricalMoves()))
+
+    def test_CountNodes_DepthZero_ReturnsOne(self):
+        self.assertEqual(1, Perft.CountNodes(self.chessBoard, 0))
+
+    # endregion
+
+    # region Divide tests
+
+    def test_Divide_SumsToCountNodes(self):
+        divide = Perft.Divide(self.chessBoard, 2)
+        self.assertEqual(20, len(divide))
+        self.assertEqual(400, sum(nodes for _, _, nodes in divide))
+        self.assertIn((BoardPoints(4, 1), BoardPoints(4, 3), 20), divide)
+
+    # endregion
@@ -0,0 +1,77 @@
+import io
+import unittest
+from Utilities.PgnReader import PgnReader
+from Utilities.GameValidator import GameValidator
+from Miscellaneous.MoveMessages import MoveEnum
+
+
+class TestPgnReader(unittest.TestCase):
+
+    Archive = """[Event "Fool's mate"]
+[White "A \\"quoted\\" name"]
+[Result "0-1"]
+
+1. f3 e5 {a comment
+carrying on over lines} 2. g4 (2. e4 Nc6) 2... Qh4# 0-1
+
+% escaped line
+[Event "Castles"]
+[Result "*"]
+
+1.e4 e5 2.Nf3 Nc6 3.Bc4 $1 Bc5 ; rest of line comment
+4.O-O *
+
+[Event "Illegal"]
+[Result "*"]
+
+1. e4 e5 2. Ke3 *
+"""
+
+    def setUp(self):
+        self.games = list(PgnReader.ReadGames(io.StringIO(TestPgnReader.Archive)))
+
+    def test_ReadGames_YieldsEveryGame(self):
+        self.assertEqual(3, len(self.games))
+        self.assertEqual(["Fool's mate", "Castles", "Illegal"], [game.Headers["Event"] for game in self.games])
+
+    def test_ReadGames_SkipsCommentsVariationsAndNags(self):
+        self.assertEqual(["f3", "e5", "g4", "Qh4#"], self.games[0].SanMoves)
+        self.assertEqual(["e4", "e5", "Nf3", "Nc6", "Bc4", "Bc5", "O-O"], self.games[1].SanMoves)
+
+    def test_ReadGames_TagValueUnescaped(self):
+        self.assertEqual('A "quoted" name', self.games[0].Headers["White"])
+
+    def test_ReadGames_Checkmate_ResultAndOutcomeAgree(self):
+        game = self.games[0]
+
+        self.assertTrue(game.IsLegal())
+        self.assertEqual("0-1", game.Result)
+        self.assertEqual("0-1", game.Outcome)
+        self.assertEqual(["f2f3", "e7e5", "g2g4", "d8h4"], game.UciMoves)
+        self.assertEqual(4, len(game.History))
+
+    def test_ReadGames_Castle_UciMovesAndFinalFen(self):
+        game = self.games[1]
+
+        self.assertEqual("e1g1", game.UciMoves[-1])
+        self.assertEqual("r1bqk1nr/pppp1ppp/2n5/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQ1RK1 b kq - 5 4", game.FinalFen)
+        self.assertEqual("*", game.Outcome)
+
+    def test_ReadGames_IllegalMove_StopsAtIllegalPly(self):
+        game = self.games[2]
+
+        self.assertFalse(game.IsLegal())
+        self.assertEqual(2, game.IllegalPly)
+        self.assertEqual(["e2e4", "e7e5"], game.UciMoves)
+
+    def test_ReadGames_FenTag_StartsFromPosition(self):
+        archive = '[FEN "4k3/1P6/8/8/8/8/8/4K3 w - - 0 1"]\n\n1. b8=Q+ Kd7 *\n'
+        game = next(PgnReader.ReadGames(io.StringIO(archive)))
+
+        self.assertTrue(game.IsLegal())
+        self.assertEqual(["b7b8q", "e8d7"], game.UciMoves)
+
+    def test_ReadGames_UciMoves_ValidatedByGameValidator(self):
+        results = GameValidator.Validate([game.UciMoves for game in self.games[:2]], processes=1)
+
+        self.assertEqual([MoveEnum.Success, MoveEnum.Success], [result.StatusCode for result in results])
@@ -0,0 +1,66 @@
+import io
+import unittest
+from Utilities.PgnWriter import PgnWriter
+from Utilities.PgnReader import PgnReader
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Game.Game import Game
+from Miscellaneous.BoardPoints import BoardPoints
+
+
+class TestPgnWriter(unittest.TestCase):
+
+    def setUp(self):
+        history = History()
+        self.Game = Game(ChessBoard(history))
+
+    def PlayMoves(self, moves):
+        for move in moves.split():
+            self.assertTrue(self.Game.Move(move[:2], move[2:]).IsSuccessful())
+
+    def test_WriteGame_Checkmate_ResultFromGame(self):
+        self.PlayMoves("f2f3 e7e5 g2g4 d8h4")
+        stream = io.StringIO()
+        PgnWriter.WriteGame(stream, self.Game, {"White": "A \"quoted\" name"})
+
+        self.assertEqual('[Event "?"]\n'
+                         '[Site "?"]\n'
+                         '[Date "????.??.??"]\n'
+                         '[Round "?"]\n'
+                         '[White "A \\"quoted\\" name"]\n'
+                         '[Black "?"]\n'
+                         '[Result "0-1"]\n'
+                         '\n'
+                         '1. f3 e5 2. g4 Qh4# 0-1\n'
+                         '\n', stream.getvalue())
+
+    def test_WriteGame_Castle_WrittenAsOneMove(self):
+        self.PlayMoves("e2e4 e7e5 g1f3 b8c6 f1c4 f8c5 e1g1")
+        stream = io.StringIO()
+        PgnWriter.WriteGame(stream, self.Game)
+
+        self.assertTrue(stream.getvalue().endswith("1. e4 e5 2. Nf3 Nc6 3. Bc4 Bc5 4. O-O *\n\n"))
+
+    def test_WriteHistory_StartingFen_BlackToMoveFirst(self):
+        startingFen = "4k3/8/8/8/8/8/8/4K2R b K - 0 1"
+        board = ChessBoard(History())
+        board.LoadFen(startingFen)
+        board.MakeMove(BoardPoints(4, 7), BoardPoints(3, 7))
+
+        stream = io.StringIO()
+        PgnWriter.WriteHistory(stream, board.GetHistory(), "*", startingFen=startingFen)
+
+        self.assertIn('[FEN "' + startingFen + '"]\n', stream.getvalue())
+        self.assertIn("\n1... Kd8 *\n", stream.getvalue())
+
+    def test_WriteHistory_ReadBack_SameMoves(self):
+        self.PlayMoves("d2d4 g8f6 c2c4 e7e6 b1c3 f8b4 e2e3 e8g8 f1d3 d7d5 g1f3 c7c5 e1g1 b8c6 a2a3 b4c3 b2c3 d5c4")
+        stream = io.StringIO()
+        PgnWriter.WriteGame(stream, self.Game, {"Event": "Round trip"})
+
+        game = next(PgnReader.ReadGames(io.StringIO(stream.getvalue())))
+
+        self.assertTrue(game.IsLegal())
+        self.assertEqual("Round trip", game.Headers["Event"])
+        self.assertEqual(self.Game.GetFenRepresentation(), game.FinalFen)
+        self.assertEqual(self.Game.GetBoard().GetHistory(), game.History)
@@ -0,0 +1,78 @@
+import unittest
+from Utilities.PositionStatus import PositionStatus
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Pieces.King import King
+from Pieces.Queen import Queen
+from Pieces.Rook import Rook
+from Miscellaneous.Constants import TeamEnum
+from Miscellaneous.BoardPoints import BoardPoints
+
+
+class TestPositionStatus(unittest.TestCase):
+
+    def setUp(self):
+        history = History()
+        self.chessBoard = ChessBoard(history)
+
+    def test_ForTeam_StartingPosition_GameContinues(self):
+        positionStatus = PositionStatus.ForTeam(self.chessBoard, TeamEnum.White)
+
+        self.assertEqual(20, positionStatus.LegalMoveCount)
+        self.assertFalse(positionStatus.IsCheckmate)
+        self.assertFalse(positionStatus.IsStalemate)
+        self.assertFalse(positionStatus.IsDraw())
+        self.assertFalse(positionStatus.IsInCheck())
+        self.assertFalse(positionStatus.HasGameEnded())
+
+    def test_ForTeam_Checkmate_NotReportedAsCheckOrDraw(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 7)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(5, 6)))
+        self.chessBoard.UpdatePieceOnBoard(Queen(TeamEnum.White, BoardPoints(6, 6)))
+
+        positionStatus = PositionStatus.ForTeam(self.chessBoard, TeamEnum.Black)
+
+        self.assertEqual(0, positionStatus.LegalMoveCount)
+        self.assertTrue(positionStatus.IsKingInCheck)
+        self.assertTrue(positionStatus.IsCheckmate)
+        self.assertFalse(positionStatus.IsDraw())
+        self.assertFalse(positionStatus.IsInCheck())
+        self.assertTrue(positionStatus.HasGameEnded())
+
+    def test_ForTeam_Stalemate_IsDraw(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 7)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(5, 6)))
+        self.chessBoard.UpdatePieceOnBoard(Queen(TeamEnum.White, BoardPoints(6, 5)))
+
+        positionStatus = PositionStatus.ForTeam(self.chessBoard, TeamEnum.Black)
+
+        self.assertTrue(positionStatus.IsStalemate)
+        self.assertFalse(positionStatus.IsCheckmate)
+        self.assertTrue(positionStatus.IsDraw())
+        self.assertTrue(positionStatus.HasGameEnded())
+
+    def test_ForTeam_KingVsKing_DrawByInsufficientMaterial(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 7)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
+
+        positionStatus = PositionStatus.ForTeam(self.chessBoard, TeamEnum.Black)
+
+        self.assertEqual(3, positionStatus.LegalMoveCount)
+        self.assertFalse(positionStatus.IsStalemate)
+        self.assertTrue(positionStatus.IsDrawByInsufficientMaterial)
+        self.assertFalse(positionStatus.IsDrawBySeventyFiveMoves)
+        self.assertTrue(positionStatus.IsDraw())
+
+    def test_ForTeam_InCheck_IsInCheck(self):
+        self.chessBoard.RemoveAllPieces()
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.Black, BoardPoints(7, 7)))
+        self.chessBoard.UpdatePieceOnBoard(King(TeamEnum.White, BoardPoints(0, 0)))
+        self.chessBoard.UpdatePieceOnBoard(Rook(TeamEnum.White, BoardPoints(7, 0)))
+
+        positionStatus = PositionStatus.ForTeam(self.chessBoard, TeamEnum.Black)
+
+        self.assertTrue(positionStatus.IsInCheck())
+        self.assertFalse(positionStatus.HasGameEnded())
@@ -0,0 +1,69 @@
+import unittest
+from Utilities.SanHelpers import SanHelpers
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Miscellaneous.BoardPoints import BoardPoints
+
+
+class TestSanHelpers(unittest.TestCase):
+
+    def setUp(self):
+        history = History()
+        self.chessBoard = ChessBoard(history)
+
+    # region ParseSan tests
+
+    def test_ParseSan_PawnAndPieceMoves(self):
+        self.assertEqual((BoardPoints(4, 1), BoardPoints(4, 3)), SanHelpers.ParseSan(self.chessBoard, "e4"))
+        self.assertEqual((BoardPoints(6, 0), BoardPoints(5, 2)), SanHelpers.ParseSan(self.chessBoard, "Nf3!"))
+
+    def test_ParseSan_IllegalMove_ReturnsNone(self):
+        self.assertIsNone(SanHelpers.ParseSan(self.chessBoard, "e5"))
+        self.assertIsNone(SanHelpers.ParseSan(self.chessBoard, "Nd2"))
+        self.assertIsNone(SanHelpers.ParseSan(self.chessBoard, "Zz9"))
+
+    def test_ParseSan_Disambiguation(self):
+        self.chessBoard.LoadFen("4k3/8/8/8/8/8/4K3/R6R w - - 0 1")
+
+        self.assertIsNone(SanHelpers.ParseSan(self.chessBoard, "Rd1"))
+        self.assertEqual((BoardPoints(0, 0), BoardPoints(3, 0)), SanHelpers.ParseSan(self.chessBoard, "Rad1"))
+        self.assertEqual((BoardPoints(7, 0), BoardPoints(5, 0)), SanHelpers.ParseSan(self.chessBoard, "Rhf1"))
+
+    def test_ParseSan_Castles(self):
+        self.chessBoard.LoadFen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+
+        self.assertEqual((BoardPoints(4, 0), BoardPoints(6, 0)), SanHelpers.ParseSan(self.chessBoard, "O-O"))
+        self.assertEqual((BoardPoints(4, 0), BoardPoints(2, 0)), SanHelpers.ParseSan(self.chessBoard, "0-0-0"))
+
+    def test_ParseSan_Promotion_OnlyQueenSupported(self):
+        self.chessBoard.LoadFen("4k3/1P6/8/8/8/8/8/4K3 w - - 0 1")
+
+        self.assertEqual((BoardPoints(1, 6), BoardPoints(1, 7)), SanHelpers.ParseSan(self.chessBoard, "b8=Q+"))
+        self.assertIsNone(SanHelpers.ParseSan(self.chessBoard, "b8=N"))
+
+    # endregion
+
+    # region GetSan tests
+
+    def test_GetSan_CaptureCheckAndDisambiguation(self):
+        self.chessBoard.LoadFen("4k3/8/8/3p4/4P3/8/4K3/R6R w - - 0 1")
+
+        self.assertEqual("exd5", SanHelpers.GetSan(self.chessBoard, BoardPoints(4, 3), BoardPoints(3, 4)))
+        self.assertEqual("Rad1", SanHelpers.GetSan(self.chessBoard, BoardPoints(0, 0), BoardPoints(3, 0)))
+        self.assertEqual("Rh8+", SanHelpers.GetSan(self.chessBoard, BoardPoints(7, 0), BoardPoints(7, 7)))
+
+    def test_GetSan_Castles(self):
+        self.chessBoard.LoadFen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+
+        self.assertEqual("O-O", SanHelpers.GetSan(self.chessBoard, BoardPoints(4, 0), BoardPoints(6, 0)))
+        self.assertEqual("O-O-O", SanHelpers.GetSan(self.chessBoard, BoardPoints(4, 0), BoardPoints(2, 0)))
+
+    def test_GetSan_Checkmate(self):
+        self.chessBoard.LoadFen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+
+        self.assertEqual("Ra8#", SanHelpers.GetSan(self.chessBoard, BoardPoints(0, 0), BoardPoints(0, 7)))
+
+        # The board is left as it was
+        self.assertEqual("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1", self.chessBoard.GetFenRepresentation())
+
+    # endregion
@@ -0,0 +1,116 @@
+import Miscellaneous.Constants
+from Miscellaneous.BoardPoints import BoardPoints
+from Miscellaneous.Constants import TeamEnum
+
+# Per square move tables, built once at import.
+# Squares are indexed as y * MAXIMUM_X_SQUARES + x (the same indexing used by the bitboards). A "ray" is the ordered
+# tuple of squares visited when repeatedly applying a direction vector from a square until the edge of the board,
+# so move generation only has to walk a ray until it is blocked, no range checks or point allocations required.
+
+SQUARE_COUNT = Miscellaneous.Constants.MAXIMUM_X_SQUARES * Miscellaneous.Constants.MAXIMUM_Y_SQUARES
+
+# Direction vectors, ordering matches the order the pieces have always generated their moves in
+ROOK_DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+QUEEN_DIRECTIONS = ((1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1))
+KING_DIRECTIONS = QUEEN_DIRECTIONS
+KNIGHT_DIRECTIONS = ((2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1))
+
+
+def _IsInRange(xCoord, yCoord):
+    return 0 <= xCoord < Miscellaneous.Constants.MAXIMUM_X_SQUARES and \
+           0 <= yCoord < Miscellaneous.Constants.MAXIMUM_Y_SQUARES
+
+
+def _ToSquare(xCoord, yCoord):
+    return yCoord * Miscellaneous.Constants.MAXIMUM_X_SQUARES + xCoord
+
+
+def _BuildRay(square, xDirection, yDirection, maximumLength):
+    xCoord, yCoord = SQUARE_POINTS[square].GetX(), SQUARE_POINTS[square].GetY()
+    ray = []
+    while len(ray) < maximumLength:
+        xCoord += xDirection
+        yCoord += yDirection
+        if not _IsInRange(xCoord, yCoord):
+            break
+        ray.append(_ToSquare(xCoord, yCoord))
+    return tuple(ray)
+
+
+def _BuildRayTable(directions, maximumLength):
+    return tuple(tuple(_BuildRay(square, xDirection, yDirection, maximumLength) for xDirection, yDirection in directions)
+                 for square in range(SQUARE_COUNT))
+
+
+def _BuildPawnRayTable(team):
+    yDirection = 1 if team == TeamEnum.White else -1
+    startingYCoord = Miscellaneous.Constants.WHITE_PAWNS_Y_ARRAY_COORDINATE if team == TeamEnum.White else \
+        Miscellaneous.Constants.BLACK_PAWNS_Y_ARRAY_COORDINATE
+
+    table = []
+    for square in range(SQUARE_COUNT):
+        # Pawns can move two squares forward from their starting row, regardless of whether they have moved before
+        pushLength = Miscellaneous.Constants.MAXIMUM_PAWN_FORWARD_MOVEMENT \
+            if SQUARE_POINTS[square].GetY() == startingYCoord else 1
+        table.append((_BuildRay(square, 0, yDirection, pushLength),
+                      _BuildRay(square, -1, yDirection, 1),
+                      _BuildRay(square, 1, yDirection, 1)))
+    return tuple(table)
+
+
+# Square index to (interned) board point
+SQUARE_POINTS = tuple(BoardPoints.FromIndex(square) for square in range(SQUARE_COUNT))
+
+# Per square tuples of rays, indexed [square][direction]
+ROOK_RAYS = _BuildRayTable(ROOK_DIRECTIONS, SQUARE_COUNT)
+BISHOP_RAYS = _BuildRayTable(BISHOP_DIRECTIONS, SQUARE_COUNT)
+QUEEN_RAYS = _BuildRayTable(QUEEN_DIRECTIONS, SQUARE_COUNT)
+KING_RAYS = _BuildRayTable(KING_DIRECTIONS, 1)
+KNIGHT_RAYS = _BuildRayTable(KNIGHT_DIRECTIONS, 1)
+
+# Pawn rays are forward push followed by the two forward diagonals, indexed [team][square][ray]
+PAWN_RAYS = {TeamEnum.White: _BuildPawnRayTable(TeamEnum.White),
+             TeamEnum.Black: _BuildPawnRayTable(TeamEnum.Black)}
+
+
+def _BuildAttackMasks(rayTable, firstRay, lastRay):
+    masks = []
+    for rays in rayTable:
+        mask = 0
+        for ray in rays[firstRay:lastRay]:
+            for square in ray:
+                mask |= 1 << square
+        masks.append(mask)
+    return tuple(masks)
+
+
+# Bitmask of the squares attacked from a square by the non sliding pieces, indexed [square]. As these attacks are
+# symmetric (pawns aside) the same masks answer "which squares attack this square" when intersected with a bitboard.
+KNIGHT_ATTACKS = _BuildAttackMasks(KNIGHT_RAYS, 0, len(KNIGHT_DIRECTIONS))
+KING_ATTACKS = _BuildAttackMasks(KING_RAYS, 0, len(KING_DIRECTIONS))
+
+# Squares a pawn of the given team attacks (its two forward diagonals), indexed [team][square]
+PAWN_ATTACKS = {TeamEnum.White: _BuildAttackMasks(PAWN_RAYS[TeamEnum.White], 1, 3),
+                TeamEnum.Black: _BuildAttackMasks(PAWN_RAYS[TeamEnum.Black], 1, 3)}
+
+# Unbounded rays for every direction vector the pieces use, indexed [(xDirection, yDirection)][square]. Move generation
+# walks the per square tables above, these (through GetRay) are for BatchAnalysis, which works out its shift for each
+# direction from them
+_DIRECTIONAL_RAYS = {}
+for _direction in QUEEN_DIRECTIONS + KNIGHT_DIRECTIONS:
+    _DIRECTIONAL_RAYS[_direction] = tuple(_BuildRay(square, _direction[0], _direction[1], SQUARE_COUNT)
+                                          for square in range(SQUARE_COUNT))
+
+
+def GetSquare(point: BoardPoints):
+    return point.GetIndex()
+
+
+def GetRay(point: BoardPoints, xDirection, yDirection):
+    square = GetSquare(point)
+    rays = _DIRECTIONAL_RAYS.get((xDirection, yDirection))
+    if rays is None:
+        # Not a standard piece direction, build it on demand
+        return _BuildRay(square, xDirection, yDirection, SQUARE_COUNT)
+    return rays[square]
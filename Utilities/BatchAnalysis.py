@@ -0,0 +1,260 @@
+import logging
+import Utilities.AttackTables
+import Miscellaneous.Constants
+from Miscellaneous.Constants import TeamEnum, PieceEnums
+
+# NumPy is optional, it is only needed for batch analysis and the rest of the engine runs without it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# Attack maps, piece counts, check flags and mobility for many positions at once. Every position is turned into one
+# 64 bit bitboard per piece type (as in Board.Bitboard, bit y * MAXIMUM_X_SQUARES + x) held in NumPy arrays, so each
+# step of move generation is a single shift/and/or over the whole batch rather than a ChessBoard per position.
+# Positions are given either as an N x 64 array of piece codes (squares in bitboard order) or as N x 12 x 8 x 8 planes
+# indexed [plane][y][x]. Code 0 is an empty square, code c > 0 is the piece in plane c - 1, with the planes ordered as
+# in Planes (white pawn to king, then black pawn to king).
+# Moves follow the direction vectors in AttackTables that Pieces/* generate from. Mobility counts the pseudo legal
+# moves of Pieces/* (GetValidMoves without the king under attack check), castling and en passant aside as the codes hold
+# no castling rights or last move.
+class BatchAnalysis:
+
+    Planes = ((TeamEnum.White, PieceEnums.Pawn), (TeamEnum.White, PieceEnums.Knight),
+              (TeamEnum.White, PieceEnums.Bishop), (TeamEnum.White, PieceEnums.Rook),
+              (TeamEnum.White, PieceEnums.Queen), (TeamEnum.White, PieceEnums.King),
+              (TeamEnum.Black, PieceEnums.Pawn), (TeamEnum.Black, PieceEnums.Knight),
+              (TeamEnum.Black, PieceEnums.Bishop), (TeamEnum.Black, PieceEnums.Rook),
+              (TeamEnum.Black, PieceEnums.Queen), (TeamEnum.Black, PieceEnums.King))
+
+    PieceCodes = {piece: plane + 1 for plane, piece in enumerate(Planes)}
+
+    PlaneCount = len(Planes)
+
+    # (shift, mask of the squares that stay on the board) per direction, built on first use as they need NumPy
+    __directionShifts = {}
+
+    def __init__(self, positions):
+        codes = BatchAnalysis.ToCodes(positions)
+        pieceBoards = BatchAnalysis.__GetPieceBoards(codes)
+
+        self.Codes = codes
+        self.PieceCounts = BatchAnalysis.__PopCount(pieceBoards)
+        self.AttackMasks = {}
+        self.IsInCheck = {}
+        self.Mobility = {}
+
+        attacks = {}
+        for team in (TeamEnum.White, TeamEnum.Black):
+            attacks[team], self.Mobility[team] = BatchAnalysis.__Analyse(pieceBoards, team)
+            self.AttackMasks[team] = BatchAnalysis.__ToSquareMasks(attacks[team])
+
+        # A team is in check when the other team attacks its King
+        for team in (TeamEnum.White, TeamEnum.Black):
+            self.IsInCheck[team] = BatchAnalysis.__IsKingAttacked(pieceBoards, team,
+                                                                  attacks[BatchAnalysis.__GetOpposingTeam(team)])
+
+    @staticmethod
+    def IsAvailable():
+        return numpy is not None
+
+    # region Encoding
+
+    @staticmethod
+    def EncodeBoards(boards):
+        codes = numpy.zeros((len(boards), Utilities.AttackTables.SQUARE_COUNT), dtype=numpy.int8)
+        for index, board in enumerate(boards):
+            for square in range(Utilities.AttackTables.SQUARE_COUNT):
+                piece = board.GetPieceAtSquare(square)
+                if piece.GetTeam() != TeamEnum.NoTeam:
+                    codes[index, square] = BatchAnalysis.PieceCodes[(piece.GetTeam(), piece.GetPieceEnum())]
+        return codes
+
+    @staticmethod
+    def CodesToPlanes(codes):
+        planes = codes[:, numpy.newaxis, :] == numpy.arange(1, BatchAnalysis.PlaneCount + 1)[:, numpy.newaxis]
+        return planes.reshape(len(codes), BatchAnalysis.PlaneCount, Miscellaneous.Constants.MAXIMUM_Y_SQUARES,
+                              Miscellaneous.Constants.MAXIMUM_X_SQUARES)
+
+    @staticmethod
+    def PlanesToCodes(planes):
+        flatPlanes = planes.reshape(len(planes), BatchAnalysis.PlaneCount, Utilities.AttackTables.SQUARE_COUNT) != 0
+
+        # A square with no piece on any plane is empty (code 0)
+        codes = numpy.argmax(flatPlanes, axis=1) + 1
+        codes[~flatPlanes.any(axis=1)] = 0
+        return codes.astype(numpy.int8)
+
+    # Accepts either encoding, raises ValueError for anything else. Codes are checked before narrowing to int8 so an
+    # out of range code can't wrap round to a valid one
+    @staticmethod
+    def ToCodes(positions):
+        positions = numpy.asarray(positions)
+        if positions.ndim == 2 and positions.shape[1] == Utilities.AttackTables.SQUARE_COUNT:
+            if positions.size and (positions.min() < 0 or positions.max() > BatchAnalysis.PlaneCount):
+                raise ValueError("Piece codes must be 0 to " + str(BatchAnalysis.PlaneCount) + ", got " +
+                                 str(positions.min()) + " to " + str(positions.max()))
+            return positions.astype(numpy.int8)
+
+        if positions.ndim == 4 and positions.shape[1:] == (BatchAnalysis.PlaneCount,
+                                                           Miscellaneous.Constants.MAXIMUM_Y_SQUARES,
+                                                           Miscellaneous.Constants.MAXIMUM_X_SQUARES):
+            return BatchAnalysis.PlanesToCodes(positions)
+
+        raise ValueError("Positions must be N x 64 codes or N x 12 x 8 x 8 planes, got shape " + str(positions.shape))
+
+    # endregion
+
+    # region Analysis
+
+    # Number of pieces per plane, N x 12
+    @staticmethod
+    def GetPieceCounts(positions):
+        return BatchAnalysis.__PopCount(BatchAnalysis.__GetPieceBoards(BatchAnalysis.ToCodes(positions)))
+
+    # Squares attacked by the team, N x 64 booleans. Like BoardHelpers.IsSquareAttacked a square is attacked whether or
+    # not it holds a piece of the attacking team
+    @staticmethod
+    def GetAttackMasks(positions, team: TeamEnum):
+        attacks, _ = BatchAnalysis.__Analyse(BatchAnalysis.__GetPieceBoards(BatchAnalysis.ToCodes(positions)), team)
+        return BatchAnalysis.__ToSquareMasks(attacks)
+
+    # Whether the team's King is attacked, N booleans
+    @staticmethod
+    def GetCheckFlags(positions, team: TeamEnum):
+        pieceBoards = BatchAnalysis.__GetPieceBoards(BatchAnalysis.ToCodes(positions))
+        attacks, _ = BatchAnalysis.__Analyse(pieceBoards, BatchAnalysis.__GetOpposingTeam(team))
+        return BatchAnalysis.__IsKingAttacked(pieceBoards, team, attacks)
+
+    # Pseudo legal move count of the team, N integers
+    @staticmethod
+    def GetMobility(positions, team: TeamEnum):
+        _, mobility = BatchAnalysis.__Analyse(BatchAnalysis.__GetPieceBoards(BatchAnalysis.ToCodes(positions)), team)
+        return mobility
+
+    # endregion
+
+    # Returns the bitboards of the squares the team attacks and the team's pseudo legal move counts
+    @staticmethod
+    def __Analyse(pieceBoards, team: TeamEnum):
+        def PieceBoard(pieceType):
+            return pieceBoards[:, BatchAnalysis.PieceCodes[(team, pieceType)] - 1]
+
+        teamOccupancy = BatchAnalysis.__GetTeamOccupancy(pieceBoards, team)
+        opposingOccupancy = BatchAnalysis.__GetTeamOccupancy(pieceBoards, BatchAnalysis.__GetOpposingTeam(team))
+        occupancy = teamOccupancy | opposingOccupancy
+        notTeamOccupancy = ~teamOccupancy
+
+        attacks = numpy.zeros(len(pieceBoards), dtype=numpy.uint64)
+        mobility = numpy.zeros(len(pieceBoards), dtype=numpy.int64)
+
+        # Non sliding pieces reach one square per direction. Each shifted bitboard holds at most one target per piece,
+        # so counting its squares counts moves
+        for pieceType, directions in ((PieceEnums.Knight, Utilities.AttackTables.KNIGHT_DIRECTIONS),
+                                      (PieceEnums.King, Utilities.AttackTables.KING_DIRECTIONS)):
+            pieces = PieceBoard(pieceType)
+            for direction in directions:
+                targets = BatchAnalysis.__Shift(pieces, direction)
+                attacks |= targets
+                mobility += BatchAnalysis.__PopCount(targets & notTeamOccupancy)
+
+        # Sliding pieces are walked a step at a time along each direction, stopping at the first occupied square
+        queens = PieceBoard(PieceEnums.Queen)
+        for pieces, directions in ((PieceBoard(PieceEnums.Rook) | queens, Utilities.AttackTables.ROOK_DIRECTIONS),
+                                   (PieceBoard(PieceEnums.Bishop) | queens, Utilities.AttackTables.BISHOP_DIRECTIONS)):
+            for direction in directions:
+                frontier = pieces
+                for _ in range(max(Miscellaneous.Constants.MAXIMUM_X_SQUARES,
+                                   Miscellaneous.Constants.MAXIMUM_Y_SQUARES) - 1):
+                    frontier = BatchAnalysis.__Shift(frontier, direction)
+                    if not frontier.any():
+                        break
+                    attacks |= frontier
+                    mobility += BatchAnalysis.__PopCount(frontier & notTeamOccupancy)
+                    frontier = frontier & ~occupancy
+
+        # Pawns attack diagonally but only move there onto the other team, and push forward onto empty squares
+        pawns = PieceBoard(PieceEnums.Pawn)
+        forward = (0, 1) if team == TeamEnum.White else (0, -1)
+        for direction in ((-1, forward[1]), (1, forward[1])):
+            targets = BatchAnalysis.__Shift(pawns, direction)
+            attacks |= targets
+            mobility += BatchAnalysis.__PopCount(targets & opposingOccupancy)
+
+        empty = ~occupancy
+        singlePushes = BatchAnalysis.__Shift(pawns, forward) & empty
+        mobility += BatchAnalysis.__PopCount(singlePushes)
+
+        # Two step pushes from the starting row, i.e. a single push that landed on the row in front of it
+        startingYCoord = Miscellaneous.Constants.WHITE_PAWNS_Y_ARRAY_COORDINATE if team == TeamEnum.White else \
+            Miscellaneous.Constants.BLACK_PAWNS_Y_ARRAY_COORDINATE
+        pushedRow = numpy.uint64(0xFF << ((startingYCoord + forward[1]) * Miscellaneous.Constants.MAXIMUM_X_SQUARES))
+        doublePushes = BatchAnalysis.__Shift(singlePushes & pushedRow, forward) & empty
+        mobility += BatchAnalysis.__PopCount(doublePushes)
+
+        return attacks, mobility
+
+    @staticmethod
+    def __IsKingAttacked(pieceBoards, team: TeamEnum, opposingAttacks):
+        kings = pieceBoards[:, BatchAnalysis.PieceCodes[(team, PieceEnums.King)] - 1]
+        return (kings & opposingAttacks) != 0
+
+    @staticmethod
+    def __GetOpposingTeam(team: TeamEnum):
+        return TeamEnum.Black if team == TeamEnum.White else TeamEnum.White
+
+    @staticmethod
+    def __GetTeamOccupancy(pieceBoards, team: TeamEnum):
+        firstPlane = BatchAnalysis.PieceCodes[(team, PieceEnums.Pawn)] - 1
+        return numpy.bitwise_or.reduce(pieceBoards[:, firstPlane:firstPlane + BatchAnalysis.PlaneCount // 2], axis=1)
+
+    # N x 64 codes to N x 12 bitboards
+    @staticmethod
+    def __GetPieceBoards(codes):
+        planes = codes[:, numpy.newaxis, :] == numpy.arange(1, BatchAnalysis.PlaneCount + 1)[:, numpy.newaxis]
+        packed = numpy.packbits(planes, axis=2, bitorder="little")
+        return numpy.ascontiguousarray(packed).view("<u8").reshape(len(codes), BatchAnalysis.PlaneCount)
+
+    # N bitboards to N x 64 booleans
+    @staticmethod
+    def __ToSquareMasks(bitboards):
+        squareBytes = numpy.ascontiguousarray(bitboards.astype("<u8")).view(numpy.uint8)
+        return numpy.unpackbits(squareBytes.reshape(len(bitboards), -1), axis=1, bitorder="little").astype(bool)
+
+    # Moves every piece on the bitboards one step along the direction, dropping those that would leave the board
+    @staticmethod
+    def __Shift(bitboards, direction):
+        shift, onBoardMask = BatchAnalysis.__GetDirectionShift(direction)
+        if shift > 0:
+            return (bitboards & onBoardMask) << numpy.uint64(shift)
+        return (bitboards & onBoardMask) >> numpy.uint64(-shift)
+
+    @staticmethod
+    def __GetDirectionShift(direction):
+        directionShift = BatchAnalysis.__directionShifts.get(direction)
+        if directionShift is None:
+            # The squares with a neighbour along the direction are those whose ray in that direction isn't empty
+            onBoardMask = 0
+            for square in range(Utilities.AttackTables.SQUARE_COUNT):
+                if Utilities.AttackTables.GetRay(Utilities.AttackTables.SQUARE_POINTS[square],
+                                                 direction[0], direction[1]):
+                    onBoardMask |= 1 << square
+
+            directionShift = (direction[1] * Miscellaneous.Constants.MAXIMUM_X_SQUARES + direction[0],
+                              numpy.uint64(onBoardMask))
+            BatchAnalysis.__directionShifts[direction] = directionShift
+        return directionShift
+
+    # Number of set bits in each bitboard
+    @staticmethod
+    def __PopCount(bitboards):
+        if hasattr(numpy, "bitwise_count"):
+            return numpy.bitwise_count(bitboards).astype(numpy.int64)
+
+        # NumPy before 2.0, count the bits a byte at a time
+        bitboardBytes = numpy.ascontiguousarray(bitboards.astype("<u8")).view(numpy.uint8)
+        return numpy.unpackbits(bitboardBytes.reshape(bitboards.shape + (-1,)), axis=-1).sum(axis=-1)
@@ -1,7 +1,8 @@
 import logging
 import Miscellaneous.Constants
 import Utilities.MoveHelpers    # Don't do a from MoveHelpers import MoveHelpers as a dependency issue arises
-from Miscellaneous.BoardPoints import BoardPoints
+import Utilities.AttackTables
+from Board.Bitboard import Bitboard
 from Miscellaneous.Constants import TeamEnum, PieceEnums
 
 
@@ -19,51 +20,76 @@ class BoardHelpers:
 
     @staticmethod
     def GetPieceByPieceType(board, pieceType, team: TeamEnum):
-        pieces = []
-        for yCoord in range(Miscellaneous.Constants.MAXIMUM_Y_SQUARES):
-            for xCoord in range(Miscellaneous.Constants.MAXIMUM_X_SQUARES):
-                piece = board.GetPieceAtCoordinate(BoardPoints(xCoord,yCoord))
-                if piece.GetTeam() == team and piece.GetPieceEnum() == pieceType:
-                    pieces.append(piece)
-        return pieces
+        return board.GetPieces(team, pieceType)
+
+    # Looks outwards from the square for pieces of the attacking team, i.e. knight/king/pawn offsets and slider rays
+    # up to the first occupied square, rather than generating all of the attacking team's moves. occupancy can be
+    # passed to look through pieces (e.g. the King when checking where it can move to)
+    # Don't log in this method as it is called many times to determine valid moves
+    @staticmethod
+    def IsSquareAttacked(board, square, attackingTeam: TeamEnum, occupancy=None):
+        bitboard = board.GetBitboard()
+
+        if Utilities.AttackTables.KNIGHT_ATTACKS[square] & bitboard.GetPieceBoard(attackingTeam, PieceEnums.Knight):
+            return True
+
+        if Utilities.AttackTables.KING_ATTACKS[square] & bitboard.GetPieceBoard(attackingTeam, PieceEnums.King):
+            return True
+
+        # A pawn of the attacking team attacks this square if a pawn of the other team on this square would attack it
+        defendingTeam = BoardHelpers.GetOpposingTeam(attackingTeam)
+        pawnAttacks = Utilities.AttackTables.PAWN_ATTACKS.get(defendingTeam)
+        if pawnAttacks is not None and pawnAttacks[square] & bitboard.GetPieceBoard(attackingTeam, PieceEnums.Pawn):
+            return True
+
+        if occupancy is None:
+            occupancy = bitboard.GetOccupancy()
+        queens = bitboard.GetPieceBoard(attackingTeam, PieceEnums.Queen)
+        rooksAndQueens = bitboard.GetPieceBoard(attackingTeam, PieceEnums.Rook) | queens
+        bishopsAndQueens = bitboard.GetPieceBoard(attackingTeam, PieceEnums.Bishop) | queens
+
+        if rooksAndQueens and BoardHelpers.IsAttackedAlongRays(Utilities.AttackTables.ROOK_RAYS[square], occupancy,
+                                                               rooksAndQueens):
+            return True
+
+        if bishopsAndQueens and BoardHelpers.IsAttackedAlongRays(Utilities.AttackTables.BISHOP_RAYS[square],
+                                                                 occupancy, bishopsAndQueens):
+            return True
+
+        return False
+
+    # Walks each ray until the first occupied square, returns True if that square holds one of the attackers
+    @staticmethod
+    def IsAttackedAlongRays(rays, occupancy, attackers):
+        for ray in rays:
+            for square in ray:
+                if (occupancy >> square) & 1:
+                    if (attackers >> square) & 1:
+                        return True
+                    break
+        return False
 
     # For the team passed in, check if that King is in check
     # Don't log in this method as it is called many times to determine valid moves
     @staticmethod
     def IsInCheck(board, teamA: Miscellaneous.Constants.TeamEnum):
-        teamAKingArray = BoardHelpers.GetPieceByPieceType(board, PieceEnums.King, teamA)
-        if len(teamAKingArray) == 0:
+        kingSquare = board.GetKingSquare(teamA)
+        if kingSquare is None:
             # Should never happen
             logger.error("Can't find a King for this team! Something horrible has happened")
             return True
 
-        teamAKing = teamAKingArray[0]
-        teamB = BoardHelpers.GetOpposingTeam(teamA)
-        enforceCheckCondition = False
-        teamBMoves = Utilities.MoveHelpers.MoveHelpers.GetPieceCentricMovesForTeam(board, teamB, enforceCheckCondition)
-        for teamBMove in teamBMoves:
-            if teamBMove == teamAKing.GetCoordinates():
-                return True
-
-        return False
+        return BoardHelpers.IsSquareAttacked(board, kingSquare, BoardHelpers.GetOpposingTeam(teamA))
 
     @staticmethod
     def GetTeamPieceCounts(board, currentTeam: Miscellaneous.Constants.TeamEnum):
-        count = 0
-        for yIndex in range(Miscellaneous.Constants.MAXIMUM_Y_SQUARES):
-            for xIndex in range(Miscellaneous.Constants.MAXIMUM_X_SQUARES):
-                piece = board.GetPieceAtCoordinate(BoardPoints(xIndex, yIndex))
-                if piece.GetTeam() == currentTeam:
-                    count = count + 1
-        return count
+        return Bitboard.PopCount(board.GetBitboard().GetTeamOccupancy(currentTeam))
 
     @staticmethod
     def IsInCheckMate(board, team: TeamEnum):
-        # Check if King is in check and that there are NO valid moves
-        enforceCheckCondition = True
-        validMoves = Utilities.MoveHelpers.MoveHelpers.GetPieceCentricMovesForTeam(board, team, enforceCheckCondition)
-        isInCheck = BoardHelpers.IsInCheck(board, team)
-        if len(validMoves) == 0 and isInCheck:
+        # Check if King is in check and that there are NO valid moves, stopping at the first valid move found
+        if BoardHelpers.IsInCheck(board, team) and \
+                not Utilities.MoveHelpers.MoveHelpers.HasLegalMoveForTeam(board, team):
             logger.error("Game is in checkmate")
             return True
 
@@ -93,10 +119,10 @@ class BoardHelpers:
 
         # Remaining cases:  2-2, 2-1, 1-2
 
-        knightsCurrentTeam = BoardHelpers.GetPieceByPieceType(board, PieceEnums.Knight, currentTeam)
-        bishopsCurrentTeam = BoardHelpers.GetPieceByPieceType(board, PieceEnums.Bishop, currentTeam)
-        knightsOtherTeam = BoardHelpers.GetPieceByPieceType(board, PieceEnums.Knight, opposingTeam)
-        bishopsOtherTeam = BoardHelpers.GetPieceByPieceType(board, PieceEnums.Bishop, opposingTeam)
+        knightsCurrentTeam = board.GetPieces(currentTeam, PieceEnums.Knight)
+        bishopsCurrentTeam = board.GetPieces(currentTeam, PieceEnums.Bishop)
+        knightsOtherTeam = board.GetPieces(opposingTeam, PieceEnums.Knight)
+        bishopsOtherTeam = board.GetPieces(opposingTeam, PieceEnums.Bishop)
 
         # 1) King and Bishop vs King is a draw
         # 2) King and Knight vs King is a draw
@@ -124,46 +150,44 @@ class BoardHelpers:
 
         return False
 
-    # If in the previous 75 moves by EACH side, no pawn has moved and no capture has been made
+    # If in the previous 75 moves by EACH side, no pawn has moved and no capture has been made. History keeps a running
+    # count of the moves since the last pawn move or capture so the moves don't need to be scanned
     @staticmethod
     def IsDrawBySeventyFiveMovesEachRule(history):
-        if len(history) >= Miscellaneous.Constants.DRAW_CONDITION_TOTAL_MOVES:
-            # Get last x moves
-            pertinentMoves = history[-Miscellaneous.Constants.DRAW_CONDITION_TOTAL_MOVES:]
-
-            hasPawnMoved = False
-            hasCaptureBeenMade = False
-
-            for move in pertinentMoves:
-                if move.IsCaptureMove():
-                    hasCaptureBeenMade = True
-                    break
+        if history.GetHalfMoveClock() >= Miscellaneous.Constants.DRAW_CONDITION_TOTAL_MOVES:
+            logger.error("No capture or pawn move in last n moves, draw declared, returning True")
+            return True
+        return False
 
-                if move.GetPieceEnumFrom() == PieceEnums.Pawn:
-                    hasPawnMoved = True
-                    break
+    # The same position (same side to move, castling rights and en passant square) has occurred five times, the game is
+    # drawn without either player claiming it
+    @staticmethod
+    def IsDrawByRepetition(history):
+        return history.GetRepetitionCount() >= Miscellaneous.Constants.DRAW_CONDITION_REPETITIONS
 
-            if not hasPawnMoved and not hasCaptureBeenMade:
-                logger.error("No capture or pawn move in last n moves, draw declared, returning True")
-                return True
-        return False
+    # The same position has occurred three times, the player to move may claim a draw
+    @staticmethod
+    def CanClaimDrawByRepetition(history):
+        return history.GetRepetitionCount() >= Miscellaneous.Constants.CLAIMABLE_DRAW_REPETITIONS
 
     @staticmethod
     def IsDraw(board, opposingTeam: TeamEnum):
 
         # Player whose turn it will now be has no legal moves but is not in check
-        enforceCheckCondition = True
-        validMovesOpposingTeam = Utilities.MoveHelpers.MoveHelpers.GetPieceCentricMovesForTeam(board, opposingTeam, enforceCheckCondition)
-        isInCheck = BoardHelpers.IsInCheck(board, opposingTeam)
+        validMovesOpposingTeam, isInCheck = board.GetCachedLegalMoves(opposingTeam)
 
         if len(validMovesOpposingTeam) == 0 and not isInCheck:
             logger.error("Player whose turn it is has no legal move and is not in check, returning True")
             return True
 
-        if BoardHelpers.IsDrawBySeventyFiveMovesEachRule(board.GetHistoricalMoves()):
+        if BoardHelpers.IsDrawBySeventyFiveMovesEachRule(board.GetHistory()):
             logger.error("Draw by 75 moves rule, returning True")
             return True
 
+        if BoardHelpers.IsDrawByRepetition(board.GetHistory()):
+            logger.error("Draw by fivefold repetition, returning True")
+            return True
+
         if BoardHelpers.IsDrawByInsufficientPieces(board, opposingTeam):
             logger.error("Draw by insufficient pieces is declared, returning True")
             return True
@@ -1,5 +1,5 @@
 import logging
-from Miscellaneous.Constants import GameType, PlayerEnum
+from Miscellaneous.Constants import GameType, PlayerEnum, TeamEnum
 
 
 logger = logging.getLogger(__name__)
@@ -18,3 +18,12 @@ class GameHelpers:
         if gameType == GameType.AIvsHuman or gameType == GameType.HumanvsHuman or gameType == GameType.AIvsAI:
             return True
         return False
+
+    # PGN result tag of a game, the team to move has lost on checkmate
+    @staticmethod
+    def GetPgnResult(isCheckmate, isDraw, teamsTurn: TeamEnum):
+        if isCheckmate:
+            return "0-1" if teamsTurn == TeamEnum.White else "1-0"
+        if isDraw:
+            return "1/2-1/2"
+        return "*"
@@ -0,0 +1,42 @@
+from Utilities.GameHelpers import GameHelpers
+from Miscellaneous.MoveMessages import MoveEnum
+
+
+# Outcome of replaying one game's moves through Game.Move. FirstIllegalPly is the index into the move list of the first
+# move that was rejected (None when every move was played) with StatusCode the reason, as returned by Game.Move.
+# The final position is the one reached before the first illegal move.
+class GameValidationResult:
+
+    __slots__ = ("GameIndex", "PlyCount", "FirstIllegalPly", "StatusCode", "IsCheckmate", "IsDraw", "IsInCheck",
+                 "TeamsTurn", "FinalFen")
+
+    def __init__(self, gameIndex, plyCount, firstIllegalPly, statusCode, isCheckmate, isDraw, isInCheck, teamsTurn,
+                 finalFen):
+        self.GameIndex = gameIndex
+        self.PlyCount = plyCount
+        self.FirstIllegalPly = firstIllegalPly
+        self.StatusCode = statusCode
+        self.IsCheckmate = isCheckmate
+        self.IsDraw = isDraw
+        self.IsInCheck = isInCheck
+        self.TeamsTurn = teamsTurn
+        self.FinalFen = finalFen
+
+    def IsLegal(self):
+        return self.FirstIllegalPly is None
+
+    # PGN style result
+    def GetOutcome(self):
+        return GameHelpers.GetPgnResult(self.IsCheckmate, self.IsDraw, self.TeamsTurn)
+
+    def ToString(self):
+        status = "legal" if self.IsLegal() else \
+            "illegal at ply " + str(self.FirstIllegalPly) + " (" + str(self.StatusCode) + ")"
+        return "Game " + str(self.GameIndex) + ": " + status + ", plies: " + str(self.PlyCount) + ", result: " + \
+            self.GetOutcome() + ", FEN: " + self.FinalFen
+
+    @staticmethod
+    def ForGame(game, gameIndex, plyCount, firstIllegalPly=None, statusCode=MoveEnum.Success):
+        return GameValidationResult(gameIndex, plyCount, firstIllegalPly, statusCode, game.GetIsInCheckmate(),
+                                    game.GetIsDraw(), game.GetIsInCheck(), game.GetTeamsTurn(),
+                                    game.GetFenRepresentation())
@@ -0,0 +1,123 @@
+import itertools
+import logging
+import os
+import time
+import Miscellaneous.Constants
+import Utilities.CoordinateConverters
+from multiprocessing import Pool
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Game.Game import Game
+from Miscellaneous.Constants import PieceEnums
+from Miscellaneous.MoveMessages import MoveEnum
+from Utilities.GameValidationResult import GameValidationResult
+
+
+logger = logging.getLogger(__name__)
+
+# region Module globals
+
+# The Game each worker process replays its games on, reset between games rather than rebuilt
+_workerGame = None
+
+# endregion
+
+
+# Runs once in every worker process
+def _InitialiseWorker(logLevel):
+    global _workerGame
+
+    # Game.Move logs every board it plays, which would swamp the output when replaying thousands of games
+    logging.getLogger().setLevel(logLevel)
+    _workerGame = Game(ChessBoard(History()))
+
+
+def _ValidateInWorker(indexedMoves):
+    gameIndex, moves = indexedMoves
+    return GameValidator.ValidateGame(_workerGame, moves, gameIndex)
+
+
+# Checks that recorded games are legal under our rules by replaying them through Game.Move, sharding the games over a
+# pool of worker processes. Games are lists of moves in UCI notation (e.g. ["e2e4", "e7e5"]) or a string of them
+# separated by whitespace, all from the starting position.
+class GameValidator:
+
+    DefaultChunkSize = 16
+
+    # Games are read from the input a batch of ReadAheadChunks chunks per process at a time, with at most two batches
+    # (the one whose results are being yielded and the next) read ahead. Pool.imap on its own reads the whole input
+    # straight away
+    ReadAheadChunks = 4
+
+    # Pawns are always promoted to a Queen, so that is the only promotion a move can ask for
+    PromotionPiece = "q"
+    PromotionRanks = (Miscellaneous.Constants.NUMERICAL_BOARD_ORDINATES[0],
+                      Miscellaneous.Constants.NUMERICAL_BOARD_ORDINATES[-1])
+
+    # Yields a GameValidationResult per game, in the order the games were given, as soon as each is available.
+    # processes defaults to one per CPU, with a single process the games are replayed in this process
+    @staticmethod
+    def Validate(games, processes=None, chunkSize=DefaultChunkSize, workerLogLevel=logging.CRITICAL):
+        indexedGames = enumerate(games)
+
+        if processes == 1:
+            game = Game(ChessBoard(History()))
+            for gameIndex, moves in indexedGames:
+                yield GameValidator.ValidateGame(game, moves, gameIndex)
+            return
+
+        batchSize = (processes or os.cpu_count() or 1) * chunkSize * GameValidator.ReadAheadChunks
+        with Pool(processes, initializer=_InitialiseWorker, initargs=(workerLogLevel,)) as pool:
+            # The next batch is handed to the pool before this one's results are yielded so the workers don't run dry
+            # at the end of each batch
+            pendingResults = None
+            while True:
+                batch = list(itertools.islice(indexedGames, batchSize))
+                batchResults = pool.imap(_ValidateInWorker, batch, chunkSize) if batch else None
+                if pendingResults is not None:
+                    yield from pendingResults
+                if batchResults is None:
+                    return
+                pendingResults = batchResults
+
+    # Returns (results, seconds taken)
+    @staticmethod
+    def Run(games, processes=None, chunkSize=DefaultChunkSize):
+        startTime = time.perf_counter()
+        results = list(GameValidator.Validate(games, processes, chunkSize))
+        return results, time.perf_counter() - startTime
+
+    @staticmethod
+    def ValidateGame(game, moves, gameIndex=0):
+        if isinstance(moves, str):
+            moves = moves.split()
+
+        game.ResetGame()
+        for ply, move in enumerate(moves):
+            statusCode = GameValidator.PlayUciMove(game, move)
+            if statusCode != MoveEnum.Success:
+                logger.error("Game " + str(gameIndex) + " has an illegal move at ply " + str(ply) + ": " + move)
+                return GameValidationResult.ForGame(game, gameIndex, ply, ply, statusCode)
+
+        return GameValidationResult.ForGame(game, gameIndex, len(moves))
+
+    # Returns the MoveEnum status of playing the move
+    @staticmethod
+    def PlayUciMove(game, move: str):
+        if len(move) != 4 and len(move) != 5:
+            logger.error("Invalid UCI move: " + move)
+            return MoveEnum.CoordOutOfRange
+
+        fromCoords = Utilities.CoordinateConverters.ConvertInputToPointCoordinates(move[:2])
+        if not Utilities.CoordinateConverters.IsPointInRange(fromCoords):
+            return MoveEnum.CoordOutOfRange
+
+        # The promotion piece is given exactly when a pawn reaches the last rank, and can only be a Queen
+        isPromotion = game.GetPieceAtCoordinate(fromCoords).GetPieceEnum() == PieceEnums.Pawn and \
+            move[3] in GameValidator.PromotionRanks
+        promotionPiece = move[4:].lower()
+        if isPromotion != bool(promotionPiece) or (isPromotion and promotionPiece != GameValidator.PromotionPiece):
+            logger.error("Invalid or unsupported promotion: " + move)
+            return MoveEnum.InvalidPieceCentricMove
+
+        return game.Move(move[:2], move[2:4]).GetStatusCode()
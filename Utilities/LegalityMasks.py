@@ -0,0 +1,83 @@
+import Utilities.AttackTables
+from Board.Bitboard import Bitboard
+from Miscellaneous.Constants import TeamEnum, PieceEnums
+
+
+# Which squares a team's pieces may move to without leaving their King in check, computed once per position.
+# CheckMask holds the squares that resolve a check (the checker and, for a slider, the squares between it and the King),
+# every square when not in check and no squares when in double check. PinMasks maps the square of every pinned piece
+# to the ray it is pinned along (up to and including the pinning piece).
+class LegalityMasks:
+
+    AllSquares = (1 << Utilities.AttackTables.SQUARE_COUNT) - 1
+
+    __slots__ = ("KingSquare", "CheckMask", "PinMasks")
+
+    def __init__(self, kingSquare, checkMask, pinMasks):
+        self.KingSquare = kingSquare
+        self.CheckMask = checkMask
+        self.PinMasks = pinMasks
+
+    def GetAllowedSquares(self, square):
+        return self.CheckMask & self.PinMasks.get(square, LegalityMasks.AllSquares)
+
+    # Returns None when the team has no King
+    @staticmethod
+    def ForTeam(board, team: TeamEnum):
+        kingSquare = board.GetKingSquare(team)
+        if kingSquare is None:
+            return None
+
+        bitboard = board.GetBitboard()
+        opposingTeam = TeamEnum.Black if team == TeamEnum.White else TeamEnum.White
+        ownOccupancy = bitboard.GetTeamOccupancy(team)
+        occupancy = bitboard.GetOccupancy()
+
+        # Non sliding checkers
+        checkMask = (Utilities.AttackTables.KNIGHT_ATTACKS[kingSquare] &
+                     bitboard.GetPieceBoard(opposingTeam, PieceEnums.Knight)) | \
+                    (Utilities.AttackTables.PAWN_ATTACKS[team][kingSquare] &
+                     bitboard.GetPieceBoard(opposingTeam, PieceEnums.Pawn))
+        checkerCount = Bitboard.PopCount(checkMask)
+
+        # Sliding checkers and pins, walk outwards from the King along every queen direction
+        queens = bitboard.GetPieceBoard(opposingTeam, PieceEnums.Queen)
+        orthogonalSliders = bitboard.GetPieceBoard(opposingTeam, PieceEnums.Rook) | queens
+        diagonalSliders = bitboard.GetPieceBoard(opposingTeam, PieceEnums.Bishop) | queens
+
+        pinMasks = {}
+        rays = Utilities.AttackTables.QUEEN_RAYS[kingSquare]
+        for direction, ray in zip(Utilities.AttackTables.QUEEN_DIRECTIONS, rays):
+            sliders = diagonalSliders if direction[0] != 0 and direction[1] != 0 else orthogonalSliders
+            if sliders == 0:
+                continue
+
+            rayMask = 0
+            pinnedSquare = None
+            for square in ray:
+                rayMask |= 1 << square
+                if not (occupancy >> square) & 1:
+                    continue
+
+                if (ownOccupancy >> square) & 1:
+                    if pinnedSquare is not None:
+                        # Two of our own pieces, nothing is pinned along this ray
+                        break
+                    pinnedSquare = square
+                    continue
+
+                if (sliders >> square) & 1:
+                    if pinnedSquare is None:
+                        checkMask |= rayMask
+                        checkerCount += 1
+                    else:
+                        pinMasks[pinnedSquare] = rayMask
+                break
+
+        if checkerCount == 0:
+            checkMask = LegalityMasks.AllSquares
+        elif checkerCount > 1:
+            # Double check, only the King can move
+            checkMask = 0
+
+        return LegalityMasks(kingSquare, checkMask, pinMasks)
@@ -1,12 +1,13 @@
 import Pieces.IBasePiece
 import Utilities.CoordinateConverters
+import Utilities.AttackTables
 import Miscellaneous.Constants
 import Utilities.BoardHelpers
+import Utilities.LegalityMasks
 import logging
 from Miscellaneous.BoardPoints import BoardPoints
-from Miscellaneous.Points import Points
 from Miscellaneous.Constants import PieceEnums, TeamEnum
-from Pieces.NoPiece import NoPiece
+from Board.Bitboard import Bitboard
 
 
 logger = logging.getLogger(__name__)
@@ -18,32 +19,120 @@ class MoveHelpers:
     # considerations such as being in check
     @staticmethod
     def GetPieceCentricMovesForTeam(board, teamToGet: TeamEnum, enforceKingUnderAttackCheck):
-        moves = []
-        for yCoord in range(Miscellaneous.Constants.MAXIMUM_Y_SQUARES):
-            # cycle over y coordinates
+        return list(MoveHelpers.IteratePieceCentricMovesForTeam(board, teamToGet, enforceKingUnderAttackCheck))
 
-            for xCoord in range(Miscellaneous.Constants.MAXIMUM_X_SQUARES):
-                piece = board.GetPieceAtCoordinate(BoardPoints(xCoord, yCoord))
-                if piece.GetTeam() != teamToGet:
-                    continue
+    # Generator version of GetPieceCentricMovesForTeam, moves are worked out piece by piece as they are consumed so the
+    # caller can stop at the first one it is interested in
+    @staticmethod
+    def IteratePieceCentricMovesForTeam(board, teamToGet: TeamEnum, enforceKingUnderAttackCheck):
+        legalityMasks = None
+        if enforceKingUnderAttackCheck:
+            # Checks and pins are worked out once for the position rather than once per piece
+            legalityMasks = Utilities.LegalityMasks.LegalityMasks.ForTeam(board, teamToGet)
+            if legalityMasks is None:
+                # No King, every move is treated as leaving the King in check
+                return
+
+        for square in Bitboard.IterateSquares(board.GetBitboard().GetTeamOccupancy(teamToGet)):
+            piece = board.GetPieceAtSquare(square)
+
+            # Get valid moves from the perspective of the piece independent of the board
+            yield from piece.IterateValidMoves(board, enforceKingUnderAttackCheck, legalityMasks)
+
+    # Stops at the first legal move found rather than generating them all
+    @staticmethod
+    def HasLegalMoveForTeam(board, teamToGet: TeamEnum):
+        enforceKingUnderAttackCheck = True
+        for _ in MoveHelpers.IteratePieceCentricMovesForTeam(board, teamToGet, enforceKingUnderAttackCheck):
+            return True
+        return False
+
+    # Legal moves for the team as (fromCoord, toCoord) pairs, i.e. what can be passed to ChessBoard.MakeMove
+    @staticmethod
+    def GetLegalMovePairsForTeam(board, teamToGet: TeamEnum):
+        legalityMasks = Utilities.LegalityMasks.LegalityMasks.ForTeam(board, teamToGet)
+        if legalityMasks is None:
+            return []
+
+        movePairs = []
+        for square in Bitboard.IterateSquares(board.GetBitboard().GetTeamOccupancy(teamToGet)):
+            piece = board.GetPieceAtSquare(square)
+            pieceCoords = piece.GetCoordinates()
 
-                # Get valid moves from the perspective of the piece independent of the board
-                pieceCentricValidMoves = piece.GetValidMoves(board, enforceKingUnderAttackCheck)
-                moves.extend(pieceCentricValidMoves)
-        return moves
+            # A rook's castle destination is also one of its regular moves, only count it once
+            for move in dict.fromkeys(piece.GetValidMoves(board, True, legalityMasks)):
+                movePairs.append((pieceCoords, move))
+        return movePairs
+
+    # Per square ray tables for each piece type, pawn rays also depend on the team
+    @staticmethod
+    def GetRayTable(piece: Pieces.IBasePiece):
+        pieceEnum = piece.GetPieceEnum()
+        if pieceEnum == PieceEnums.Pawn:
+            return Utilities.AttackTables.PAWN_RAYS.get(piece.GetTeam())
+        if pieceEnum == PieceEnums.Knight:
+            return Utilities.AttackTables.KNIGHT_RAYS
+        if pieceEnum == PieceEnums.Bishop:
+            return Utilities.AttackTables.BISHOP_RAYS
+        if pieceEnum == PieceEnums.Rook:
+            return Utilities.AttackTables.ROOK_RAYS
+        if pieceEnum == PieceEnums.Queen:
+            return Utilities.AttackTables.QUEEN_RAYS
+        if pieceEnum == PieceEnums.King:
+            return Utilities.AttackTables.KING_RAYS
+        return None
+
+    # Checks a single move without generating the piece's other moves. Only the ray from the piece towards the
+    # destination is walked, then the destination alone goes through the check and pin test
+    @staticmethod
+    def IsLegalMove(board, fromCoord: BoardPoints, toCoord: BoardPoints):
+        if not Utilities.CoordinateConverters.IsPointInRange(fromCoord) or \
+                not Utilities.CoordinateConverters.IsPointInRange(toCoord):
+            return False
+
+        piece = board.GetPieceAtCoordinate(fromCoord)
+        if piece.GetTeam() == TeamEnum.NoTeam:
+            return False
+
+        if MoveHelpers.IsCastleMove(piece.GetPieceEnum(), fromCoord, toCoord):
+            # Castling has its own rules, the King's castle moves are few so just look for the destination
+            return fromCoord.GetY() == toCoord.GetY() and toCoord in piece.GetCastleMoves(board, True)
+
+        rayTable = MoveHelpers.GetRayTable(piece)
+        if rayTable is None:
+            return False
+
+        toSquare = Utilities.AttackTables.GetSquare(toCoord)
+        rayToDestination = None
+        for ray in rayTable[Utilities.AttackTables.GetSquare(fromCoord)]:
+            if toSquare in ray:
+                rayToDestination = ray[:ray.index(toSquare) + 1]
+                break
+
+        if rayToDestination is None:
+            return False
+
+        # Blockers and the destination itself
+        potentialMoves = []
+        MoveHelpers.AppendPotentialMovesAlongRay(piece, board, rayToDestination, potentialMoves)
+        if toCoord not in potentialMoves:
+            return False
+
+        # King safety
+        legalityMasks = Utilities.LegalityMasks.LegalityMasks.ForTeam(board, piece.GetTeam())
+        for _ in MoveHelpers.IteratePieceMovesByLegalityMasks(board, piece, [toCoord], legalityMasks):
+            return True
+        return False
 
     @staticmethod
     def FilterPieceMovesThatPutPlayerInCheck(board, pieceBeingMoved: Pieces.IBasePiece, potentialMoves):
         # Check each potential move and see if that move puts the King in check!
         validMoves = []
 
+        preMovePieceCoords = pieceBeingMoved.GetCoordinates()
         for potentialMove in potentialMoves:
-            preMovePieceCoords = pieceBeingMoved.GetCoordinates()
-            pieceAtMoveCoordinateBeforeMove = board.GetPieceAtCoordinate(potentialMove)
-
-            pieceBeingMoved.ForceMoveNoHistory(potentialMove)
-            board.UpdatePieceOnBoard(pieceBeingMoved)
-            board.UpdatePieceOnBoard(NoPiece(preMovePieceCoords))
+            if not board.MakeMove(preMovePieceCoords, potentialMove):
+                continue
 
             # Moved, now check if King on own team is in check
             isInCheck = Utilities.BoardHelpers.BoardHelpers.IsInCheck(board, pieceBeingMoved.GetTeam())
@@ -51,68 +140,110 @@ class MoveHelpers:
             if not isInCheck:
                 validMoves.append(potentialMove)
 
-            # Undo the previous moves
-            pieceBeingMoved.ForceMoveNoHistory(preMovePieceCoords)
-            board.UpdatePieceOnBoard(pieceBeingMoved)
-            board.UpdatePieceOnBoard(pieceAtMoveCoordinateBeforeMove)
+            # Undo the move
+            board.UnmakeMove()
 
         return validMoves
 
+    # Yields the moves that don't leave the King in check using the check and pin masks of the position, so no move
+    # has to be made on the board (en passant excepted, as it removes two pieces from the same rank)
     @staticmethod
-    # Direction vector is the direction with which to move.
-    # moveIterations variable corresponds to iterations of the direction vector.
-    def GetValidMoves(piece: Pieces.IBasePiece, board, directionVector: Points, moveIterations: int, enforceKingUnderAttackCheck):
+    def IteratePieceMovesByLegalityMasks(board, pieceBeingMoved: Pieces.IBasePiece, potentialMoves, legalityMasks):
+        if legalityMasks is None:
+            # No King
+            return
+
+        pieceSquare = Utilities.AttackTables.GetSquare(pieceBeingMoved.GetCoordinates())
+
+        if pieceBeingMoved.GetPieceEnum() == PieceEnums.King:
+            # Look through the King so that squares behind it on a checking ray are seen as attacked
+            opposingTeam = Utilities.BoardHelpers.BoardHelpers.GetOpposingTeam(pieceBeingMoved.GetTeam())
+            occupancy = board.GetBitboard().GetOccupancy() & ~(1 << pieceSquare)
+            for potentialMove in potentialMoves:
+                if not Utilities.BoardHelpers.BoardHelpers.IsSquareAttacked(
+                        board, Utilities.AttackTables.GetSquare(potentialMove), opposingTeam, occupancy):
+                    yield potentialMove
+            return
+
+        allowedSquares = legalityMasks.GetAllowedSquares(pieceSquare)
+        isPawn = pieceBeingMoved.GetPieceEnum() == PieceEnums.Pawn
 
-        pieceToMoveTeam = piece.GetTeam()
-        pieceToMovePieceEnum = piece.GetPieceEnum()
-        pieceToMoveCoords = piece.GetCoordinates()
-
-        # Validate parameters
-        if moveIterations <= 0:
-            logger.error("Problems with input variables, move iterations: " + str(moveIterations) +
-                         ", Piece being moved coords: " + pieceToMoveCoords.ToString() +
-                         ", Direction vector: " + directionVector.ToString())
-            return []
+        for potentialMove in potentialMoves:
+            potentialSquare = Utilities.AttackTables.GetSquare(potentialMove)
+            if isPawn and potentialMove.GetX() != pieceBeingMoved.GetCoordinates().GetX() and \
+                    board.GetPieceAtSquare(potentialSquare).GetTeam() == TeamEnum.NoTeam:
+                # En passant
+                yield from MoveHelpers.FilterPieceMovesThatPutPlayerInCheck(board, pieceBeingMoved, [potentialMove])
+            elif (allowedSquares >> potentialSquare) & 1:
+                yield potentialMove
+
+    # Yields the moves along every precomputed ray for the square the piece is on, a ray at a time. rayTable is one of
+    # the per square tables in AttackTables. legalityMasks can be passed when they have already been computed for the
+    # position
+    @staticmethod
+    def IterateValidMovesFromRayTable(piece: Pieces.IBasePiece, board, rayTable, enforceKingUnderAttackCheck,
+                                      legalityMasks=None):
+
+        if not MoveHelpers.IsMovablePiece(piece):
+            return
+
+        for ray in rayTable[Utilities.AttackTables.GetSquare(piece.GetCoordinates())]:
+            potentialMoves = []
+            MoveHelpers.AppendPotentialMovesAlongRay(piece, board, ray, potentialMoves)
+            if len(potentialMoves) == 0:
+                continue
+
+            if not enforceKingUnderAttackCheck:
+                yield from potentialMoves
+                continue
+
+            if legalityMasks is None:
+                legalityMasks = Utilities.LegalityMasks.LegalityMasks.ForTeam(board, piece.GetTeam())
+            yield from MoveHelpers.IteratePieceMovesByLegalityMasks(board, piece, potentialMoves, legalityMasks)
 
-        if pieceToMovePieceEnum == PieceEnums.NoPiece or pieceToMoveTeam == TeamEnum.NoTeam:
+    @staticmethod
+    def IsMovablePiece(piece: Pieces.IBasePiece):
+        if piece.GetPieceEnum() == PieceEnums.NoPiece or piece.GetTeam() == TeamEnum.NoTeam:
             logger.error("Trying to move empty piece or piece with no team, returning empty list")
-            return []
+            return False
 
-        xPotentialCoord = pieceToMoveCoords.GetX()
-        yPotentialCoord = pieceToMoveCoords.GetY()
+        if not Utilities.CoordinateConverters.IsPointInRange(piece.GetCoordinates()):
+            logger.error("Piece is not on the board, coords: " + piece.GetCoordinates().ToString())
+            return False
 
-        potentialMoves = []
-        for step in range(moveIterations):
-            xPotentialCoord += directionVector.GetX()
-            yPotentialCoord += directionVector.GetY()
-            potentialPoint = BoardPoints(xPotentialCoord, yPotentialCoord)
+        return True
 
-            if not Utilities.CoordinateConverters.IsPointInRange(potentialPoint):
-                # Not in range
-                break
+    # Walks the squares of the ray in order, appending those the piece can move to until it is blocked
+    @staticmethod
+    def AppendPotentialMovesAlongRay(piece: Pieces.IBasePiece, board, ray, potentialMoves):
+
+        pieceToMoveTeam = piece.GetTeam()
+        isPawn = piece.GetPieceEnum() == PieceEnums.Pawn
+        enPassantSquare = board.GetEnPassantCaptureSquare(pieceToMoveTeam) if isPawn else None
 
-            pieceAtCalculatedPosition = board.GetPieceAtCoordinate(BoardPoints(xPotentialCoord, yPotentialCoord))
-            if pieceAtCalculatedPosition.GetTeam() == pieceToMoveTeam:
+        for square in ray:
+            pieceAtCalculatedPosition = board.GetPieceAtSquare(square)
+            teamAtCalculatedPosition = pieceAtCalculatedPosition.GetTeam()
+            if teamAtCalculatedPosition == pieceToMoveTeam:
                 # Can't move to this position as it's occupied by the same team
                 break
 
+            potentialPoint = Utilities.AttackTables.SQUARE_POINTS[square]
+
             # Differentiate pawns as they have the following properties
             # 1) Can only kill diagonally of the opposite team (NOT vertically)
             # 2) They can only move forward in empty spaces of 1 (and 2 at the beginning)
-            if pieceToMovePieceEnum == PieceEnums.Pawn:
-                hasTeamAtCalculatedPosition = (pieceAtCalculatedPosition.GetTeam() != TeamEnum.NoTeam)
+            if isPawn:
+                hasTeamAtCalculatedPosition = (teamAtCalculatedPosition != TeamEnum.NoTeam)
 
-                if abs(directionVector.GetX()) == abs(directionVector.GetY()):
+                if potentialPoint.GetX() != piece.GetCoordinates().GetX():
                     # Diagonal move, check that the opposite team is at this position (due to earlier if statement
                     # this is equivalent to checking the above boolean
                     if hasTeamAtCalculatedPosition:
                         potentialMoves.append(potentialPoint)
                     else:
                         # no team at calculated position, check for en-passant
-                        if MoveHelpers.IsEnPassantMove(piece.GetPieceEnum(),
-                                                       piece.GetCoordinates(),
-                                                       potentialPoint,
-                                                       board.GetLastHistoricalMove()):
+                        if square == enPassantSquare:
                             potentialMoves.append(potentialPoint)
                 else:
                     # Straight move
@@ -121,17 +252,9 @@ class MoveHelpers:
                     potentialMoves.append(potentialPoint)
             else:
                 potentialMoves.append(potentialPoint)
-                if pieceAtCalculatedPosition.GetTeam() != TeamEnum.NoTeam:
+                if teamAtCalculatedPosition != TeamEnum.NoTeam:
                     break
 
-        if len(potentialMoves) == 0:
-            return []
-
-        if not enforceKingUnderAttackCheck:
-            return potentialMoves
-
-        return MoveHelpers.FilterPieceMovesThatPutPlayerInCheck(board, piece, potentialMoves)
-
     @staticmethod
     def IsEnPassantMove(pieceMovingEnum, oldPieceCoords, newPotentialCoords, lastMove):
         if lastMove is not None and \
@@ -158,20 +281,15 @@ class MoveHelpers:
     @staticmethod
     def PrintValidMoves(board, teamToPrint: TeamEnum):
 
-        for yCoord in range(Miscellaneous.Constants.MAXIMUM_Y_SQUARES):
-            # cycle over y coordinates
-
-            for xCoord in range(Miscellaneous.Constants.MAXIMUM_X_SQUARES):
-                piece = board.GetPieceAtCoordinate(BoardPoints(xCoord,yCoord))
-                if piece.GetTeam() != teamToPrint:
-                    continue
+        for square in Bitboard.IterateSquares(board.GetBitboard().GetTeamOccupancy(teamToPrint)):
+            piece = board.GetPieceAtSquare(square)
 
-                enforceKingUnderAttackCheck = True
-                validPieceMoves = piece.GetValidMoves(board, enforceKingUnderAttackCheck)
-                if len(validPieceMoves) == 0:
-                    continue
+            enforceKingUnderAttackCheck = True
+            validPieceMoves = piece.GetValidMoves(board, enforceKingUnderAttackCheck)
+            if len(validPieceMoves) == 0:
+                continue
 
-                logger.info("Printing valid moves (" + str(len(validPieceMoves)) + ") " + "for: " + piece.GetPieceStr()
-                            + ", at: " + piece.GetCoordinates().ToString())
-                for validMove in validPieceMoves:
-                    logger.info(validMove.ToString())
+            logger.info("Printing valid moves (" + str(len(validPieceMoves)) + ") " + "for: " + piece.GetPieceStr()
+                        + ", at: " + piece.GetCoordinates().ToString())
+            for validMove in validPieceMoves:
+                logger.info(validMove.ToString())
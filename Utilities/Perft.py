@@ -0,0 +1,61 @@
+import logging
+import time
+from Utilities.MoveHelpers import MoveHelpers
+
+
+logger = logging.getLogger(__name__)
+
+
+# Counts the leaf nodes of the legal move tree to a given depth, the standard way of verifying a move generator and
+# measuring its throughput. Moves are made and taken back with ChessBoard.MakeMove/UnmakeMove.
+class Perft:
+
+    # Name, FEN and expected node counts for depths 1, 2, 3... Depths are limited to those without promotions as pawns
+    # are always promoted to a Queen here (counts elsewhere include the under promotions)
+    StandardPositions = (
+        ("start", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", (20, 400, 8902, 197281)),
+        ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", (48, 2039, 97862)),
+        ("endgame", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", (14, 191, 2812, 43238)),
+        ("enpassant", "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 2", (31, 707, 21637, 524138)),
+        ("castling", "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", (26, 568, 13744)),
+    )
+
+    @staticmethod
+    def GetStandardPosition(name):
+        for position in Perft.StandardPositions:
+            if position[0] == name:
+                return position
+        return None
+
+    @staticmethod
+    def CountNodes(board, depth):
+        if depth <= 0:
+            return 1
+
+        movePairs = MoveHelpers.GetLegalMovePairsForTeam(board, board.GetTeamsTurn())
+        if depth == 1:
+            return len(movePairs)
+
+        nodes = 0
+        for fromCoord, toCoord in movePairs:
+            board.MakeMove(fromCoord, toCoord)
+            nodes += Perft.CountNodes(board, depth - 1)
+            board.UnmakeMove()
+        return nodes
+
+    # Node counts per root move, returns a list of (fromCoord, toCoord, nodes)
+    @staticmethod
+    def Divide(board, depth):
+        divide = []
+        for fromCoord, toCoord in MoveHelpers.GetLegalMovePairsForTeam(board, board.GetTeamsTurn()):
+            board.MakeMove(fromCoord, toCoord)
+            divide.append((fromCoord, toCoord, Perft.CountNodes(board, depth - 1)))
+            board.UnmakeMove()
+        return divide
+
+    # Returns (nodes, seconds taken)
+    @staticmethod
+    def Run(board, depth):
+        startTime = time.perf_counter()
+        nodes = Perft.CountNodes(board, depth)
+        return nodes, time.perf_counter() - startTime
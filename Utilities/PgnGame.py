@@ -0,0 +1,21 @@
+# One game read from a PGN archive. Headers are the tag pairs in the order they were read, SanMoves the moves as written
+# and UciMoves the same moves (up to the first illegal one) as resolved by our move rules, e.g. "e2e4", ready for
+# GameValidator. History holds the moves as played, packed. Result is the game termination marker from the movetext,
+# Outcome the result our rules give for the final position (see GameHelpers.GetPgnResult) so the two can be compared.
+class PgnGame:
+
+    __slots__ = ("Headers", "SanMoves", "UciMoves", "Result", "IllegalPly", "History", "Outcome", "FinalFen")
+
+    def __init__(self, headers, sanMoves, uciMoves, result, illegalPly, history, outcome, finalFen):
+        self.Headers = headers
+        self.SanMoves = sanMoves
+        self.UciMoves = uciMoves
+        self.Result = result
+        self.IllegalPly = illegalPly
+        self.History = history
+        self.Outcome = outcome
+        self.FinalFen = finalFen
+
+    # Every move was found and legal
+    def IsLegal(self):
+        return self.IllegalPly is None
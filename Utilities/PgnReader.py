@@ -0,0 +1,132 @@
+import logging
+import re
+import Miscellaneous.Constants
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Miscellaneous.Constants import PieceEnums
+from Utilities.GameHelpers import GameHelpers
+from Utilities.PgnGame import PgnGame
+from Utilities.PositionStatus import PositionStatus
+from Utilities.SanHelpers import SanHelpers
+
+
+logger = logging.getLogger(__name__)
+
+
+# Streaming PGN parser, games are read a line at a time and handed out one at a time so an archive of any size is read
+# in the memory of a single game. Every move is resolved and played on one ChessBoard (reset between games), so the
+# games come out checked against the same rules the board plays by. Comments, variations, NAGs and move numbers are
+# skipped.
+class PgnReader:
+
+    ResultTokens = ("1-0", "0-1", "1/2-1/2", "*")
+
+    # [Name "Value"], values escape quotes and backslashes with a backslash. The value runs to the last quote as some
+    # writers leave quotes in values unescaped
+    TagPattern = re.compile(r'^\[\s*(\w+)\s+"(.*)"\s*\]')
+    TagEscapePattern = re.compile(r'\\(.)')
+
+    # Movetext tokens: a comment (possibly carrying on over the following lines), a rest of line comment, the start or
+    # end of a variation, a NAG and anything else (moves, move numbers and results)
+    MovetextTokenPattern = re.compile(r'\{[^}]*\}?|;.*|[()]|\$\d+|[^\s{}();$]+')
+    MoveNumberPattern = re.compile(r'^\d+\.*')
+
+    # Yields a PgnGame per game in the stream, which can be any iterable of lines (e.g. an open text file)
+    @staticmethod
+    def ReadGames(stream, board=None):
+        if board is None:
+            board = ChessBoard(History())
+
+        headers = {}
+        sanMoves = []
+        hasMovetext = False
+        isInComment = False
+        variationDepth = 0
+
+        for line in stream:
+            if isInComment:
+                commentEnd = line.find("}")
+                if commentEnd == -1:
+                    continue
+                line = line[commentEnd + 1:]
+                isInComment = False
+            elif line.startswith("%"):
+                # Escaped line
+                continue
+
+            if variationDepth == 0 and line.startswith("["):
+                if hasMovetext:
+                    # The last game had no result marker
+                    yield PgnReader.__BuildGame(board, headers, sanMoves, "*")
+                    headers, sanMoves, hasMovetext = {}, [], False
+
+                tag = PgnReader.TagPattern.match(line)
+                if tag is None:
+                    logger.error("Invalid tag pair: " + line.strip())
+                else:
+                    headers[tag.group(1)] = PgnReader.TagEscapePattern.sub(r'\1', tag.group(2))
+                continue
+
+            for token in PgnReader.MovetextTokenPattern.findall(line):
+                firstCharacter = token[0]
+                if firstCharacter == "{":
+                    isInComment = not token.endswith("}")
+                elif firstCharacter == "(":
+                    variationDepth += 1
+                elif firstCharacter == ")":
+                    variationDepth = max(variationDepth - 1, 0)
+                elif firstCharacter == ";" or firstCharacter == "$" or variationDepth > 0:
+                    continue
+                elif token in PgnReader.ResultTokens:
+                    yield PgnReader.__BuildGame(board, headers, sanMoves, token)
+                    headers, sanMoves, hasMovetext = {}, [], False
+                else:
+                    # Move numbers can be written on their own ("1.") or run into the move ("1.e4")
+                    san = PgnReader.MoveNumberPattern.sub("", token)
+                    if san:
+                        sanMoves.append(san)
+                        hasMovetext = True
+
+        if hasMovetext or headers:
+            yield PgnReader.__BuildGame(board, headers, sanMoves, "*")
+
+    # Plays the moves from the starting position (or the FEN tag) up to the first one that can't be resolved
+    @staticmethod
+    def __BuildGame(board, headers, sanMoves, result):
+        fen = headers.get("FEN")
+        if fen is not None:
+            if not board.LoadFen(fen):
+                logger.error("Invalid FEN tag: " + fen)
+                return PgnGame(headers, sanMoves, [], result, 0, History(), "*", None)
+        else:
+            board.ResetToDefault()
+
+        uciMoves = []
+        illegalPly = None
+        for ply, san in enumerate(sanMoves):
+            move = SanHelpers.ParseSan(board, san)
+            if move is None:
+                logger.error("Illegal or ambiguous move at ply " + str(ply) + ": " + san)
+                illegalPly = ply
+                break
+
+            fromCoord, toCoord = move
+            uciMoves.append(PgnReader.GetUciMove(board, fromCoord, toCoord))
+            board.MakeMove(fromCoord, toCoord)
+
+        positionStatus = PositionStatus.ForTeam(board, board.GetTeamsTurn())
+        outcome = GameHelpers.GetPgnResult(positionStatus.IsCheckmate, positionStatus.IsDraw(), positionStatus.Team)
+
+        # The board is reused for the next game, the game keeps its own (packed) copy of the moves
+        history = History.FromBytes(board.GetHistory().ToBytes())
+        return PgnGame(headers, sanMoves, uciMoves, result, illegalPly, history, outcome,
+                       board.GetFenRepresentation())
+
+    # e.g. "e2e4", with the (always Queen) promotion spelt out as UCI expects
+    @staticmethod
+    def GetUciMove(board, fromCoord, toCoord):
+        uciMove = (fromCoord.GetXBoard() + fromCoord.GetYBoard() + toCoord.GetXBoard() + toCoord.GetYBoard()).lower()
+        if board.GetPieceAtCoordinate(fromCoord).GetPieceEnum() == PieceEnums.Pawn and \
+                (toCoord.GetY() == 0 or toCoord.GetY() == Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1):
+            uciMove += SanHelpers.PromotionLetter.lower()
+        return uciMove
@@ -0,0 +1,107 @@
+import logging
+from Board.ChessBoard import ChessBoard
+from Board.History import History
+from Utilities.GameHelpers import GameHelpers
+from Utilities.SanHelpers import SanHelpers
+from Miscellaneous.Constants import TeamEnum
+
+
+logger = logging.getLogger(__name__)
+
+
+# Writes games as PGN, one game per call so an archive can be built up a game at a time. The moves come from a History,
+# they are replayed on a scratch ChessBoard to work out their SAN (disambiguation, check and mate markers).
+class PgnWriter:
+
+    # Tags every PGN game has, in order, with the value used when none is given. Result is always filled in
+    SevenTagRoster = (("Event", "?"), ("Site", "?"), ("Date", "????.??.??"), ("Round", "?"), ("White", "?"),
+                      ("Black", "?"), ("Result", "*"))
+
+    MaximumLineLength = 80
+
+    # The result is worked out from the game's checkmate/draw state
+    @staticmethod
+    def WriteGame(stream, game, headers=None, startingFen=None):
+        result = GameHelpers.GetPgnResult(game.GetIsInCheckmate(), game.GetIsDraw(), game.GetTeamsTurn())
+        PgnWriter.WriteHistory(stream, game.GetBoard().GetHistory(), result, headers, startingFen)
+
+    # startingFen is the position the history was played from, the standard starting position when None
+    @staticmethod
+    def WriteHistory(stream, history, result, headers=None, startingFen=None, board=None):
+        if board is None:
+            board = ChessBoard(History())
+
+        if startingFen is None:
+            board.ResetToDefault()
+        elif not board.LoadFen(startingFen):
+            logger.error("Invalid starting FEN: " + startingFen)
+            return False
+
+        tags = dict(PgnWriter.SevenTagRoster)
+        if headers is not None:
+            tags.update(headers)
+        tags["Result"] = result
+        if startingFen is not None:
+            tags["SetUp"] = "1"
+            tags["FEN"] = startingFen
+
+        for name, value in tags.items():
+            stream.write("[" + name + " \"" + value.replace("\\", "\\\\").replace("\"", "\\\"") + "\"]\n")
+        stream.write("\n")
+
+        movetext = PgnWriter.__GetMovetextTokens(board, history, PgnWriter.__GetFirstMoveNumber(startingFen))
+        movetext.append(result)
+        stream.write(PgnWriter.__WrapTokens(movetext) + "\n\n")
+        return True
+
+    # PGN numbers moves from 1, or from the full move number of the starting FEN
+    @staticmethod
+    def __GetFirstMoveNumber(startingFen):
+        fields = startingFen.split() if startingFen is not None else []
+        if len(fields) < 6 or not fields[5].isdigit():
+            return 1
+        return max(int(fields[5]), 1)
+
+    @staticmethod
+    def __GetMovetextTokens(board, history, moveNumber):
+        tokens = []
+        isCastleRookMove = False
+        for move in history.GetHistoricalMoves():
+            # A castle is held as the King's move followed by the Rook's, the King's move alone is the SAN move
+            if isCastleRookMove:
+                isCastleRookMove = False
+                continue
+            isCastleRookMove = move.IsCastleMove()
+
+            fromCoord = move.GetFromCoord()
+            toCoord = move.GetToCoord()
+            if not board.IsLegalMove(fromCoord, toCoord) or \
+                    board.GetPieceAtCoordinate(fromCoord).GetTeam() != board.GetTeamsTurn():
+                logger.error("History move is not legal, stopping at: " + move.ToString())
+                break
+
+            # Move numbers before White's moves, and before the first move when Black moves first
+            isWhiteMove = board.GetTeamsTurn() == TeamEnum.White
+            if isWhiteMove:
+                tokens.append(str(moveNumber) + ".")
+            elif not tokens:
+                tokens.append(str(moveNumber) + "...")
+
+            tokens.append(SanHelpers.GetSan(board, fromCoord, toCoord))
+            board.MakeMove(fromCoord, toCoord)
+            if not isWhiteMove:
+                moveNumber += 1
+        return tokens
+
+    @staticmethod
+    def __WrapTokens(tokens):
+        lines = []
+        line = ""
+        for token in tokens:
+            if line and len(line) + 1 + len(token) > PgnWriter.MaximumLineLength:
+                lines.append(line)
+                line = token
+            else:
+                line = line + " " + token if line else token
+        lines.append(line)
+        return "\n".join(lines)
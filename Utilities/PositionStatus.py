@@ -0,0 +1,46 @@
+from Utilities.BoardHelpers import BoardHelpers
+from Miscellaneous.Constants import TeamEnum
+
+
+# Everything the game needs to know about a position for the team whose turn it is, worked out in one pass over a
+# single (cached) legal move generation. Checkmate takes precedence over the draw conditions, and IsInCheck is only
+# reported while the game continues, matching what Game has always exposed.
+class PositionStatus:
+
+    __slots__ = ("Team", "LegalMoveCount", "IsKingInCheck", "IsCheckmate", "IsStalemate",
+                 "IsDrawBySeventyFiveMoves", "IsDrawByInsufficientMaterial", "IsDrawByRepetition",
+                 "CanClaimDrawByRepetition")
+
+    def __init__(self, team, legalMoveCount, isKingInCheck, isDrawBySeventyFiveMoves, isDrawByInsufficientMaterial,
+                 isDrawByRepetition, canClaimDrawByRepetition):
+        self.Team = team
+        self.LegalMoveCount = legalMoveCount
+        self.IsKingInCheck = isKingInCheck
+        self.IsCheckmate = legalMoveCount == 0 and isKingInCheck
+        self.IsStalemate = legalMoveCount == 0 and not isKingInCheck
+        self.IsDrawBySeventyFiveMoves = isDrawBySeventyFiveMoves
+        self.IsDrawByInsufficientMaterial = isDrawByInsufficientMaterial
+        self.IsDrawByRepetition = isDrawByRepetition
+        self.CanClaimDrawByRepetition = canClaimDrawByRepetition
+
+    def IsDraw(self):
+        return not self.IsCheckmate and \
+            (self.IsStalemate or self.IsDrawBySeventyFiveMoves or self.IsDrawByInsufficientMaterial or
+             self.IsDrawByRepetition)
+
+    def IsInCheck(self):
+        return self.IsKingInCheck and not self.HasGameEnded()
+
+    def HasGameEnded(self):
+        return self.IsCheckmate or self.IsDraw()
+
+    @staticmethod
+    def ForTeam(board, team: TeamEnum):
+        legalMoves, isKingInCheck = board.GetCachedLegalMoves(team)
+        return PositionStatus(team,
+                              len(legalMoves),
+                              isKingInCheck,
+                              BoardHelpers.IsDrawBySeventyFiveMovesEachRule(board.GetHistory()),
+                              BoardHelpers.IsDrawByInsufficientPieces(board, team),
+                              BoardHelpers.IsDrawByRepetition(board.GetHistory()),
+                              BoardHelpers.CanClaimDrawByRepetition(board.GetHistory()))
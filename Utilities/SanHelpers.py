@@ -0,0 +1,154 @@
+import logging
+import Miscellaneous.Constants
+import Utilities.CoordinateConverters
+from Utilities.BoardHelpers import BoardHelpers
+from Utilities.MoveHelpers import MoveHelpers
+from Miscellaneous.BoardPoints import BoardPoints
+from Miscellaneous.Constants import PieceEnums
+
+
+logger = logging.getLogger(__name__)
+
+
+# Standard algebraic notation (SAN, e.g. "Nbd7", "exd5", "O-O", "e8=Q+") to and from board moves. Moves are resolved
+# against the position on the board for the team whose turn it is, using the targeted ChessBoard.IsLegalMove check on
+# the few pieces that could make the move rather than generating every legal move.
+class SanHelpers:
+
+    PieceLetters = {'N': PieceEnums.Knight, 'B': PieceEnums.Bishop, 'R': PieceEnums.Rook, 'Q': PieceEnums.Queen,
+                    'K': PieceEnums.King}
+
+    SanLetters = {pieceType: letter for letter, pieceType in PieceLetters.items()}
+
+    KingSideCastle = "O-O"
+    QueenSideCastle = "O-O-O"
+
+    # Castles are sometimes written with zeros
+    CastleSans = {KingSideCastle: True, "0-0": True, QueenSideCastle: False, "0-0-0": False}
+
+    # Check/mate markers and move annotations, not needed to find the move
+    TrailingCharacters = "+#!?"
+
+    # Pawns are always promoted to a Queen
+    PromotionLetter = 'Q'
+
+    # Returns (fromCoord, toCoord) for the team to move, None when the SAN doesn't describe exactly one legal move
+    @staticmethod
+    def ParseSan(board, san: str):
+        team = board.GetTeamsTurn()
+        san = san.rstrip(SanHelpers.TrailingCharacters)
+
+        isKingSide = SanHelpers.CastleSans.get(san)
+        if isKingSide is not None:
+            king = board.GetKing(team)
+            if king is None:
+                return None
+            fromCoord = king.GetCoordinates()
+            xMovement = Miscellaneous.Constants.KING_CASTLE_SQUARE_MOVES if isKingSide else \
+                -Miscellaneous.Constants.KING_CASTLE_SQUARE_MOVES
+            toCoord = BoardPoints(fromCoord.GetX() + xMovement, fromCoord.GetY())
+            return (fromCoord, toCoord) if board.IsLegalMove(fromCoord, toCoord) else None
+
+        pieceType = SanHelpers.PieceLetters.get(san[:1])
+        if pieceType is None:
+            pieceType = PieceEnums.Pawn
+
+            # Promotions are written e8=Q (or e8Q)
+            promotion = ""
+            if "=" in san:
+                san, promotion = san.split("=", 1)
+            elif san[-1:].upper() in SanHelpers.PieceLetters:
+                san, promotion = san[:-1], san[-1:]
+            if promotion and promotion.upper() != SanHelpers.PromotionLetter:
+                logger.error("Unsupported promotion: " + promotion)
+                return None
+        else:
+            san = san[1:]
+
+        # What's left is the destination, optionally preceded by the from file and/or rank and a capture
+        san = san.replace("x", "").replace(":", "")
+        if len(san) < Miscellaneous.Constants.STRING_CHARACTERS_IN_COORDINATE:
+            return None
+
+        toCoord = Utilities.CoordinateConverters.ConvertInputToPointCoordinates(san[-2:])
+        if not Utilities.CoordinateConverters.IsPointInRange(toCoord):
+            return None
+
+        # Pawns move forward on their own file unless capturing, where the SAN has to give the from file
+        disambiguation = san[:-2].upper()
+        if pieceType == PieceEnums.Pawn and not disambiguation:
+            disambiguation = toCoord.GetXBoard()
+
+        candidates = [fromCoord for fromCoord in SanHelpers.GetLegalMovesOnto(board, pieceType, toCoord)
+                      if SanHelpers.__MatchesDisambiguation(fromCoord, disambiguation)]
+        if len(candidates) != 1:
+            logger.error("SAN does not match exactly one legal move, candidates: " + str(len(candidates)))
+            return None
+        return candidates[0], toCoord
+
+    # SAN of the move from fromCoord to toCoord by the team to move, the move must be legal
+    @staticmethod
+    def GetSan(board, fromCoord: BoardPoints, toCoord: BoardPoints):
+        piece = board.GetPieceAtCoordinate(fromCoord)
+        pieceType = piece.GetPieceEnum()
+
+        if MoveHelpers.IsCastleMove(pieceType, fromCoord, toCoord):
+            san = SanHelpers.KingSideCastle if toCoord.GetX() > fromCoord.GetX() else SanHelpers.QueenSideCastle
+        else:
+            isCapture = board.GetPieceAtCoordinate(toCoord).GetPieceEnum() != PieceEnums.NoPiece or \
+                (pieceType == PieceEnums.Pawn and fromCoord.GetX() != toCoord.GetX())
+            destination = (toCoord.GetXBoard() + toCoord.GetYBoard()).lower()
+
+            if pieceType == PieceEnums.Pawn:
+                san = (fromCoord.GetXBoard().lower() + "x" if isCapture else "") + destination
+                if toCoord.GetY() == 0 or toCoord.GetY() == Miscellaneous.Constants.MAXIMUM_Y_SQUARES - 1:
+                    san += "=" + SanHelpers.PromotionLetter
+            else:
+                san = SanHelpers.SanLetters[pieceType] + \
+                    SanHelpers.__GetDisambiguation(board, pieceType, fromCoord, toCoord) + \
+                    ("x" if isCapture else "") + destination
+
+        # Check and mate markers, worked out on the position after the move
+        board.MakeMove(fromCoord, toCoord)
+        opposingTeam = board.GetTeamsTurn()
+        if BoardHelpers.IsInCheck(board, opposingTeam):
+            san += "+" if MoveHelpers.HasLegalMoveForTeam(board, opposingTeam) else "#"
+        board.UnmakeMove()
+        return san
+
+    # Squares of the pieces of the type, belonging to the team to move, that can legally move onto toCoord
+    @staticmethod
+    def GetLegalMovesOnto(board, pieceType, toCoord: BoardPoints):
+        fromCoords = []
+        for piece in board.GetPieces(board.GetTeamsTurn(), pieceType):
+            fromCoord = piece.GetCoordinates()
+
+            # Pawns only ever move onto their own or a neighbouring file, no need to check the others
+            if pieceType == PieceEnums.Pawn and abs(fromCoord.GetX() - toCoord.GetX()) > 1:
+                continue
+
+            if board.IsLegalMove(fromCoord, toCoord):
+                fromCoords.append(fromCoord)
+        return fromCoords
+
+    # Only as much of the from square as is needed to tell the move apart from the same piece type's other moves
+    @staticmethod
+    def __GetDisambiguation(board, pieceType, fromCoord: BoardPoints, toCoord: BoardPoints):
+        others = [otherCoord for otherCoord in SanHelpers.GetLegalMovesOnto(board, pieceType, toCoord)
+                  if otherCoord is not fromCoord]
+        if not others:
+            return ""
+        if all(otherCoord.GetX() != fromCoord.GetX() for otherCoord in others):
+            return fromCoord.GetXBoard().lower()
+        if all(otherCoord.GetY() != fromCoord.GetY() for otherCoord in others):
+            return fromCoord.GetYBoard()
+        return (fromCoord.GetXBoard() + fromCoord.GetYBoard()).lower()
+
+    @staticmethod
+    def __MatchesDisambiguation(fromCoord: BoardPoints, disambiguation):
+        for character in disambiguation:
+            if character.isalpha() and character != fromCoord.GetXBoard():
+                return False
+            if character.isdigit() and character != fromCoord.GetYBoard():
+                return False
+        return True